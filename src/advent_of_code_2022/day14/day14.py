@@ -1,6 +1,8 @@
 from typing import List, Tuple, TypedDict
 
-from utils.utils import create_matrix, flatten
+from utils.grid import Grid
+from utils.tracing import TRACE, trace
+from utils.utils import flatten
 
 Position = Tuple[int, int]
 Path = List[Position]
@@ -8,6 +10,12 @@ Path = List[Position]
 SAND_START_POS = (500, 0)
 PRINT_STEP = 50
 
+FILLED_CELL = "#"
+EMPTY_CELL = "."
+
+FILLED = ord(FILLED_CELL)
+EMPTY = ord(EMPTY_CELL)
+
 
 class PositionStats(TypedDict):
     offset_x: int
@@ -20,12 +28,20 @@ class PositionStats(TypedDict):
     max_y: int
 
 
-class Grid:
+class Cave:
     def __init__(self, rows: int, cols: int) -> None:
-        self.grid: List[List[bool]] = create_matrix(rows, cols, False)
+        self.grid = Grid(cols, rows, filler=EMPTY_CELL)
         self.height: int = 1
         self.cut_height: int = 0
 
+        # Left column, bottom row and right border
+        self.abyss = bytearray(len(self.grid.cells))
+        for y in range(rows):
+            self.abyss[self.offset(0, y)] = 1
+            self.abyss[self.offset(cols, y)] = 1
+        for x in range(cols):
+            self.abyss[self.offset(x, rows - 1)] = 1
+
     def add_path(self, path: Path) -> None:
         for i in range(1, len(path)):
             self.add_line(path[i - 1], path[i])
@@ -34,35 +50,35 @@ class Grid:
         if pos1[0] == pos2[0]:
             x = pos1[0]
             for y in range(min(pos1[1], pos2[1]), max(pos1[1], pos2[1]) + 1):
-                self.grid[y][x] = True
+                self.apply(x, y)
         elif pos1[1] == pos2[1]:
             y = pos1[1]
             for x in range(min(pos1[0], pos2[0]), max(pos1[0], pos2[0]) + 1):
-                self.grid[y][x] = True
+                self.apply(x, y)
         else:
             raise AssertionError("Unsupported line")
 
+    def offset(self, x: int, y: int) -> int:
+        return self.grid.offset((y, x))
+
+    def position(self, offset: int) -> Position:
+        y, x = self.grid.position(offset)
+        return (x, y)
+
     def test(self, x: int, y: int) -> bool:
-        return self.grid[y][x]
+        return self.grid.cells[self.offset(x, y)] != EMPTY
 
     def apply(self, x: int, y: int) -> None:
-        self.grid[y][x] = True
+        self.grid.cells[self.offset(x, y)] = FILLED
 
     def is_abyss(self, x: int, y: int) -> bool:
-        return x == 0 or x == len(self.grid[0]) or y == len(self.grid) - 1
+        return self.abyss[self.offset(x, y)] == 1
 
     def is_top(self, x: int, y: int) -> bool:
         return y == 0
 
     def draw(self) -> str:
-        return "\n".join(
-            [
-                "".join(
-                    "#" if self.grid[i][j] else "." for j in range(len(self.grid[0]))
-                )
-                for i in range(len(self.grid))
-            ]
-        )
+        return repr(self.grid)
 
 
 def main() -> None:
@@ -77,13 +93,14 @@ def main() -> None:
 def solve_part1(paths: List[Path]):
     pos_stats = calc_position_stats(paths)
     paths = adjust_paths(paths, pos_stats)
-    grid = Grid(pos_stats["grid_rows"], pos_stats["grid_cols"])
+    grid = Cave(pos_stats["grid_rows"], pos_stats["grid_cols"])
 
     for path in paths:
         grid.add_path(path)
 
-    print(grid.draw())
-    print("----------------------")
+    if TRACE:
+        trace(grid.draw())
+        trace("----------------------")
 
     sand_start_pos = adjust_pos(SAND_START_POS, pos_stats)
     count = 0
@@ -93,8 +110,9 @@ def solve_part1(paths: List[Path]):
         grid.apply(pos[0], pos[1])
         count += 1
         if count % PRINT_STEP == 0:
-            print(grid.draw())
-            print("----------------------")
+            if TRACE:
+                trace(grid.draw())
+                trace("----------------------")
 
         pos = fall_sand(grid, sand_start_pos)
 
@@ -111,47 +129,51 @@ def solve_part2(paths: List[Path], floor_adjustment: int):
 
     pos_stats = calc_position_stats(paths)
     paths = adjust_paths(paths, pos_stats)
-    grid = Grid(pos_stats["grid_rows"], pos_stats["grid_cols"])
+    grid = Cave(pos_stats["grid_rows"], pos_stats["grid_cols"])
 
     for path in paths:
         grid.add_path(path)
 
-    print(grid.draw())
-    print("----------------------")
+    if TRACE:
+        trace(grid.draw())
+        trace("----------------------")
 
     sand_start_pos = adjust_pos(SAND_START_POS, pos_stats)
     count = 0
-    pos = (1, 1) # dummy
+    pos = (1, 1)  # dummy
     while not grid.is_top(pos[0], pos[1]):
         pos = fall_sand(grid, sand_start_pos)
-        
+
         grid.apply(pos[0], pos[1])
         count += 1
         if count % PRINT_STEP == 0:
-            print(grid.draw())
-            print("----------------------")
+            if TRACE:
+                trace(grid.draw())
+                trace("----------------------")
 
     return count
 
 
-def fall_sand(grid: Grid, start_pos: Position) -> Position:
-    pos = start_pos
+def fall_sand(grid: Cave, start_pos: Position) -> Position:
+    cells = grid.grid.cells
+    abyss = grid.abyss
+    down = grid.grid.down
 
-    while True:
-        next_pos = next_sand_pos(grid, pos)
-        if next_pos == pos or grid.is_abyss(next_pos[0], next_pos[1]):
-            return next_pos
-        pos = next_pos
+    pos = grid.offset(start_pos[0], start_pos[1])
 
+    while True:
+        if cells[pos + down] == EMPTY:
+            next_pos = pos + down
+        elif cells[pos + down - 1] == EMPTY:
+            next_pos = pos + down - 1
+        elif cells[pos + down + 1] == EMPTY:
+            next_pos = pos + down + 1
+        else:
+            return grid.position(pos)
 
-def next_sand_pos(grid: Grid, pos: Position) -> Position:
-    if not grid.test(pos[0], pos[1] + 1):
-        return (pos[0], pos[1] + 1)
-    if not grid.test(pos[0] - 1, pos[1] + 1):
-        return (pos[0] - 1, pos[1] + 1)
-    if not grid.test(pos[0] + 1, pos[1] + 1):
-        return (pos[0] + 1, pos[1] + 1)
-    return pos
+        if abyss[next_pos]:
+            return grid.position(next_pos)
+        pos = next_pos
 
 
 def parse_position(s: str) -> Position:
@@ -1,9 +1,14 @@
+from dataclasses import dataclass
 from enum import Enum
-from typing import List, Tuple
+from typing import Hashable, List, Tuple
 import time
 
+from utils.cycles import metric_at
 from utils.utils import create_array, deep_copy_matrix
 
+# Rows below the top that identify a tower state, rocks do not fall deeper in practice
+KEY_ROWS = 30
+
 
 class RockShape(Enum):
     DASH = "####"
@@ -41,6 +46,9 @@ class RockShapes:
     def __init__(self, seed: int = 0) -> None:
         self.i = seed % len(RockShapes.shapes)
 
+    def copy(self) -> "RockShapes":
+        return RockShapes(self.i)
+
     def next(self) -> RockShape:
         res = RockShapes.shapes[self.i]
         self.i = (self.i + 1) % len(RockShapes.shapes)
@@ -73,6 +81,11 @@ class Directions:
         self.directions = directions
         self.i = 0
 
+    def copy(self) -> "Directions":
+        res = Directions(self.directions)
+        res.i = self.i
+        return res
+
     def next(self) -> Direction:
         res = self.directions[self.i]
         self.i = (self.i + 1) % len(self.directions)
@@ -109,6 +122,17 @@ class Grid:
         res[0] = res[-1] = True
         return res
 
+    def copy(self) -> "Grid":
+        res = Grid.__new__(Grid)
+        res.grid = deep_copy_matrix(self.grid)
+        res.height = self.height
+        res.cut_height = self.cut_height
+        return res
+
+    def top_rows(self, count: int) -> Tuple[Tuple[bool, ...], ...]:
+        top = self.height - self.cut_height
+        return tuple(tuple(row) for row in self.grid[max(0, top - count) : top])
+
     def extend(self) -> None:
         new_layers = max(
             self.height + Grid.FREE_LAYERS - (len(self.grid) + self.cut_height), 0
@@ -181,14 +205,23 @@ class Grid:
         return Grid.draw_grid(self.grid)
 
 
+@dataclass
+class Tower:
+    grid: Grid
+    shapes: RockShapes
+    directions: Directions
+
+    def copy(self) -> "Tower":
+        return Tower(self.grid.copy(), self.shapes.copy(), self.directions.copy())
+
+
 def main() -> None:
     input = read_input("src/advent_of_code_2022/day17/input.txt")
 
     directions = parse(input[0])
 
     print(f"1 -> {solve_part1(directions, 1875)}")
-    # print(f"1 -> {solve_part1(directions, 1000000000000)}")
-    # print(f"2 -> {solve_part2()}")
+    print(f"2 -> {solve_part2(directions, 1000000000000)}")
 
 
 def parse(input: str) -> Directions:
@@ -213,6 +246,28 @@ def solve_part1(directions: Directions, rocks: int) -> int:
     return grid.get_height() - 1
 
 
+def solve_part2(directions: Directions, rocks: int) -> int:
+    # The tower repeats once the shape, the jet and the top rows repeat,
+    # and every repetition adds the same height.
+    # Runtime: O(offset + period) rocks
+    tower = Tower(Grid(), RockShapes(), directions.copy())
+    return metric_at(tower, drop_rock, tower_height, rocks, tower_key)
+
+
+def drop_rock(tower: Tower) -> Tower:
+    tower = tower.copy()
+    run_fall(tower.grid, tower.shapes.next(), tower.directions)
+    return tower
+
+
+def tower_height(tower: Tower) -> int:
+    return tower.grid.get_height() - 1
+
+
+def tower_key(tower: Tower) -> Hashable:
+    return (tower.shapes.i, tower.directions.i, tower.grid.top_rows(KEY_ROWS))
+
+
 def run_fall(grid: Grid, shape: RockShape, directions: Directions) -> None:
     pos = (grid.get_height() + 3, 3)
 
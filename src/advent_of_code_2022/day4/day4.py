@@ -1,12 +1,13 @@
 from typing import List, Tuple
 
+from utils.intervals import Interval, contains, overlaps
+
+# Inclusive bounds as in the input, `to_interval` makes them half-open
 Range = Tuple[int, int]
 
 
 def main() -> None:
-    pairs = read_input(
-        "src/advent_of_code_2022/day4/input.txt"
-    )
+    pairs = read_input("src/advent_of_code_2022/day4/input.txt")
 
     print(f"1 -> {solve_part1(pairs)}")
     print(f"2 -> {solve_part2(pairs)}")
@@ -25,7 +26,7 @@ def solve_part1(pairs: List[Tuple[Range, Range]]) -> int:
 
 
 def does_fully_contain(outer: Range, inner: Range) -> bool:
-    return outer[0] <= inner[0] and outer[1] >= inner[1]
+    return contains(to_interval(outer), to_interval(inner))
 
 
 def solve_part2(pairs: List[Tuple[Range, Range]]) -> int:
@@ -33,7 +34,11 @@ def solve_part2(pairs: List[Tuple[Range, Range]]) -> int:
 
 
 def is_overlap(a: Range, b: Range) -> bool:
-    return (a[0] <= b[0] and b[0] <= a[1]) or (b[0] <= a[0] and a[0] <= b[1])
+    return overlaps(to_interval(a), to_interval(b))
+
+
+def to_interval(range: Range) -> Interval:
+    return (range[0], range[1] + 1)
 
 
 def read_input(file_name: str) -> List[Tuple[Range, Range]]:
@@ -3,6 +3,8 @@ from typing import Dict, List, Tuple, TypedDict, Optional, Set
 from collections import deque
 from enum import Enum
 
+from utils.grid import Grid
+
 
 class Move(Enum):
     UP = "UP"
@@ -43,7 +45,7 @@ class PathItem(TypedDict):
     move: Move
 
 
-AreaBoard = List[List[AreaPipe]]
+AreaBoard = Grid
 
 NEXT_MOVE_MAPPING: Dict[Tuple[Pipe, Move], Move] = {
     (Pipe.DOWN_UP, Move.UP): Move.UP,
@@ -204,39 +206,23 @@ def solve_part2(board: List[str]) -> int:
     fill_all_outer_area(board, area_board)
     print_area_board(area_board)
 
-    return sum(
-        1
-        for i in range(len(area_board))
-        for j in range(len(area_board[i]))
-        if area_board[i][j] == AreaPipe.UNKNOWN
-    )
+    return area_board.count(AreaPipe.UNKNOWN.value)
 
 
 def fill_all_outer_area(board: List[str], area_board: AreaBoard):
-    outer_pos_queue = deque(
-        (i, j)
-        for i in range(len(area_board))
-        for j in range(len(area_board[i]))
-        if area_board[i][j] == AreaPipe.OUTER
-    )
+    cells = area_board.cells
+    outer = ord(AreaPipe.OUTER.value)
+    unknown = ord(AreaPipe.UNKNOWN.value)
+
+    outer_pos_queue = deque(area_board.find_all(AreaPipe.OUTER.value))
 
     while len(outer_pos_queue) > 0:
         pos = outer_pos_queue.pop()
 
-        next_positions = [
-            get_next_position(pos, Move.UP),
-            get_next_position(pos, Move.DOWN),
-            get_next_position(pos, Move.LEFT),
-            get_next_position(pos, Move.RIGHT),
-        ]
-
-        for next_pos in next_positions:
-            if (
-                is_valid_position(next_pos, board)
-                and area_board[next_pos[0]][next_pos[1]] == AreaPipe.UNKNOWN
-            ):
-                area_board[next_pos[0]][next_pos[1]] = AreaPipe.OUTER
-                outer_pos_queue.append(next_pos)
+        for step in area_board.directions:
+            if cells[pos + step] == unknown:
+                cells[pos + step] = outer
+                outer_pos_queue.append(pos + step)
 
 
 def fill_outer_border(
@@ -246,25 +232,20 @@ def fill_outer_border(
         pos, pipe, move = path_item["pos"], path_item["pipe"], path_item["move"]
         outer_moves = OUTER_MOVE_MAPPING[(pipe, loop_path[idx - 1]["move"])]
         for outer_move in outer_moves:
-            outer_pos = get_next_position(pos, outer_move)
-            if (
-                is_valid_position(outer_pos, board)
-                and area_board[outer_pos[0]][outer_pos[1]] == AreaPipe.UNKNOWN
-            ):
-                area_board[outer_pos[0]][outer_pos[1]] = AreaPipe.OUTER
+            outer_pos = area_board.offset(get_next_position(pos, outer_move))
+            if area_board.cells[outer_pos] == ord(AreaPipe.UNKNOWN.value):
+                area_board.cells[outer_pos] = ord(AreaPipe.OUTER.value)
 
 
 def build_area_board(board: List[str], loop_path: List[PathItem]) -> AreaBoard:
-    area_board = [[AreaPipe.UNKNOWN for pipe in row] for row in board]
+    area_board = Grid(len(board[0]), len(board), filler=AreaPipe.UNKNOWN.value)
     for path_item in loop_path:
-        i, j = path_item["pos"]
-        area_board[i][j] = AreaPipe.LOOP
+        area_board.set(path_item["pos"], AreaPipe.LOOP.value)
     return area_board
 
 
 def print_area_board(area_board: AreaBoard):
-    s = "\n".join("".join(pipe.value for pipe in row) for row in area_board)
-    print(s)
+    print(area_board)
 
 
 def read_input(file_name: str) -> List[str]:
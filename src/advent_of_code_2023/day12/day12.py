@@ -1,5 +1,6 @@
 from collections import deque
 from enum import Enum
+from functools import cache
 from typing import List, TypedDict
 
 
@@ -25,7 +26,7 @@ def main() -> None:
 def solve_part1(inputs: List[SpringInput]) -> int:
     arrangements = []
     for idx, input in enumerate(inputs):
-        res = calc_arrangements(input["field"], input["damaged_counts"])
+        res = count_arrangements(input["field"], input["damaged_counts"])
         print(f"{idx}: {res}")
         arrangements.append(res)
     # arrangements = [
@@ -46,6 +47,29 @@ def solve_part2(inputs: List[SpringInput]) -> int:
     return solve_part1(extended_input)
 
 
+def count_arrangements(field: List[SpringType], damaged_counts: List[int]) -> int:
+    # Runtime: O(F^2 * D), F - field length, D - number of damaged groups
+    @cache
+    def count(idx: int, group: int) -> int:
+        # Arrangements of groups from `group` on within field[idx:]
+        if group == len(damaged_counts):
+            return 0 if SpringType.DAMAGED in field[idx:] else 1
+
+        size = damaged_counts[group]
+        res = 0
+        for start in range(idx, len(field) - size + 1):
+            end = start + size
+            if SpringType.OPERATIONAL not in field[start:end] and (
+                end == len(field) or field[end] != SpringType.DAMAGED
+            ):
+                res += count(end + 1, group + 1)
+            if field[start] == SpringType.DAMAGED:
+                break
+        return res
+
+    return count(0, 0)
+
+
 def calc_arrangements(field: List[SpringType], damaged_counts: List[int], idx=0) -> int:
     if idx >= len(field):
         is_valid = validate_field(field, damaged_counts)
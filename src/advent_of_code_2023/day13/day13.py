@@ -1,5 +1,7 @@
 from enum import Enum
-from typing import List, Optional, TypedDict
+from typing import Dict, Iterable, List, Optional, Tuple, TypedDict
+
+from utils.reader import iter_blocks, iter_lines
 
 
 class ReflectionType(Enum):
@@ -16,8 +18,7 @@ GLOBAL_IDX: int = 0
 
 
 def main() -> None:
-    input = read_input("src/advent_of_code_2023/day13/input.txt")
-    boards = split_list(input, "")
+    boards = parse_boards(iter_lines("src/advent_of_code_2023/day13/input.txt"))
 
     print(f"1 -> {solve_part1(boards)}")
     print(f"2 -> {solve_part2(boards)}")
@@ -34,6 +35,54 @@ def solve_part2(boards: List[List[str]]) -> int:
 
 
 def find_reflection_with_smudge(board: List[str]) -> Optional[Reflection]:
+    # Flipping a cell creates a new reflection exactly where the cell is the only
+    # mismatch, so the first such cell in row-major order decides, as it does for
+    # the brute force below.
+    # Runtime: O(H * W * (H + W))
+    original_reflection = find_all_reflections(board)[0]
+    if original_reflection is None:
+        return None
+
+    smudges: Dict[Tuple[int, int], List[Reflection]] = {}
+    for idx, (i, j), (k, l) in find_single_mismatches(board):
+        reflection = Reflection(idx=idx, type=ReflectionType.HORIZONTAL)
+        smudges.setdefault((i, j), []).append(reflection)
+        smudges.setdefault((k, l), []).append(reflection)
+    for idx, (j, i), (l, k) in find_single_mismatches(transpose(board)):
+        reflection = Reflection(idx=idx, type=ReflectionType.VERTICAL)
+        smudges.setdefault((i, j), []).append(reflection)
+        smudges.setdefault((k, l), []).append(reflection)
+
+    if not smudges:
+        raise AssertionError("New reflections not found")
+    new_reflections = smudges[min(smudges)]
+    if len(new_reflections) > 1:
+        raise AssertionError("Multiple new reflections")
+    return new_reflections[0]
+
+
+def find_single_mismatches(
+    board: List[str],
+) -> List[Tuple[int, Tuple[int, int], Tuple[int, int]]]:
+    # Horizontal reflection lines broken by exactly one pair of mirrored cells
+    res = []
+    for idx in range(1, len(board)):
+        mismatches = []
+        for di in range(min(idx, len(board) - idx)):
+            i, k = idx - 1 - di, idx + di
+            mismatches += [
+                ((i, j), (k, j))
+                for j in range(len(board[0]))
+                if board[i][j] != board[k][j]
+            ]
+            if len(mismatches) > 1:
+                break
+        if len(mismatches) == 1:
+            res.append((idx, *mismatches[0]))
+    return res
+
+
+def find_reflection_with_smudge_brute_force(board: List[str]) -> Optional[Reflection]:
     original_reflection = find_all_reflections(board)[0]
     if original_reflection is None:
         return None
@@ -109,14 +158,8 @@ def transpose(board: List[str]) -> List[str]:
     ]
 
 
-def split_list(list: List[str], separator: str) -> List[List[str]]:
-    sep_idxs: List[int] = (
-        [-1] + [idx for idx, s in enumerate(list) if s == separator] + [len(list)]
-    )
-    res: List[List[str]] = []
-    for i in range(len(sep_idxs) - 1):
-        res.append(list[sep_idxs[i] + 1 : sep_idxs[i + 1]])
-    return res
+def parse_boards(lines: Iterable[str]) -> List[List[str]]:
+    return list(iter_blocks(lines))
 
 
 def read_input(file_name: str) -> List[str]:
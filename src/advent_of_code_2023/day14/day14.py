@@ -1,13 +1,16 @@
-from typing import Dict, List, Optional, Tuple, TypeVar, TypedDict
+from typing import List
+
+from utils.cycles import find_cycle, state_at
+from utils.grid import Grid
+from utils.tracing import TRACE, trace
 
 ROUNDED_ROCK = "O"
 CUBE_ROCK = "#"
 EMPTY_SPACE = "."
 
-
-class Cycle(TypedDict):
-    offset: int
-    len: int
+ROUNDED = ord(ROUNDED_ROCK)
+CUBE = ord(CUBE_ROCK)
+EMPTY = ord(EMPTY_SPACE)
 
 
 def main() -> None:
@@ -18,91 +21,63 @@ def main() -> None:
     print(f"2 -> {solve_part2(board, 1000000000)}")
 
 
-def solve_part1(board: List[List[str]]) -> int:
-    board = tilt_north(board)
+def solve_part1(board: Grid) -> int:
+    board = tilt(board, board.up)
     return calc_total_load(board)
 
 
-def solve_part2(board: List[List[str]], spin_iteration: int) -> int:
+def solve_part2(board: Grid, spin_iteration: int) -> int:
     board = find_board(board, spin_iteration)
     return calc_total_load(board)
 
 
-def find_board(board: List[List[str]], spin_iteration: int) -> List[List[str]]:
-    board_to_id: Dict[str, int] = {matrix_to_string(board): 0}
-    id_to_board: Dict[int, List[List[str]]] = {0: board}
-
-    for id in range(1, 1001):
-        print(f"id = {id}")
-        board = spin_cycle(board)
-
-        key = matrix_to_string(board)
-        if key in board_to_id:
-            offset = board_to_id[key]
-            cycle_len = id - offset
-
-            iterations = offset + (spin_iteration - offset) % cycle_len
-            print(f"iterations = {iterations}")
-            return id_to_board[iterations]
-
-        board_to_id[key] = id
-        id_to_board[id] = [row.copy() for row in board]
-
-    raise AssertionError("Not found")
+def find_board(board: Grid, spin_iteration: int) -> Grid:
+    # Runtime: O((offset + period) * H * W), only a few boards kept at a time
+    if TRACE:
+        trace(f"cycle = {find_cycle(board, spin_cycle_copy, Grid.key)}")
+    return state_at(board, spin_cycle_copy, spin_iteration, Grid.key)
 
 
-def calc_total_load(board: List[List[str]]) -> int:
+def calc_total_load(board: Grid) -> int:
     return sum(
-        len(board) - i
-        for j in range(len(board[0]))
-        for i in range(len(board))
-        if board[i][j] == ROUNDED_ROCK
+        board.height - board.position(pos)[0] for pos in board.find_all(ROUNDED_ROCK)
     )
 
 
-def spin_cycle(board: List[List[str]]) -> List[List[str]]:
-    board = tilt_north(board)
-    board = tilt_west(board)
-    board = tilt_south(board)
-    board = tilt_east(board)
-    return board
-
-
-def tilt_north(board: List[List[str]]) -> List[List[str]]:
-    for j in range(len(board[0])):
-        empty_idx = 0
+def spin_cycle_copy(board: Grid) -> Grid:
+    return spin_cycle(board.copy())
 
-        for i in range(len(board)):
-            if board[i][j] == CUBE_ROCK:
-                empty_idx = i + 1
-            elif board[i][j] == ROUNDED_ROCK:
-                board[i][j] = EMPTY_SPACE
-                board[empty_idx][j] = ROUNDED_ROCK
-                empty_idx += 1
 
+def spin_cycle(board: Grid) -> Grid:
+    for direction in (board.up, board.left, board.down, board.right):
+        tilt(board, direction)
     return board
 
 
-def tilt_west(board: List[List[str]]) -> List[List[str]]:
-    board = rotate270(board)
-    tilt_north(board)
-    return rotate90(board)
+def tilt(board: Grid, direction: int) -> Grid:
+    # Rolls rounded rocks towards `direction`, scanning each line from that edge
+    cells = board.cells
+    border = board.border
+    step = -direction
 
+    for start in board.edge(direction):
+        empty_pos = start
+        pos = start
 
-def tilt_south(board: List[List[str]]) -> List[List[str]]:
-    board = rotate180(board)
-    tilt_north(board)
-    return rotate180(board)
+        while cells[pos] != border:
+            if cells[pos] == CUBE:
+                empty_pos = pos + step
+            elif cells[pos] == ROUNDED:
+                cells[pos] = EMPTY
+                cells[empty_pos] = ROUNDED
+                empty_pos += step
+            pos += step
 
-
-def tilt_east(board: List[List[str]]) -> List[List[str]]:
-    board = rotate90(board)
-    tilt_north(board)
-    return rotate270(board)
+    return board
 
 
-def parse(lines: List[str]) -> List[List[str]]:
-    return [list(line) for line in lines]
+def parse(lines: List[str]) -> Grid:
+    return Grid.from_lines(lines)
 
 
 def read_input(file_name: str) -> List[str]:
@@ -110,36 +85,5 @@ def read_input(file_name: str) -> List[str]:
         return [line.strip() for line in f]
 
 
-# Matrix Functions
-
-T = TypeVar("T")
-
-
-def rotate90(matrix: List[List[T]]) -> List[List[T]]:
-    return [
-        [matrix[i][j] for i in range(len(matrix))]
-        for j in reversed(range(len(matrix[0])))
-    ]
-
-
-def rotate180(matrix: List[List[T]]) -> List[List[T]]:
-    return rotate90(rotate90(matrix))
-
-
-def rotate270(matrix: List[List[T]]) -> List[List[T]]:
-    return rotate90(rotate90(rotate90(matrix)))
-
-
-def print_matrix(
-    matrix: List[List[T]], delimiter: str = "", desc: Optional[str] = None
-):
-    print(f"-----------{' '+desc+ ' ' if desc is not None else ''}-----------")
-    print(matrix_to_string(matrix, delimiter))
-
-
-def matrix_to_string(matrix: List[List[T]], delimiter: str = "") -> str:
-    return "\n".join(delimiter.join(str(e) for e in row) for row in matrix)
-
-
 if __name__ == "__main__":
     main()
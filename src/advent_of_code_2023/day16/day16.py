@@ -1,7 +1,9 @@
 from collections import deque
 from enum import Enum
 from functools import reduce
-from typing import Deque, Dict, List, Set, Tuple, TypedDict
+from typing import Deque, Dict, List, Tuple, TypedDict
+
+from utils.grid import Grid
 
 
 class TileType(Enum):
@@ -13,8 +15,7 @@ class TileType(Enum):
     VISITED = "#"
 
 
-Board = List[List[str]]
-Position = Tuple[int, int]
+Board = Grid
 
 
 class MoveType(Enum):
@@ -24,14 +25,14 @@ class MoveType(Enum):
     DOWN = "D"
 
 
-Move = Tuple[Position, MoveType]
-
+Move = Tuple[int, MoveType]
 
-MOVE_TYPE_TO_POS_INC: Dict[MoveType, Tuple[int, int]] = {
-    MoveType.LEFT: (0, -1),
-    MoveType.RIGHT: (0, 1),
-    MoveType.UP: (-1, 0),
-    MoveType.DOWN: (1, 0),
+# Index into `Grid.directions`
+MOVE_TYPE_TO_DIRECTION: Dict[MoveType, int] = {
+    MoveType.UP: 0,
+    MoveType.RIGHT: 1,
+    MoveType.DOWN: 2,
+    MoveType.LEFT: 3,
 }
 
 MOVE_TRANSFORMATION: Dict[Tuple[TileType, MoveType], List[MoveType]] = {
@@ -71,68 +72,66 @@ def main() -> None:
 
 
 def solve_part1(board: Board) -> int:
-    start_move = ((0, 0), MoveType.RIGHT)
+    start_move = (board.offset((0, 0)), MoveType.RIGHT)
     return count_energised_tiles(board, start_move)
 
 
 def solve_part2(board: Board) -> int:
     start_moves = (
-        [((i, 0), MoveType.RIGHT) for i in range(len(board))]
-        + [((i, len(board[0]) - 1), MoveType.LEFT) for i in range(len(board))]
-        + [((0, j), MoveType.DOWN) for j in range(len(board[0]))]
-        + [((len(board) - 1, j), MoveType.DOWN) for j in range(len(board[0]))]
+        [(pos, MoveType.RIGHT) for pos in board.edge(board.left)]
+        + [(pos, MoveType.LEFT) for pos in board.edge(board.right)]
+        + [(pos, MoveType.DOWN) for pos in board.edge(board.up)]
+        + [(pos, MoveType.DOWN) for pos in board.edge(board.down)]
     )
 
     return max(count_energised_tiles(board, start_move) for start_move in start_moves)
 
 
-def count_energised_tiles(board: Board, start_move: Move) -> int:
-    move_queue: Deque[Move] = deque([start_move])
-    visited_moves: Set[Move] = set()
-
-    while len(move_queue) > 0:
-        move = move_queue.popleft()
-        pos, move_type = move
-        visited_moves.add((pos, move_type))
-
-        tile_type = TileType(board[pos[0]][pos[1]])
-
-        next_move_types = MOVE_TRANSFORMATION[(tile_type, move_type)]
-        for next_move_type in next_move_types:
-            pos_inc = MOVE_TYPE_TO_POS_INC[next_move_type]
-            next_pos = (pos[0] + pos_inc[0], pos[1] + pos_inc[1])
-            new_move = (next_pos, next_move_type)
-            if is_valid_position(next_pos, board) and new_move not in visited_moves:
-                move_queue.append(new_move)
-
-    # print_board(board, visited_moves)
+def build_transitions(board: Board) -> List[List[List[Tuple[int, int]]]]:
+    # [tile][direction] -> [(next direction, step)]
+    res: List[List[List[Tuple[int, int]]]] = [
+        [[] for _ in range(4)] for _ in range(256)
+    ]
+    for (tile_type, move_type), next_move_types in MOVE_TRANSFORMATION.items():
+        res[ord(tile_type.value)][MOVE_TYPE_TO_DIRECTION[move_type]] = [
+            (
+                MOVE_TYPE_TO_DIRECTION[next_move_type],
+                board.directions[MOVE_TYPE_TO_DIRECTION[next_move_type]],
+            )
+            for next_move_type in next_move_types
+        ]
+    return res
 
-    return len({pos for pos, move_type in visited_moves})
 
+def count_energised_tiles(board: Board, start_move: Move) -> int:
+    cells = board.cells
+    border = board.border
+    transitions = build_transitions(board)
 
-def is_valid_position(pos: Position, board: Board) -> bool:
-    return (
-        pos[0] >= 0
-        and pos[0] < len(board)
-        and pos[1] >= 0
-        and pos[1] < len(board[pos[0]])
+    start_pos, start_move_type = start_move
+    move_queue: Deque[Tuple[int, int]] = deque(
+        [(start_pos, MOVE_TYPE_TO_DIRECTION[start_move_type])]
     )
+    # Bit mask of directions each tile was entered with
+    visited_moves = bytearray(len(cells))
+    visited_moves[start_pos] |= 1 << move_queue[0][1]
 
+    while len(move_queue) > 0:
+        pos, direction = move_queue.popleft()
 
-def print_board(board: Board, visited_moves: Set[Move]):
-    visited_pos = {pos for pos, move_type in visited_moves}
-    s = "\n".join(
-        "".join(
-            board[i][j] if (i, j) not in visited_pos else "#"
-            for j in range(len(board[0]))
-        )
-        for i in range(len(board))
-    )
-    print(s)
+        for next_direction, step in transitions[cells[pos]][direction]:
+            next_pos = pos + step
+            if cells[next_pos] != border and not visited_moves[next_pos] & (
+                1 << next_direction
+            ):
+                visited_moves[next_pos] |= 1 << next_direction
+                move_queue.append((next_pos, next_direction))
+
+    return len(visited_moves) - visited_moves.count(0)
 
 
 def parse_board(lines: List[str]) -> Board:
-    return [[ch for ch in line] for line in lines]
+    return Grid.from_lines(lines)
 
 
 def read_input(file_name: str) -> List[str]:
@@ -1,8 +1,9 @@
 from enum import Enum
-from operator import itemgetter
-from queue import PriorityQueue
 import re
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+
+from utils.grid import Grid
+from utils.shortest_path import find_shortest_paths
 
 
 class MoveType(Enum):
@@ -12,13 +13,6 @@ class MoveType(Enum):
     DOWN = "D"
 
 
-MOVE_TYPE_TO_POS_INC: Dict[MoveType, Tuple[int, int]] = {
-    MoveType.LEFT: (0, -1),
-    MoveType.RIGHT: (0, 1),
-    MoveType.UP: (-1, 0),
-    MoveType.DOWN: (1, 0),
-}
-
 INVERTED_MOVE_TYPE: Dict[MoveType, MoveType] = {
     MoveType.LEFT: MoveType.RIGHT,
     MoveType.RIGHT: MoveType.LEFT,
@@ -33,41 +27,16 @@ MOVE_TURN: Dict[MoveType, Set[MoveType]] = {
     MoveType.DOWN: {MoveType.LEFT, MoveType.RIGHT},
 }
 
-Board = List[List[int]]
-Position = Tuple[int, int]
-Move = Tuple[Position, MoveType, int]
+Board = Grid
+Position = int
+# (position, direction step, steps made in that direction)
+Move = Tuple[Position, int, int]
 
 MAX_STEPS = 10  # 3
 MIN_STEPS = 4
 MAX_LOSS = 1000000000000
 
-
-class _PriorityQueueWrapper:
-    def __init__(self, item, key):
-        self.item = item
-        self.key = key
-
-    def __lt__(self, other):
-        return self.key(self.item) < other.key(other.item)
-
-    def __eq__(self, other):
-        return self.key(self.item) == other.key(other.item)
-
-
-class KeyPriorityQueue(PriorityQueue):
-    def __init__(self, key):
-        self.key = key
-        super().__init__()
-
-    def _qsize(self):
-        return super()._qsize()
-
-    def _get(self):
-        wrapper = super()._get()
-        return wrapper.item
-
-    def _put(self, item):
-        super()._put(_PriorityQueueWrapper(item, self.key))
+ZERO = ord("0")
 
 
 def main() -> None:
@@ -79,69 +48,76 @@ def main() -> None:
 
 
 def solve(board: Board, min_steps: int = MIN_STEPS, max_steps: int = MAX_STEPS) -> int:
-    move_loss: Dict[Move, int] = dict()
-    move_pq: PriorityQueue[Tuple[Move, int]] = KeyPriorityQueue(itemgetter(1))
-    move_pq.put(
-        (
-            ((0, min_steps), MoveType.RIGHT, min_steps),
-            sum(board[0][j] for j in range(1, min_steps + 1)),
-        )
-    )
-    move_pq.put(
-        (
-            ((min_steps, 0), MoveType.DOWN, min_steps),
-            sum(board[i][0] for i in range(1, min_steps + 1)),
-        )
-    )
-
-    while not move_pq.empty():
-        move, loss = move_pq.get()
-        pos, move_type, steps = move
-
-        if loss >= move_loss.get(move, MAX_LOSS):
-            continue
-
-        move_loss[move] = loss
-
-        for next_move_type in find_next_moves(move_type, steps, min_steps, max_steps):
-            pos_inc = MOVE_TYPE_TO_POS_INC[next_move_type]
-
-            if next_move_type == move_type:
-                next_pos = (pos[0] + pos_inc[0], pos[1] + pos_inc[1])
-                next_steps = steps + 1
+    cells = board.cells
+    border = board.border
+    end_pos = board.offset((board.height - 1, board.width - 1))
+    end_i, end_j = board.position(end_pos)
+
+    move_type_to_step: Dict[MoveType, int] = {
+        MoveType.LEFT: board.left,
+        MoveType.RIGHT: board.right,
+        MoveType.UP: board.up,
+        MoveType.DOWN: board.down,
+    }
+
+    def path_loss(pos: Position, step: int, steps: int) -> Optional[int]:
+        # Loss of `steps` cells after `pos`, or None when leaving the board
+        loss = 0
+        for _ in range(steps):
+            pos += step
+            if cells[pos] == border:
+                return None
+            loss += cells[pos] - ZERO
+        return loss
+
+    # Directions are kept as grid steps in moves, enums are slow to hash
+    next_move_steps: Dict[Tuple[int, int], List[int]] = {
+        (move_type_to_step[move_type], steps): [
+            move_type_to_step[next_move_type]
+            for next_move_type in find_next_moves(
+                move_type, steps, min_steps, max_steps
+            )
+        ]
+        for move_type in MoveType
+        for steps in range(min_steps, max_steps + 1)
+    }
+
+    def next_moves(move: Move) -> List[Tuple[Move, int]]:
+        pos, step, steps = move
+        res: List[Tuple[Move, int]] = []
+        for next_step in next_move_steps[(step, steps)]:
+            if next_step == step:
+                cells_count, next_steps = 1, steps + 1
             else:
-                next_pos = (
-                    pos[0] + min_steps * pos_inc[0],
-                    pos[1] + min_steps * pos_inc[1],
-                )
-                next_steps = min_steps
-
-            next_move = (next_pos, next_move_type, next_steps)
-
-            if is_valid_position(next_pos, board):
-                next_loss = (
-                    loss
-                    + sum(
-                        board[i][j]
-                        for i in range(
-                            min(pos[0], next_pos[0]), max(pos[0], next_pos[0]) + 1
-                        )
-                        for j in range(
-                            min(pos[1], next_pos[1]), max(pos[1], next_pos[1]) + 1
-                        )
-                    )
-                    - board[pos[0]][pos[1]]
-                )
-                move_pq.put((next_move, next_loss))
-
-    # print_move_loss(move_loss, board)
-    # print("----------")
-
-    return min(
-        loss
-        for (pos, _, _), loss in move_loss.items()
-        if pos == (len(board) - 1, len(board[0]) - 1)
-    )
+                cells_count, next_steps = min_steps, min_steps
+
+            loss = path_loss(pos, next_step, cells_count)
+            if loss is not None:
+                next_pos = pos + cells_count * next_step
+                res.append(((next_pos, next_step, next_steps), loss))
+        return res
+
+    def min_loss_left(move: Move) -> int:
+        # Every remaining cell costs at least 1
+        i, j = board.position(move[0])
+        return (end_i - i) + (end_j - j)
+
+    start = board.offset((0, 0))
+    start_moves: List[Tuple[Move, int]] = []
+    for step in [board.right, board.down]:
+        loss = path_loss(start, step, min_steps)
+        if loss is not None:
+            start_moves.append(((start + min_steps * step, step, min_steps), loss))
+
+    cost = find_shortest_paths(
+        start_moves,
+        next_moves,
+        is_target=lambda move: move[0] == end_pos,
+        heuristic=min_loss_left,
+    ).cost
+    if cost is None:
+        raise AssertionError("No path to the end")
+    return cost
 
 
 def find_next_moves(
@@ -155,47 +131,8 @@ def find_next_moves(
         return {mt for mt in MoveType if mt != INVERTED_MOVE_TYPE[move_type]}
 
 
-def print_move_loss(move_loss: Dict[Move, int], board: Board):
-    grouped_by_pos: Dict[Position, List[Tuple[Move, int]]] = {}
-    for move, loss in move_loss.items():
-        if move[0] not in grouped_by_pos:
-            grouped_by_pos[move[0]] = []
-        grouped_by_pos[move[0]].append((move, loss))
-
-    s = "\n".join(
-        "\t".join(
-            format_moves(grouped_by_pos.get((i, j), list()))
-            if (i, j) in grouped_by_pos
-            else "-"
-            for j in range(len(board[0]))
-        )
-        for i in range(len(board))
-    )
-    print(s)
-
-
-def format_moves(moves: List[Tuple[Move, int]]) -> str:
-    return (
-        "["
-        + ",".join(
-            f"{move_type.value}:{steps}|{loss}"
-            for ((pos, move_type, steps), loss) in moves
-        )
-        + "]"
-    )
-
-
-def is_valid_position(pos: Position, board: List[List[int]]) -> bool:
-    return (
-        pos[0] >= 0
-        and pos[0] < len(board)
-        and pos[1] >= 0
-        and pos[1] < len(board[pos[0]])
-    )
-
-
 def parse_board(lines: List[str]) -> Board:
-    return [[int(ch) for ch in line] for line in lines]
+    return Grid.from_lines(lines)
 
 
 def read_input(file_name: str) -> List[str]:
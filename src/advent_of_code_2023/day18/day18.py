@@ -4,6 +4,8 @@ from typing import Deque, Dict, List, Tuple, TypedDict
 
 from more_itertools import first
 
+from utils.grid import Grid
+
 
 class MoveType(Enum):
     LEFT = "L"
@@ -35,12 +37,15 @@ class BoardStats(TypedDict):
 GROUND_TILE = "."
 TRENCH_TILE = "#"
 
-Board = List[List[str]]
+GROUND = ord(GROUND_TILE)
+TRENCH = ord(TRENCH_TILE)
+
+Board = Grid
 Position = Tuple[int, int]
 
 
 class ScaledBoard(TypedDict):
-    board: Board
+    board: List[List[str]]
     row_scales: List[int]
     col_scales: List[int]
 
@@ -52,8 +57,6 @@ MOVE_TYPE_TO_POS_INC: Dict[MoveType, Tuple[int, int]] = {
     MoveType.DOWN: (1, 0),
 }
 
-POS_INC: List[Tuple[int, int]] = [(0, -1), (0, 1), (-1, 0), (1, 0)]
-
 INF_INT = 1000000000000000
 
 
@@ -84,16 +87,15 @@ def solve_part1(lines: List[str]) -> int:
 
 
 def create_board(rows: int, cols: int) -> Board:
-    return [[GROUND_TILE for j in range(cols)] for i in range(rows)]
+    return Grid(cols, rows, filler=GROUND_TILE)
 
 
 def print_board(board: Board):
-    s = "\n".join("".join(e for e in row) for row in board)
-    print(s)
+    print(board)
 
 
 def count_tiles(board: Board, tile: str) -> int:
-    return sum(sum(1 if t == tile else 0 for t in row) for row in board)
+    return board.count(tile)
 
 
 def find_board_stats(moves: List[Move]) -> BoardStats:
@@ -114,33 +116,35 @@ def find_board_stats(moves: List[Move]) -> BoardStats:
 
 
 def apply_moves(board: Board, moves: List[Move], start_pos: Position):
-    pos = start_pos
-    board[pos[0]][pos[1]] = TRENCH_TILE
+    cells = board.cells
+    pos = board.offset(start_pos)
+    cells[pos] = TRENCH
 
     for move in moves:
-        pos_inc = MOVE_TYPE_TO_POS_INC[move["type"]]
+        i_inc, j_inc = MOVE_TYPE_TO_POS_INC[move["type"]]
+        step = i_inc * board.stride + j_inc
         for _ in range(move["steps"]):
-            pos = (pos[0] + pos_inc[0], pos[1] + pos_inc[1])
-            board[pos[0]][pos[1]] = TRENCH_TILE
+            pos += step
+            cells[pos] = TRENCH
 
 
 def fill_inside(board: Board, start_row: int = 0):
-    start_pos = find_pos_inside(board, start_row)
-    pos_queue: Deque[Position] = deque([start_pos])
+    cells = board.cells
+    start_pos = board.offset(find_pos_inside(board, start_row))
+    pos_queue: Deque[int] = deque([start_pos])
 
     while len(pos_queue) > 0:
         pos = pos_queue.pop()
-        board[pos[0]][pos[1]] = TRENCH_TILE
+        cells[pos] = TRENCH
 
-        for pos_inc in POS_INC:
-            new_pos = (pos[0] + pos_inc[0], pos[1] + pos_inc[1])
-            if board[new_pos[0]][new_pos[1]] == GROUND_TILE:
-                pos_queue.append(new_pos)
+        for step in board.directions:
+            if cells[pos + step] == GROUND:
+                pos_queue.append(pos + step)
 
 
 def find_pos_inside(board: Board, start_row: int) -> Position:
     first_trench_col = first(
-        j for j in range(len(board[0])) if board[start_row][j] == TRENCH_TILE
+        j for j in range(board.width) if board.get((start_row, j)) == TRENCH_TILE
     )
     return (start_row + 1, first_trench_col + 1)
 
@@ -161,7 +165,9 @@ def solve_part2(lines: List[str]) -> int:
     moves = parse_moves_part2(lines)
     scaled_board = apply_moves_part2(moves)
     # print_scaled_board(scaled_board)
-    fill_inside(scaled_board["board"], 1)
+    board = Grid.from_lines(["".join(row) for row in scaled_board["board"]])
+    fill_inside(board, 1)
+    scaled_board["board"] = [list(line) for line in board.to_lines()]
     # print_scaled_board(scaled_board)
     return count_scaled_tiles(scaled_board, TRENCH_TILE)
 
@@ -303,7 +309,7 @@ def count_scaled_tiles(scaled_board: ScaledBoard, tile: str) -> int:
 def print_scaled_board(scaled_board: ScaledBoard):
     print(f"row_scales = {scaled_board['row_scales']}")
     print(f"col_scales = {scaled_board['col_scales']}")
-    print_board(scaled_board["board"])
+    print("\n".join("".join(e for e in row) for row in scaled_board["board"]))
 
 
 def parse_moves_part2(lines: List[str]) -> List[Move]:
@@ -2,6 +2,7 @@ from collections import deque
 import sys
 from typing import Deque, Dict, List, Set, Tuple, TypedDict
 
+from utils.grid import Grid
 
 PATH_TILE = "."
 FOREST_TILE = "#"
@@ -10,17 +11,10 @@ SLOPE_DOWN_TILE = "v"
 SLOPE_RIGHT_TILE = ">"
 SLOPE_LEFT_TILE = "<"
 
-Board = List[List[str]]
-Position = Tuple[int, int]
+FOREST = ord(FOREST_TILE)
 
-NEXT_POS_INC: Dict[str, List[Tuple[int, int]]] = {
-    PATH_TILE: [(1, 0), (-1, 0), (0, 1), (0, -1)],
-    FOREST_TILE: [],
-    SLOPE_UP_TILE: [(-1, 0)],
-    SLOPE_DOWN_TILE: [(1, 0)],
-    SLOPE_RIGHT_TILE: [(0, 1)],
-    SLOPE_LEFT_TILE: [(0, -1)],
-}
+Board = Grid
+Position = int
 
 
 class Candidate(TypedDict):
@@ -38,7 +32,7 @@ def main() -> None:
 
 
 def parse_board(lines: List[str]) -> Board:
-    return [[ch for ch in line] for line in lines]
+    return Grid.from_lines(lines)
 
 
 def solve_part1(board: Board) -> int:
@@ -55,14 +49,21 @@ def solve_part2(board: Board) -> int:
 
 
 def clear_slopes(board: Board) -> Board:
-    return [
-        [PATH_TILE if e != FOREST_TILE else FOREST_TILE for e in row] for row in board
-    ]
+    return Grid.from_lines(
+        [
+            "".join(PATH_TILE if e != FOREST_TILE else FOREST_TILE for e in row)
+            for row in board.to_lines()
+        ]
+    )
 
 
 def find_longest_path(board: Board, start: Position, finish: Position) -> int:
     sys.setrecursionlimit(10000)
 
+    cells = board.cells
+    border = board.border
+    next_pos_inc = build_next_pos_inc(board)
+
     src_to_dest: Dict[Position, Tuple[Position, int, Position]] = dict()
     dest_to_src: Dict[Position, Position] = dict()
 
@@ -90,14 +91,11 @@ def find_longest_path(board: Board, start: Position, finish: Position) -> int:
         else:
             step_inc = 1
             next_positions = [
-                next_pos
-                for next_pos in [
-                    (pos[0] + i_inc, pos[1] + j_inc)
-                    for i_inc, j_inc in NEXT_POS_INC[board[pos[0]][pos[1]]]
-                ]
-                if is_valid_position(next_pos, board)
-                and board[next_pos[0]][next_pos[1]] != FOREST_TILE
-                and next_pos not in visited
+                pos + step
+                for step in next_pos_inc[cells[pos]]
+                if cells[pos + step] != border
+                and cells[pos + step] != FOREST
+                and pos + step not in visited
             ]
 
             if len(next_positions) == 1:
@@ -136,30 +134,32 @@ def find_longest_path(board: Board, start: Position, finish: Position) -> int:
     return dfs(start, start, 0, set(), 0)
 
 
+def build_next_pos_inc(board: Board) -> Dict[int, List[int]]:
+    return {
+        ord(PATH_TILE): [board.down, board.up, board.right, board.left],
+        ord(FOREST_TILE): [],
+        ord(SLOPE_UP_TILE): [board.up],
+        ord(SLOPE_DOWN_TILE): [board.down],
+        ord(SLOPE_RIGHT_TILE): [board.right],
+        ord(SLOPE_LEFT_TILE): [board.left],
+    }
+
+
 def find_start(board: Board) -> Position:
     return find_path_tile(board, 0)
 
 
 def find_finish(board: Board) -> Position:
-    return find_path_tile(board, len(board) - 1)
+    return find_path_tile(board, board.height - 1)
 
 
 def find_path_tile(board: Board, i: int) -> Position:
-    for j in range(len(board[i])):
-        if board[i][j] == PATH_TILE:
-            return (i, j)
+    for j in range(board.width):
+        if board.get((i, j)) == PATH_TILE:
+            return board.offset((i, j))
     raise AssertionError("Path tile not found")
 
 
-def is_valid_position(pos: Position, board: Board) -> bool:
-    return (
-        pos[0] >= 0
-        and pos[0] < len(board)
-        and pos[1] >= 0
-        and pos[1] < len(board[pos[0]])
-    )
-
-
 def read_input(file_name: str) -> List[str]:
     with open(file_name) as f:
         return [line.strip() for line in f]
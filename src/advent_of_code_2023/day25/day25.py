@@ -1,10 +1,7 @@
-from collections import deque
-import queue
-from typing import Dict, List, Set, Tuple
-from pyvis.network import Network  # pip install pyvis
+from typing import List, Set, Tuple
 
-
-AdjDict = Dict[str, Set[str]]
+from utils.graph import Graph, connected_components
+from utils.graph_utils import visualise_graph
 
 # found with visualisation
 DISCONNECTED_EDGES = [
@@ -17,64 +14,28 @@ DISCONNECTED_EDGES = [
 def main() -> None:
     input = read_input("src/advent_of_code_2023/day25/input.txt")
 
-    adj_dict = parse_adj_dict(input)
-    # visualise_graph(adj_dict)
-
-    print(f"1 -> {solve_part1(adj_dict, DISCONNECTED_EDGES)}")
-
-
-def solve_part1(adj_dict: AdjDict, disconnected_adges: List[Tuple[str, str]]) -> int:
-    for n1, n2 in disconnected_adges:
-        adj_dict[n1].remove(n2)
-        adj_dict[n2].remove(n1)
-
-    return count_nodes(adj_dict, disconnected_adges[0][0]) * count_nodes(
-        adj_dict, disconnected_adges[0][1]
-    )
-
-
-def count_nodes(adj_dict: AdjDict, start_node: str) -> int:
-    visited: Set[str] = set()
-    queue = deque([start_node])
-    while len(queue) > 0:
-        node = queue.pop()
-        visited.add(node)
-        queue.extend(
-            [adj_node for adj_node in adj_dict[node] if adj_node not in visited]
-        )
-
-    return len(visited)
-
-
-def visualise_graph(adj_dict: AdjDict):
-    net = Network(height="750px", width="100%", bgcolor="#222222", font_color="white")
-
-    for node in adj_dict.keys():
-        net.add_node(node)
-
-    for node, adj_nodes in adj_dict.items():
-        for adj_node in adj_nodes:
-            net.add_edge(node, adj_node)
-    net.toggle_physics(True)
-    net.show("mygraph.html", notebook=False)
+    graph = parse_graph(input)
+    # visualise_graph(graph, layout=False)
 
+    print(f"1 -> {solve_part1(graph, DISCONNECTED_EDGES)}")
 
-def parse_adj_dict(lines: List[str]) -> AdjDict:
-    adj_list = [parse_adj_node(line) for line in lines]
 
-    adj_dict: AdjDict = {}
-    for node, adj_nodes in adj_list:
-        for adj_node in adj_nodes:
-            add_adge(adj_dict, node, adj_node)
-            add_adge(adj_dict, adj_node, node)
+def solve_part1(graph: Graph, disconnected_adges: List[Tuple[str, str]]) -> int:
+    # Runtime: O(V + E)
+    components = connected_components(graph.without_edges(disconnected_adges))
+    if len(components) != 2:
+        raise AssertionError(f"Expected 2 components, found {len(components)}")
 
-    return adj_dict
+    return len(components[0]) * len(components[1])
 
 
-def add_adge(adj_dict: AdjDict, from_node: str, to_node: str):
-    if from_node not in adj_dict:
-        adj_dict[from_node] = set()
-    adj_dict[from_node].add(to_node)
+def parse_graph(lines: List[str]) -> Graph:
+    edges = [
+        (node, adj_node)
+        for node, adj_nodes in map(parse_adj_node, lines)
+        for adj_node in adj_nodes
+    ]
+    return Graph.from_edges(edges)
 
 
 def parse_adj_node(s: str) -> Tuple[str, Set[str]]:
@@ -1,6 +1,8 @@
 from functools import reduce
-from itertools import chain
-from typing import Dict, List, Optional, Set, Tuple, TypeVar, TypedDict
+from typing import List, TypeVar, TypedDict
+
+from utils.intervals import IntervalMap, IntervalSet
+from utils.reader import iter_blocks
 
 
 class AlmanacRange(TypedDict):
@@ -36,114 +38,37 @@ def main() -> None:
 
 def solve_part1(lines: List[str]) -> int:
     almanac = parse_almanac(lines)
-    return min(
-        [calc_seed_dest(seed, almanac["almanac_maps"]) for seed in almanac["seeds"]]
-    )
+    seed_to_location = compose_maps(almanac["almanac_maps"])
+    return min(seed_to_location(seed) for seed in almanac["seeds"])
 
 
 def solve_part2(lines: List[str]) -> int:
+    # Runtime: O((M + S) log(M + S)), M - ranges in all maps, S - seed ranges
     almanac = parse_almanac_part2(lines)
-    return min(
-        source_range["start"]
-        for source_range in chain.from_iterable(
-            calc_seed_range_dest(seed_range, almanac["almanac_maps"])
-            for seed_range in almanac["seed_ranges"]
-        )
-    )
-
-
-def calc_seed_range_dest(
-    seed_range: SourceRange, almanac_maps: List[AlmanacMap]
-) -> List[SourceRange]:
-    return reduce(
-        lambda source_ranges, almanac_map: list(
-            chain.from_iterable(
-                calc_range_dest(source_range, almanac_map)
-                for source_range in source_ranges
-            )
-        ),
-        almanac_maps,
-        [seed_range],
+    seed_to_location = compose_maps(almanac["almanac_maps"])
+    seeds = IntervalSet(
+        (seed_range["start"], seed_range["start"] + seed_range["len"])
+        for seed_range in almanac["seed_ranges"]
     )
+    return seed_to_location.image(seeds).min()
 
 
-def calc_range_dest(
-    source_range: SourceRange, almanac_map: AlmanacMap
-) -> List[SourceRange]:
-    res: List[SourceRange] = list()
-
-    for almanac_range in almanac_map:
-        if source_range["start"] < almanac_range["source_start"]:
-            subrange = SourceRange(
-                start=source_range["start"],
-                len=min(
-                    almanac_range["source_start"] - source_range["start"],
-                    source_range["len"],
-                ),
-            )
-            res.append(subrange)
-
-            source_range = SourceRange(
-                start=source_range["start"] + subrange["len"],
-                len=source_range["len"] - subrange["len"],
-            )
-            if source_range["len"] == 0:
-                break
-
-        if (
-            source_range["start"] >= almanac_range["source_start"]
-            and source_range["start"]
-            < almanac_range["source_start"] + almanac_range["len"]
-        ):
-            subrange = SourceRange(
-                start=almanac_range["dest_start"]
-                + (source_range["start"] - almanac_range["source_start"]),
-                len=min(
-                    almanac_range["source_start"]
-                    + almanac_range["len"]
-                    - source_range["start"],
-                    source_range["len"],
-                ),
-            )
-            res.append(subrange)
-
-            source_range = SourceRange(
-                start=source_range["start"] + subrange["len"],
-                len=source_range["len"] - subrange["len"],
-            )
-            if source_range["len"] == 0:
-                break
-
-    if source_range["len"] > 0:
-        res.append(source_range)
-
-    return res
-
-
-def calc_seed_dest(seed: int, almanac_maps: List[AlmanacMap]) -> int:
-    return reduce(calc_dest, almanac_maps, seed)
-
-
-def calc_dest(source: int, almanac_map: AlmanacMap) -> int:
-    range = find_almanac_range(source, almanac_map)
-    if range is None:
-        return source
-    return range["dest_start"] + (source - range["source_start"])
+def compose_maps(almanac_maps: List[AlmanacMap]) -> IntervalMap:
+    return reduce(IntervalMap.then, map(to_interval_map, almanac_maps))
 
 
-def find_almanac_range(source: int, almanac_map: AlmanacMap) -> Optional[AlmanacRange]:
-    ranges = [
-        r
+def to_interval_map(almanac_map: AlmanacMap) -> IntervalMap:
+    return IntervalMap(
+        (
+            (r["source_start"], r["source_start"] + r["len"]),
+            r["dest_start"] - r["source_start"],
+        )
         for r in almanac_map
-        if source in range(r["source_start"], r["source_start"] + r["len"])
-    ]
-    if len(ranges) == 1:
-        return ranges[0]
-    return None
+    )
 
 
 def parse_almanac(lines: List[str]) -> Almanac:
-    parts = split_list(lines, "")
+    parts = list(iter_blocks(lines))
     return Almanac(
         seeds=parse_seeds(parts[0][0]),
         almanac_maps=[parse_almanac_map(part) for part in parts[1:]],
@@ -151,7 +76,7 @@ def parse_almanac(lines: List[str]) -> Almanac:
 
 
 def parse_almanac_part2(lines: List[str]) -> AlmanacPart2:
-    parts = split_list(lines, "")
+    parts = list(iter_blocks(lines))
     return AlmanacPart2(
         seed_ranges=parse_seed_ranges(parts[0][0]),
         almanac_maps=[parse_almanac_map(part) for part in parts[1:]],
@@ -182,16 +107,6 @@ def parse_almanac_map(lines: List[str]) -> AlmanacMap:
     )
 
 
-def split_list(list: List[str], separator: str) -> List[List[str]]:
-    sep_idxs: List[int] = (
-        [-1] + [idx for idx, s in enumerate(list) if s == separator] + [len(list)]
-    )
-    res: List[List[str]] = []
-    for i in range(len(sep_idxs) - 1):
-        res.append(list[sep_idxs[i] + 1 : sep_idxs[i + 1]])
-    return res
-
-
 T = TypeVar("T")
 
 
@@ -1,6 +1,9 @@
 import re
-from typing import Dict, List, Tuple, TypedDict
-from functools import reduce
+from itertools import product
+from typing import Dict, List, Optional, Tuple
+
+from utils.cycles import combine_cycles, find_cycle
+from utils.graph import Graph
 
 
 def main() -> None:
@@ -15,60 +18,88 @@ def main() -> None:
 
 
 def solve_part1(path: str, directions: Dict[str, Tuple[str, str]]) -> int:
-    node = "AAA"
+    graph, moves = build_moves(directions)
+    turns = parse_turns(path)
+    node, end = graph.id("AAA"), graph.id("ZZZ")
 
     path_idx = 0
     count = 0
-    while node != "ZZZ":
-        if path[path_idx] == "L":
-            node = directions[node][0]
-        else:
-            node = directions[node][1]
+    while node != end:
+        node = moves[turns[path_idx]][node]
 
-        path_idx = (path_idx + 1) % len(path)
+        path_idx = (path_idx + 1) % len(turns)
         count += 1
 
     return count
 
 
 def solve_part2(path: str, directions: Dict[str, Tuple[str, str]]) -> int:
-    nodes = [n for n in directions.keys() if n[2] == "A"]
-    end_node_steps: List[int] = [0 for i in range(len(nodes))]
-
-    path_idx = 0
-    count = 0
-    while not all(s > 0 for s in end_node_steps):
-        count += 1
-
-        for i in range(len(nodes)):
-            if path[path_idx] == "L":
-                nodes[i] = directions[nodes[i]][0]
-            else:
-                nodes[i] = directions[nodes[i]][1]
-
-            if nodes[i][2] == "Z" and end_node_steps[i] == 0:
-                end_node_steps[i] = count
-
-        path_idx = (path_idx + 1) % len(path)
-
-    return compute_lcm_list(end_node_steps)
-
-
-def compute_lcm_list(list: List[int]) -> int:
-    return reduce(lambda x, y: compute_lcm(x, y), list, 1)
-
-
-def compute_gcd(x, y):
-    """Greatest Common Divisor"""
-    while y:
-        x, y = y, x % y
-    return x
-
-
-def compute_lcm(x, y):
-    """Least Common Multiple"""
-    lcm = (x * y) // compute_gcd(x, y)
-    return lcm
+    # Each ghost walks a cycle of (node, path index) states. Times before every
+    # ghost is on its cycle are simulated, later ones come from combining the
+    # cycles' end node times, so no ghost has to reach its end node exactly
+    # once per cycle (what a plain LCM assumes).
+    # Runtime: O(G * (offset + period)) steps, G - ghosts
+    graph, moves = build_moves(directions)
+    turns = parse_turns(path)
+    is_end = [name[2] == "Z" for name in graph.names]
+
+    nodes = [node for node, name in enumerate(graph.names) if name[2] == "A"]
+    ghosts = [ghost_end_times(turns, moves, is_end, node) for node in nodes]
+
+    settle_time = max(offset for offset, _, _ in ghosts)
+    for count in range(settle_time):
+        if all(is_end[n] for n in nodes):
+            return count
+        nodes = [moves[turns[count % len(turns)]][n] for n in nodes]
+
+    res: Optional[int] = None
+    for end_times in product(*(times for _, _, times in ghosts)):
+        combined = combine_cycles(
+            (time, period) for time, (_, period, _) in zip(end_times, ghosts)
+        )
+        if combined is None:
+            continue
+        time, period = combined
+        if time < settle_time:
+            time += (settle_time - time + period - 1) // period * period
+        res = time if res is None else min(res, time)
+
+    if res is None:
+        raise AssertionError("Ghosts never meet at end nodes")
+    return res
+
+
+def ghost_end_times(
+    turns: List[int], moves: Tuple[List[int], List[int]], is_end: List[bool], node: int
+) -> Tuple[int, int, List[int]]:
+    # (offset, period, times within the first period on the cycle at an end node)
+    def step(state: Tuple[int, int]) -> Tuple[int, int]:
+        node, path_idx = state
+        return (moves[turns[path_idx]][node], (path_idx + 1) % len(turns))
+
+    offset, period = find_cycle((node, 0), step)
+
+    state = (node, 0)
+    end_times = []
+    for count in range(offset + period):
+        if count >= offset and is_end[state[0]]:
+            end_times.append(count)
+        state = step(state)
+    return (offset, period, end_times)
+
+
+def build_moves(
+    directions: Dict[str, Tuple[str, str]],
+) -> Tuple[Graph, Tuple[List[int], List[int]]]:
+    # Node ids reached by turning left and right, the graph only interns names
+    graph = Graph.from_adj_dict(directions)
+    left = [graph.id(directions[name][0]) for name in graph.names]
+    right = [graph.id(directions[name][1]) for name in graph.names]
+    return (graph, (left, right))
+
+
+def parse_turns(path: str) -> List[int]:
+    return [0 if turn == "L" else 1 for turn in path]
 
 
 def parse_direction(s: str) -> Tuple[str, str, str]:
@@ -2,7 +2,6 @@ from dataclasses import dataclass
 import re
 from typing import List, Tuple
 import typing
-import numpy as np
 
 from utils.utils import split_to_chunks
 
@@ -45,27 +44,19 @@ def increase_price(game_input: GameInput) -> GameInput:
 
 
 def solve_game(game_input: GameInput) -> int:
-    ((ax, ay), (bx, by), (px, py)) = game_input.a, game_input.b, game_input.prize
-
-    # steps_vec = buttons_matrix^(-1) * price_vec
-    buttons_matrix = np.array(
-        [
-            [ax, bx],
-            [ay, by],
-        ]
-    )
-    price_vec = np.array([[px], [py]])
-
-    steps_vec = np.linalg.inv(buttons_matrix).dot(price_vec)
-    steps_a = round(float(steps_vec[0][0]))
-    steps_b = round(float(steps_vec[1][0]))
+    (ax, ay), (bx, by), (px, py) = game_input.a, game_input.b, game_input.prize
 
-    steps_int_vec = np.round(steps_vec).astype(np.int64)
+    # steps_vec = buttons_matrix^(-1) * price_vec, solved with Cramer's rule
+    # in integers, so large prizes don't lose precision
+    det = ax * by - ay * bx
+    if det == 0:
+        return 0
 
-    is_verified = np.array_equal(buttons_matrix.dot(steps_int_vec), price_vec)
+    steps_a, rem_a = divmod(px * by - py * bx, det)
+    steps_b, rem_b = divmod(ax * py - ay * px, det)
 
-    if is_verified:
-        return PRICE_A * round(steps_a) + PRICE_B * round(steps_b)
+    if rem_a == 0 and rem_b == 0:
+        return PRICE_A * steps_a + PRICE_B * steps_b
     else:
         return 0
 
@@ -3,12 +3,17 @@ from enum import IntEnum
 from functools import reduce
 from operator import mul
 import re
+from statistics import pvariance
 from typing import Counter, List, Optional, Set, Tuple
 import typing
 
+from utils.cycles import combine_cycles, find_cycle
+
 BOARD_SIZE = (101, 103)
 TEST_BOARD_SIZE = (11, 7)
 TIME = 100
+TREE_PATTERN = "########"
+OUT_FILE_NAME = "src/advent_of_code_2024/day14/out.txt"
 
 Pos = Tuple[int, int]
 
@@ -82,21 +87,60 @@ def move(pos: int, velocity: int, board_size: int, time: int) -> int:
 
 
 def solve_part2(input: List[str], board_size: Tuple[int, int]) -> int:
+    # x and y coordinates repeat on their own, so the tree frame is taken where
+    # both are the most clustered and the two times are combined with the CRT.
+    # Runtime: O(R * (W + H)) instead of scanning up to W * H frames
     robots = parse(input)
 
-    out_file_name = "src/advent_of_code_2024/day14/out.txt"
-    with open(out_file_name, "w") as file:
-        for time in range(0, 10000):
-            curr_robots = [move_robot(robot, board_size, time) for robot in robots]
-            board_str = display_board(time, curr_robots, board_size)
+    combined = combine_cycles(
+        clustered_time(robots, board_size, axis) for axis in range(2)
+    )
+    if combined is not None:
+        time, _ = combined
+        if write_tree_frame(time, robots, board_size):
+            return time
 
-            if "########" in board_str:
-                file.write(board_str)
-                return time
+    for time in range(0, 10000):
+        if write_tree_frame(time, robots, board_size):
+            return time
 
     return 0
 
 
+def clustered_time(
+    robots: List[Robot], board_size: Tuple[int, int], axis: int
+) -> Tuple[int, int]:
+    # (time, period) of the smallest spread of the robots along `axis`
+    size = board_size[axis]
+    velocities = [robot.velocity[axis] for robot in robots]
+
+    def step(coords: Tuple[int, ...]) -> Tuple[int, ...]:
+        return tuple((c + v) % size for c, v in zip(coords, velocities))
+
+    coords = tuple(robot.pos[axis] for robot in robots)
+    # Moving every robot is reversible, so the cycle starts right away
+    _, period = find_cycle(coords, step)
+
+    spreads = []
+    for _ in range(period):
+        spreads.append(pvariance(coords))
+        coords = step(coords)
+    return (spreads.index(min(spreads)), period)
+
+
+def write_tree_frame(
+    time: int, robots: List[Robot], board_size: Tuple[int, int]
+) -> bool:
+    curr_robots = [move_robot(robot, board_size, time) for robot in robots]
+    board_str = display_board(time, curr_robots, board_size)
+    if TREE_PATTERN not in board_str:
+        return False
+
+    with open(OUT_FILE_NAME, "w") as file:
+        file.write(board_str)
+    return True
+
+
 def display_board(time: int, robots: List[Robot], board_size: Tuple[int, int]) -> str:
     robots_positions = {robot.pos for robot in robots}
 
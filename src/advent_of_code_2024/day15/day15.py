@@ -2,13 +2,12 @@ from collections import deque
 from dataclasses import dataclass
 from enum import StrEnum
 import time
-from typing import Collection, Deque, Dict, List, Tuple
+from typing import Collection, Deque, List, Tuple
 
-from more_itertools import first, flatten
+from utils.grid import Grid
 
-
-Board = List[List[str]]
-Pos = Tuple[int, int]
+Board = Grid
+Pos = int
 
 
 @dataclass
@@ -27,14 +26,6 @@ class MoveType(StrEnum):
     DOWN = "v"
 
 
-MOVE_TYPE_TO_POS_INC: Dict[MoveType, Tuple[int, int]] = {
-    MoveType.LEFT: (0, -1),
-    MoveType.RIGHT: (0, 1),
-    MoveType.UP: (-1, 0),
-    MoveType.DOWN: (1, 0),
-}
-
-
 ROBOT_CELL = "@"
 BOX_CELL = "O"
 WALL_CELL = "#"
@@ -42,8 +33,15 @@ EMPTY_CELL = "."
 LARGE_BOX_LEFT_CELL = "["
 LARGE_BOX_RIGHT_CELL = "]"
 
-LARGE_BOX_CELLS = {LARGE_BOX_LEFT_CELL, LARGE_BOX_RIGHT_CELL}
-BLOCKED_CELLS = {WALL_CELL, ROBOT_CELL}
+ROBOT = ord(ROBOT_CELL)
+BOX = ord(BOX_CELL)
+WALL = ord(WALL_CELL)
+EMPTY = ord(EMPTY_CELL)
+LARGE_BOX_LEFT = ord(LARGE_BOX_LEFT_CELL)
+LARGE_BOX_RIGHT = ord(LARGE_BOX_RIGHT_CELL)
+
+LARGE_BOX_CELLS = {LARGE_BOX_LEFT, LARGE_BOX_RIGHT}
+BLOCKED_CELLS = {WALL, ROBOT}
 
 
 def main() -> None:
@@ -80,76 +78,77 @@ def run_all_moves(move_types: List[MoveType], board: Board):
 
 
 def move_robot(robot_pos: Pos, move_type: MoveType, board: Board) -> Pos:
-    i, j = robot_pos
-    next_i, next_j = next_move_pos(robot_pos, move_type)
+    cells = board.cells
+    next_pos = next_move_pos(robot_pos, move_type, board)
 
-    if board[next_i][next_j] == BOX_CELL:
-        move_box((next_i, next_j), move_type, board)
+    if cells[next_pos] == BOX:
+        move_box(next_pos, move_type, board)
 
-    if board[next_i][next_j] in (LARGE_BOX_LEFT_CELL, LARGE_BOX_RIGHT_CELL):
-        move_large_box((next_i, next_j), move_type, board)
+    if cells[next_pos] in (LARGE_BOX_LEFT, LARGE_BOX_RIGHT):
+        move_large_box(next_pos, move_type, board)
 
-    if board[next_i][next_j] == EMPTY_CELL:
-        board[i][j] = EMPTY_CELL
-        board[next_i][next_j] = ROBOT_CELL
-        return (next_i, next_j)
+    if cells[next_pos] == EMPTY:
+        cells[robot_pos] = EMPTY
+        cells[next_pos] = ROBOT
+        return next_pos
 
     return robot_pos
 
 
 def move_box(pos: Pos, move_type: MoveType, board: Board):
-    i, j = pos
-    if board[i][j] != BOX_CELL:
+    cells = board.cells
+    if cells[pos] != BOX:
         return
 
-    next_i, next_j = next_move_pos(pos, move_type)
-    if board[next_i][next_j] == BOX_CELL:
-        move_box((next_i, next_j), move_type, board)
+    next_pos = next_move_pos(pos, move_type, board)
+    if cells[next_pos] == BOX:
+        move_box(next_pos, move_type, board)
 
-    if board[next_i][next_j] == EMPTY_CELL:
-        board[i][j] = EMPTY_CELL
-        board[next_i][next_j] = BOX_CELL
+    if cells[next_pos] == EMPTY:
+        cells[pos] = EMPTY
+        cells[next_pos] = BOX
 
 
 def move_large_box(pos: Pos, move_type: MoveType, board: Board):
+    cells = board.cells
     moves_queue: Deque[Move] = deque()
     simulate_large_box_move(pos, move_type, board, moves_queue)
 
     for move in moves_queue:
-        (i, j), (new_i, new_j) = move.to_tuple()
+        old_pos, new_pos = move.to_tuple()
 
-        assert board[i][j] in (
-            LARGE_BOX_LEFT_CELL,
-            LARGE_BOX_RIGHT_CELL,
-        ), f"Can't move non-box cell '{board[i][j]}': ({i}, {j})"
+        assert cells[old_pos] in (
+            LARGE_BOX_LEFT,
+            LARGE_BOX_RIGHT,
+        ), f"Can't move non-box cell '{chr(cells[old_pos])}': {board.position(old_pos)}"
         assert (
-            board[new_i][new_j] == EMPTY_CELL
-        ), f"Can't move to not empty cell 'board[new_i][new_j]': ({i}, {j})"
+            cells[new_pos] == EMPTY
+        ), f"Can't move to not empty cell: {board.position(new_pos)}"
 
-        board[new_i][new_j] = board[i][j]
-        board[i][j] = EMPTY_CELL
+        cells[new_pos] = cells[old_pos]
+        cells[old_pos] = EMPTY
 
 
 def simulate_large_box_move(
     pos: Pos, move_type: MoveType, board: Board, moves_queue: Deque[Move]
 ):
-    i, j = pos
-    if board[i][j] == EMPTY_CELL:
+    cells = board.cells
+    if cells[pos] == EMPTY:
         return
-    if board[i][j] not in (LARGE_BOX_LEFT_CELL, LARGE_BOX_RIGHT_CELL):
+    if cells[pos] not in (LARGE_BOX_LEFT, LARGE_BOX_RIGHT):
         return
-    if board[i][j] == LARGE_BOX_RIGHT_CELL:
-        simulate_large_box_move((i, j - 1), move_type, board, moves_queue)
+    if cells[pos] == LARGE_BOX_RIGHT:
+        simulate_large_box_move(pos - 1, move_type, board, moves_queue)
         return
 
-    next_pos_left = next_move_pos((i, j), move_type)
-    next_pos_right = next_move_pos((i, j + 1), move_type)
+    next_pos_left = next_move_pos(pos, move_type, board)
+    next_pos_right = next_move_pos(pos + 1, move_type, board)
     if move_type == MoveType.LEFT:
-        if board[next_pos_left[0]][next_pos_left[1]] in BLOCKED_CELLS:
+        if cells[next_pos_left] in BLOCKED_CELLS:
             moves_queue.clear()
             return
 
-        if board[next_pos_left[0]][next_pos_left[1]] in LARGE_BOX_CELLS:
+        if cells[next_pos_left] in LARGE_BOX_CELLS:
             simulate_large_box_move(next_pos_left, move_type, board, moves_queue)
             if not moves_queue:
                 return
@@ -157,23 +156,23 @@ def simulate_large_box_move(
         append_if_not_exist(
             moves_queue,
             Move(
-                old_pos=(i, j),
+                old_pos=pos,
                 new_pos=next_pos_left,
             ),
         )
         append_if_not_exist(
             moves_queue,
             Move(
-                old_pos=(i, j + 1),
+                old_pos=pos + 1,
                 new_pos=next_pos_right,
             ),
         )
     elif move_type == MoveType.RIGHT:
-        if board[next_pos_right[0]][next_pos_right[1]] in BLOCKED_CELLS:
+        if cells[next_pos_right] in BLOCKED_CELLS:
             moves_queue.clear()
             return
 
-        if board[next_pos_right[0]][next_pos_right[1]] in LARGE_BOX_CELLS:
+        if cells[next_pos_right] in LARGE_BOX_CELLS:
             simulate_large_box_move(next_pos_right, move_type, board, moves_queue)
             if not moves_queue:
                 return
@@ -181,26 +180,26 @@ def simulate_large_box_move(
         append_if_not_exist(
             moves_queue,
             Move(
-                old_pos=(i, j + 1),
+                old_pos=pos + 1,
                 new_pos=next_pos_right,
             ),
         )
         append_if_not_exist(
             moves_queue,
             Move(
-                old_pos=(i, j),
+                old_pos=pos,
                 new_pos=next_pos_left,
             ),
         )
     elif move_type in (MoveType.UP, MoveType.DOWN):
         if (
-            board[next_pos_left[0]][next_pos_left[1]] in BLOCKED_CELLS
-            or board[next_pos_right[0]][next_pos_right[1]] in BLOCKED_CELLS
+            cells[next_pos_left] in BLOCKED_CELLS
+            or cells[next_pos_right] in BLOCKED_CELLS
         ):
             moves_queue.clear()
             return
 
-        if board[next_pos_left[0]][next_pos_left[1]] in LARGE_BOX_CELLS:
+        if cells[next_pos_left] in LARGE_BOX_CELLS:
             left_move_stack: Deque[Move] = deque()
             simulate_large_box_move(next_pos_left, move_type, board, left_move_stack)
             if not left_move_stack:
@@ -208,7 +207,7 @@ def simulate_large_box_move(
                 return
             extend_if_not_exist(moves_queue, left_move_stack)
 
-        if board[next_pos_right[0]][next_pos_right[1]] == LARGE_BOX_LEFT_CELL:
+        if cells[next_pos_right] == LARGE_BOX_LEFT:
             right_move_stack: Deque[Move] = deque()
             simulate_large_box_move(next_pos_right, move_type, board, right_move_stack)
             if not right_move_stack:
@@ -219,14 +218,14 @@ def simulate_large_box_move(
         append_if_not_exist(
             moves_queue,
             Move(
-                old_pos=(i, j),
+                old_pos=pos,
                 new_pos=next_pos_left,
             ),
         )
         append_if_not_exist(
             moves_queue,
             Move(
-                old_pos=(i, j + 1),
+                old_pos=pos + 1,
                 new_pos=next_pos_right,
             ),
         )
@@ -242,50 +241,60 @@ def extend_if_not_exist(queue: Deque[Move], moves: Collection[Move]):
         append_if_not_exist(queue, move)
 
 
-def next_move_pos(pos: Pos, move_type: MoveType) -> Pos:
-    pos_inc = MOVE_TYPE_TO_POS_INC[move_type]
-    return (pos[0] + pos_inc[0], pos[1] + pos_inc[1])
+def next_move_pos(pos: Pos, move_type: MoveType, board: Board) -> Pos:
+    return pos + move_type_step(move_type, board)
+
+
+def move_type_step(move_type: MoveType, board: Board) -> int:
+    if move_type == MoveType.LEFT:
+        return board.left
+    if move_type == MoveType.RIGHT:
+        return board.right
+    if move_type == MoveType.UP:
+        return board.up
+    return board.down
 
 
 def find_robot_pos(board: Board) -> Pos:
-    return first(
-        (i, j)
-        for i in range(len(board))
-        for j in range(len(board[0]))
-        if board[i][j] == ROBOT_CELL
-    )
+    pos = board.find(ROBOT_CELL)
+    if pos is None:
+        raise AssertionError("No robot on the board")
+    return pos
 
 
 def board_score(board: Board) -> int:
     return sum(
         100 * i + j
-        for i in range(len(board))
-        for j in range(len(board[0]))
-        if board[i][j] in (BOX_CELL, LARGE_BOX_LEFT_CELL)
+        for i, j in map(
+            board.position,
+            board.find_all(BOX_CELL) + board.find_all(LARGE_BOX_LEFT_CELL),
+        )
     )
 
 
 def build_extended_board(board: Board) -> Board:
-    return [list(flatten([build_extended_cell(cell) for cell in row])) for row in board]
+    return Grid.from_lines(
+        ["".join(build_extended_cell(cell) for cell in row) for row in board.to_lines()]
+    )
 
 
-def build_extended_cell(cell: str) -> List[str]:
+def build_extended_cell(cell: str) -> str:
     if cell == WALL_CELL:
-        return [WALL_CELL, WALL_CELL]
+        return WALL_CELL + WALL_CELL
     elif cell == BOX_CELL:
-        return [LARGE_BOX_LEFT_CELL, LARGE_BOX_RIGHT_CELL]
+        return LARGE_BOX_LEFT_CELL + LARGE_BOX_RIGHT_CELL
     elif cell == ROBOT_CELL:
-        return [ROBOT_CELL, EMPTY_CELL]
+        return ROBOT_CELL + EMPTY_CELL
     else:
-        return [EMPTY_CELL, EMPTY_CELL]
+        return EMPTY_CELL + EMPTY_CELL
 
 
 def copy_board(board: Board) -> Board:
-    return [row.copy() for row in board]
+    return board.copy()
 
 
 def print_board(board: Board):
-    print("\n".join("".join(e for e in row) for row in board))
+    print(board)
     print()
 
 
@@ -293,7 +302,7 @@ def parse(input: List[str]) -> Tuple[Board, List[MoveType]]:
     break_idx = input.index("")
 
     return (
-        [[ch for ch in row] for row in input[0:break_idx]],
+        Grid.from_lines(input[0:break_idx]),
         [MoveType(ch) for ch in "".join(input[break_idx:])],
     )
 
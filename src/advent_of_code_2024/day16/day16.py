@@ -1,15 +1,12 @@
-from collections import defaultdict
 from enum import StrEnum
-from queue import PriorityQueue
-from typing import Dict, List, Tuple
+from typing import Dict, List, Set, Tuple
 
-from more_itertools import first
+from utils.grid import Grid
+from utils.shortest_path import ShortestPaths, find_shortest_paths
 
-from utils.utils import flatten
-
-
-Board = List[str]
-Pos = Tuple[int, int]
+Board = Grid
+Pos = int
+State = Tuple[Pos, "Direction"]
 
 
 class Direction(StrEnum):
@@ -19,13 +16,6 @@ class Direction(StrEnum):
     UP = "^"
 
 
-DIRECTION_TO_POS_INC: Dict[Direction, Pos] = {
-    Direction.RIGHT: (0, +1),
-    Direction.LEFT: (0, -1),
-    Direction.DOWN: (+1, 0),
-    Direction.UP: (-1, 0),
-}
-
 OPPOSITE_DIRECTION: Dict[Direction, Direction] = {
     Direction.RIGHT: Direction.LEFT,
     Direction.LEFT: Direction.RIGHT,
@@ -33,12 +23,15 @@ OPPOSITE_DIRECTION: Dict[Direction, Direction] = {
     Direction.UP: Direction.DOWN,
 }
 
+WALL = ord("#")
+
 
 def main() -> None:
     input = read_input("src/advent_of_code_2024/day16/input.txt")
+    board = parse_board(input)
 
-    print(f"1 -> {solve_part1(input)}")
-    print(f"2 -> {solve_part2(input)}")
+    print(f"1 -> {solve_part1(board)}")
+    print(f"2 -> {solve_part2(board)}")
 
 
 def solve_part1(board: Board) -> int:
@@ -47,53 +40,48 @@ def solve_part1(board: Board) -> int:
 
 
 def solve_part2(board: Board) -> int:
-    _, paths = find_best_paths(board)
-    unique_pos = set(flatten(paths))
+    _, best_states = find_best_paths(board)
+    unique_pos = {pos for pos, _ in best_states}
     return len(unique_pos)
 
 
-def find_best_paths(board: Board) -> Tuple[int, List[List[Pos]]]:
-    visited: Dict[Tuple[Pos, Direction], int] = defaultdict(int)
-
-    start_pos = find_pos(board, "S")
-    end_pos = find_pos(board, "E")
-
-    moves_pq: PriorityQueue[Tuple[int, Pos, Direction, List[Pos]]] = PriorityQueue()
-    moves_pq.put((0, start_pos, Direction.LEFT, [start_pos]))
-
-    final_paths: List[Tuple[int, List[Pos]]] = []
-
-    while not moves_pq.empty():
-        score, (i, j), direction, path = moves_pq.get()
-
-        if (i, j) == end_pos:
-            final_paths.append((score, path))
-            continue
-
-        if ((i, j), direction) in visited and score > visited[((i, j), direction)]:
-            continue
-
-        visited[((i, j), direction)] = score
-
-        for next_direction, (i_inc, j_inc) in DIRECTION_TO_POS_INC.items():
-            next_i, next_j = i + i_inc, j + j_inc
-            if is_valid_position((next_i, next_j), board) and board[next_i][next_j] in (
-                ".",
-                "E",
-                "S",
-            ):
-                next_score = score + get_score_inc(direction, next_direction)
-                new_path = path + [(next_i, next_j)]
-                moves_pq.put((next_score, (next_i, next_j), next_direction, new_path))
-
-    min_score = min(score for score, _ in final_paths)
-    best_paths = [path for score, path in final_paths if score == min_score]
-    return (min_score, best_paths)
-
+def find_best_paths(board: Board) -> Tuple[int, Set[State]]:
+    # Returns the best score and all states lying on best paths
+    cells = board.cells
+    start_pos = board.find("S")
+    end_pos = board.find("E")
+    if start_pos is None or end_pos is None:
+        raise AssertionError("No start or end on the board")
+
+    direction_steps: Dict[Direction, int] = {
+        Direction.RIGHT: board.right,
+        Direction.LEFT: board.left,
+        Direction.DOWN: board.down,
+        Direction.UP: board.up,
+    }
+
+    def neighbours(state: State) -> List[Tuple[State, int]]:
+        pos, direction = state
+        if pos == end_pos:
+            return []
+        return [
+            ((pos + step, next_direction), get_score_inc(direction, next_direction))
+            for next_direction, step in direction_steps.items()
+            if cells[pos + step] not in (WALL, board.border)
+        ]
+
+    paths: ShortestPaths[State] = find_shortest_paths(
+        [((start_pos, Direction.LEFT), 0)], neighbours, all_parents=True
+    )
 
-def is_valid_position(pos: Pos, board: List[str]) -> bool:
-    i, j = pos
-    return i >= 0 and i < len(board) and j >= 0 and j < len(board[i])
+    end_states = [
+        (end_pos, direction)
+        for direction in Direction
+        if (end_pos, direction) in paths.dist
+    ]
+    min_score = min(paths.dist[state] for state in end_states)
+    best_end_states = [state for state in end_states if paths.dist[state] == min_score]
+    return (min_score, paths.states_on_paths(best_end_states))
 
 
 def get_score_inc(curr_direction: Direction, next_direction: Direction) -> int:
@@ -106,13 +94,8 @@ def get_score_inc(curr_direction: Direction, next_direction: Direction) -> int:
         return 1000 + 1
 
 
-def find_pos(board: Board, cell: str) -> Pos:
-    return first(
-        (i, j)
-        for i in range(len(board))
-        for j in range(len(board[0]))
-        if board[i][j] == cell
-    )
+def parse_board(lines: List[str]) -> Board:
+    return Grid.from_lines(lines)
 
 
 def read_input(file_name: str) -> List[str]:
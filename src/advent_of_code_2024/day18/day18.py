@@ -1,9 +1,8 @@
 from bisect import bisect_right
-from queue import PriorityQueue
 from typing import Callable, List, Optional, Set, Tuple
 
-from matplotlib.pylab import f
-
+from utils.grid import Grid
+from utils.shortest_path import find_shortest_paths
 from utils.utils import bisect_left_lambda
 
 TEST_BOARD_SIZE = (7, 7)
@@ -12,15 +11,13 @@ BOARD_SIZE = (71, 71)
 TEST_BLOCKS_COUNT = 12
 BLOCKS_COUNT = 1024
 
-Board = List[List[str]]
+Board = Grid
 Pos = Tuple[int, int]
 
-POS_INCS: List[Tuple[int, int]] = [
-    (0, 1),
-    (0, -1),
-    (1, 0),
-    (-1, 0),
-]
+BLOCK_CELL = "#"
+EMPTY_CELL = "."
+
+EMPTY = ord(EMPTY_CELL)
 
 
 def main() -> None:
@@ -67,51 +64,32 @@ def is_reachable(
 
 
 def find_shortest_path(board: Board) -> Optional[int]:
-    start_pos = (0, 0)
-    end_pos = (len(board) - 1, len(board[0]) - 1)
-
-    visited: Set[Pos] = set()
-
-    moves_pq: PriorityQueue[Tuple[int, Pos]] = PriorityQueue()
-    moves_pq.put((0, start_pos))
-
-    while not moves_pq.empty():
-        steps, (i, j) = moves_pq.get()
+    cells = board.cells
+    start_pos = board.offset((0, 0))
+    end_pos = board.offset((board.height - 1, board.width - 1))
 
-        if (i, j) == end_pos:
-            return steps
+    def neighbours(pos: int):
+        return [
+            (pos + step, 1) for step in board.directions if cells[pos + step] == EMPTY
+        ]
 
-        if (i, j) in visited:
-            continue
-
-        visited.add((i, j))
-
-        for i_inc, j_inc in POS_INCS:
-            next_i, next_j = i + i_inc, j + j_inc
-            if (
-                is_valid_position((next_i, next_j), board)
-                and board[next_i][next_j] == "."
-            ):
-                moves_pq.put((steps + 1, (next_i, next_j)))
-
-    return None
+    return find_shortest_paths(
+        [(start_pos, 0)],
+        neighbours,
+        is_target=lambda pos: pos == end_pos,
+        max_weight=1,
+    ).cost
 
 
 def create_board(board_size: Tuple[int, int], block_cells: Set[Pos]) -> Board:
-    return [
-        ["#" if (i, j) in block_cells else "." for j in range(board_size[1])]
-        for i in range(board_size[0])
-    ]
+    board = Grid(board_size[1], board_size[0], filler=EMPTY_CELL)
+    for pos in block_cells:
+        board.set(pos, BLOCK_CELL)
+    return board
 
 
 def print_board(board: Board):
-    s = "\n".join("".join(e for e in row) for row in board)
-    print(s)
-
-
-def is_valid_position(pos: Pos, board: List[List[str]]) -> bool:
-    i, j = pos
-    return i >= 0 and i < len(board) and j >= 0 and j < len(board[i])
+    print(board)
 
 
 def parse(input: List[str]) -> List[Pos]:
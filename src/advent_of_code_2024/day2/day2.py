@@ -40,6 +40,25 @@ def is_valid_report_part2(a: List[int]) -> bool:
     if len(a) <= 2:
         return True
 
+    ## O(N): only the ends of the first bad pair are worth removing
+    return any(is_valid_with_removal(a, is_asc) for is_asc in [True, False])
+
+
+def is_valid_with_removal(a: List[int], is_asc: bool) -> bool:
+    for i in range(1, len(a)):
+        if not is_valid_report_diff(a[i] - a[i - 1], is_asc):
+            return any(is_monotonic(a[0:j] + a[j + 1 :], is_asc) for j in [i - 1, i])
+    return True
+
+
+def is_monotonic(a: List[int], is_asc: bool) -> bool:
+    return all(is_valid_report_diff(a[i] - a[i - 1], is_asc) for i in range(1, len(a)))
+
+
+def is_valid_report_part2_brute_force(a: List[int]) -> bool:
+    if len(a) <= 2:
+        return True
+
     ## Brute force: O(M * N)
     return any(is_valid_report_part1(a[0:i] + a[i + 1 :]) for i in range(len(a)))
 
@@ -1,7 +1,8 @@
-from functools import cache
 from itertools import permutations, product
 from typing import Dict, List, Tuple
 
+from utils.memoize import memoize
+from utils.tracing import TRACE, trace
 
 Pos = Tuple[int, int]
 
@@ -103,7 +104,8 @@ def multi_encode_len(code: str, keypads_count: int) -> int:
     return multi_encode_directional_len(code, keypads_count)
 
 
-@cache
+# A few hundred distinct (move, depth) pairs for 25 keypads
+@memoize(max_entries=10_000)
 def multi_encode_directional_len(code: str, keypads_count: int) -> int:
     if keypads_count == 0:
         return len(code)
@@ -115,7 +117,8 @@ def multi_encode_directional_len(code: str, keypads_count: int) -> int:
         res_len += multi_encode_directional_len(directional_code, keypads_count - 1)
         start_btn = finish_btn
 
-    print(f"Code: {code} (keypads_count = {keypads_count}, res_len = {res_len})")
+    if TRACE:
+        trace(f"Code: {code} (keypads_count = {keypads_count}, res_len = {res_len})")
 
     return res_len
 
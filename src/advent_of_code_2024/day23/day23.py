@@ -1,8 +1,6 @@
-from collections import defaultdict
-from itertools import combinations
-from typing import Dict, List, Set, Tuple, cast
+from typing import List, Set, Tuple, cast
 
-AdjDict = Dict[str, Set[str]]
+from utils.graph import Graph, bits, degree_order
 
 
 def main() -> None:
@@ -13,46 +11,56 @@ def main() -> None:
 
 
 def solve_part1(input: List[str]) -> int:
-    edges = list(map(parse, input))
-    adj = build_adj_list(edges)
+    graph = Graph.from_edges(map(parse, input))
+    rows = graph.rows
 
-    groups: Set[str] = set()
-    for n1 in filter(lambda n: n.startswith("t"), adj.keys()):
-        for n2 in adj[n1]:
-            for n3 in adj[n1].intersection(adj[n2]):
-                group = ",".join(sorted([n1, n2, n3]))
-                groups.add(group)
+    groups: Set[Tuple[int, ...]] = set()
+    for n1 in range(len(graph)):
+        if not graph.names[n1].startswith("t"):
+            continue
+        for n2 in bits(rows[n1]):
+            for n3 in bits(rows[n1] & rows[n2]):
+                groups.add(tuple(sorted([n1, n2, n3])))
 
     return len(groups)
 
 
 def solve_part2(input: List[str]) -> str:
-    edges = list(map(parse, input))
-    adj = build_adj_list(edges)
-
-    full_connected_clusters: List[List[str]] = []
-    for n1 in adj.keys():
-        for n2 in adj[n1]:
-            shared_neighbors = adj[n1].intersection(adj[n2])
-
-            cluster = [n1, n2] + list(shared_neighbors)
-            if is_fully_connected(cluster, adj):
-                full_connected_clusters.append(cluster)
-
-    biggest_cluster = max(full_connected_clusters, key=len)
-    return ",".join(sorted(biggest_cluster))
-
-
-def is_fully_connected(cluster: List[str], adj: AdjDict) -> bool:
-    return all(n2 in adj[n1] for n1, n2 in combinations(cluster, 2))
-
-
-def build_adj_list(edges: List[Tuple[str, str]]) -> AdjDict:
-    adj: AdjDict = defaultdict(set)
-    for n1, n2 in edges:
-        adj[n1].add(n2)
-        adj[n2].add(n1)
-    return adj
+    graph = Graph.from_edges(map(parse, input))
+    biggest_clique = max_clique(graph)
+    return ",".join(sorted(graph.names[node] for node in biggest_clique))
+
+
+def max_clique(graph: Graph) -> List[int]:
+    # Bron-Kerbosch with pivoting over bitset rows. Every clique is searched from
+    # its first node in degeneracy order, so candidates are only later neighbours.
+    rows = graph.rows
+    best: List[int] = []
+
+    def expand(clique: List[int], candidates: int, excluded: int) -> None:
+        nonlocal best
+        if not candidates and not excluded:
+            if len(clique) > len(best):
+                best = clique
+            return
+        if len(clique) + bin(candidates).count("1") <= len(best):
+            return
+
+        pivot = max(
+            bits(candidates | excluded),
+            key=lambda n: bin(rows[n] & candidates).count("1"),
+        )
+        for node in bits(candidates & ~rows[pivot]):
+            expand(clique + [node], candidates & rows[node], excluded & rows[node])
+            candidates &= ~(1 << node)
+            excluded |= 1 << node
+
+    later = (1 << len(graph)) - 1
+    for node in degree_order(graph):
+        later &= ~(1 << node)
+        expand([node], rows[node] & later, rows[node] & ~later)
+
+    return best
 
 
 def parse(line: str) -> Tuple[str, str]:
@@ -1,9 +1,9 @@
 from dataclasses import dataclass
 from enum import StrEnum
 from itertools import product
-from typing import List
+from typing import Iterable, Iterator, List
 
-from utils.utils import split_list
+from utils.reader import iter_blocks, iter_lines
 
 Board = List[str]
 
@@ -20,17 +20,21 @@ class Schema:
 
 
 def main() -> None:
-    input = read_input("src/advent_of_code_2024/day25/input.txt")
+    input = iter_lines("src/advent_of_code_2024/day25/input.txt")
 
     print(f"1 -> {solve_part1(input)}")
 
 
-def solve_part1(input: List[str]) -> int:
-    boards = parse(input)
-    schemas = [to_schema(board) for board in boards]
+def solve_part1(input: Iterable[str]) -> int:
+    # Boards are turned into heights as they are read, so `input` can be a lazy
+    # stream of lines
+    schemas: List[Schema] = []
+    max_height = 0
+    for board in parse(input):
+        schemas.append(to_schema(board))
+        max_height = len(board) - 2
     locks = [s for s in schemas if s.type == SchemaType.LOCK]
     keys = [s for s in schemas if s.type == SchemaType.KEY]
-    max_height = len(boards[0]) - 2
 
     return sum(
         1 for lock, key in product(locks, keys) if is_match(lock, key, max_height)
@@ -66,8 +70,8 @@ def rotate(matrix: List[str]) -> List[List[str]]:
     return [[matrix[i][j] for i in range(len(matrix))] for j in range(len(matrix[0]))]
 
 
-def parse(input: List[str]) -> List[Board]:
-    return split_list(input, "")
+def parse(input: Iterable[str]) -> Iterator[Board]:
+    return iter_blocks(input)
 
 
 def read_input(file_name: str) -> List[str]:
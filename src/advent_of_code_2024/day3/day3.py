@@ -1,30 +1,32 @@
-from operator import mul
 import re
-from typing import List, Tuple
+from typing import Iterator, Tuple, Union
+
+from utils.reader import Buffer, mapped_bytes, scan
 
 LOWER_BOUND = 1
 UPPER_BOUND = 3
 
+# The puzzle text, or a memory-mapped file for inputs that don't fit in memory
+Program = Union[str, Buffer]
 
-def main() -> None:
-    input = read_input("src/advent_of_code_2024/day3/input.txt")
 
-    print(f"1 -> {solve_part1(input)}")
-    print(f"2 -> {solve_part2(input)}")
+def main() -> None:
+    with mapped_bytes("src/advent_of_code_2024/day3/input.txt") as input:
+        print(f"1 -> {solve_part1(input)}")
+        print(f"2 -> {solve_part2(input)}")
 
 
-def solve_part1(input: str) -> int:
+def solve_part1(input: Program) -> int:
     return sum(
-        pair[0] * pair[1]
-        for pair in [parse_mutliplier(mult_str) for mult_str in find_multipliers(input)]
+        pair[0] * pair[1] for pair in map(parse_mutliplier, find_multipliers(input))
     )
 
 
-def find_multipliers(input: str) -> List[str]:
-    return re.findall(r"mul\(\d+,\d+\)", input)
+def find_multipliers(input: Program) -> Iterator[str]:
+    return scan(r"mul\(\d+,\d+\)", input)
 
 
-def solve_part2(input: str) -> int:
+def solve_part2(input: Program) -> int:
     instructions = find_instructions(input)
 
     res = 0
@@ -47,8 +49,8 @@ def parse_mutliplier(input: str) -> Tuple[int, int]:
     return (int(res[0]), int(res[1]))
 
 
-def find_instructions(input: str) -> List[str]:
-    return re.findall(r"mul\(\d+,\d+\)|don\'t|do", input)
+def find_instructions(input: Program) -> Iterator[str]:
+    return scan(r"mul\(\d+,\d+\)|don\'t|do", input)
 
 
 def read_input(file_name: str) -> str:
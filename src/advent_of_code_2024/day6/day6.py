@@ -1,32 +1,15 @@
-from enum import Enum
-from typing import Dict, List, Set, Tuple
+import os
+from array import array
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
-from more_itertools import first
+from utils.grid import Grid
+from utils.tracing import TRACE, Counter
+from utils.utils import split_to_chunks
 
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
 
-class Direction(Enum):
-    RIGHT = ">"
-    LEFT = "<"
-    DOWN = "V"
-    UP = "^"
-
-
-Board = List[List[str]]
-Position = Tuple[int, int]
-
-DIRECTION_TO_POS_INC: Dict[Direction, Position] = {
-    Direction.RIGHT: (0, +1),
-    Direction.LEFT: (0, -1),
-    Direction.DOWN: (+1, 0),
-    Direction.UP: (-1, 0),
-}
-
-DIRECTION_ROTATION: Dict[Direction, Direction] = {
-    Direction.RIGHT: Direction.DOWN,
-    Direction.LEFT: Direction.UP,
-    Direction.DOWN: Direction.LEFT,
-    Direction.UP: Direction.RIGHT,
-}
+Board = Grid
 
 GUARD_CHAR = "^"
 OBSTACLE_CHAR = "#"
@@ -34,124 +17,278 @@ VISITED_CHAR = "X"
 VISITED_REPEATEDLY_CHAR = "O"
 EMPTY_CHAR = "."
 
+OBSTACLE = ord(OBSTACLE_CHAR)
+VISITED = ord(VISITED_CHAR)
+
 
 def main() -> None:
     board = read_input("src/advent_of_code_2024/day6/input.txt")
-    print(f"1 -> {solve_part1(deep_copy_board(board))}")
-    print(f"2 -> {solve_part2(deep_copy_board(board))}")
+    print(f"1 -> {solve_part1(board.copy())}")
+    print(f"2 -> {solve_part2(board.copy())}")
 
 
 def solve_part1(board: Board) -> int:
     run_simulation(board)
 
-    return sum(
-        1
-        for i in range(len(board))
-        for j in range(len(board[0]))
-        if board[i][j] == VISITED_CHAR
-    )
+    return board.count(VISITED_CHAR)
 
 
-def solve_part2(board: Board) -> int:
-    original_board = deep_copy_board(board)
+def solve_part2(board: Board, workers: Optional[int] = None) -> int:
+    # Every candidate is checked by jumping from turn to turn, starting where the
+    # guard was just before first walking into it: the path up to there doesn't
+    # change when the obstacle is added. Checks are independent, so big inputs
+    # spread them over `workers` processes (all CPUs by default).
+    # Runtime: O(H * W + C * T), C - candidates, T - turns until a loop or exit
+    jumps = build_jumps(board)
+    entries = list(find_first_entries(board).items())
+    LOOP_CHECKS.reset(total=len(entries))
+
+    chunks = split_to_chunks(entries, CANDIDATES_PER_CHUNK)
+    workers = min(
+        workers or os.cpu_count() or 1, len(entries) // MIN_CANDIDATES_PER_WORKER
+    )
+    if workers > 1:
+        counts = count_loops_parallel(board, jumps, chunks, workers)
+    else:
+        counts = (count_loops(board, jumps, chunk) for chunk in chunks)
+
+    # `counts` first, so that zip exhausts it and the workers are shut down
+    res = 0
+    for count, chunk in zip(counts, chunks):
+        if TRACE:
+            LOOP_CHECKS(len(chunk))
+        res += count
+    return res
+
+
+def solve_part2_brute_force(board: Board) -> int:
+    original_board = board.copy()
+    guard_pos = find_guard(board)
     run_simulation(board)
 
-    # bruite force (1 min execution)
+    candidates = [pos for pos in board.find_all(VISITED_CHAR) if pos != guard_pos]
     return sum(
-        1
-        for i in range(len(board))
-        for j in range(len(board[0]))
-        if board[i][j] == VISITED_CHAR
-        and original_board[i][j] != GUARD_CHAR
-        and does_create_loop(original_board, (i, j))
+        1 for pos in candidates if does_create_loop_brute_force(original_board, pos)
     )
 
 
-VERIFICATION_COUNTER = 0
+LOOP_CHECKS = Counter("2024 day6 loop checks", every=1000)
+
+# Checks per task sent to a worker, and the fewest candidates worth a process.
+# A check takes 20-100 us and starting a pool 0.1-0.3 s, so a worker needs
+# seconds of checks to pay off: puzzle inputs (~5000 candidates) stay in one
+# process.
+CANDIDATES_PER_CHUNK = 250
+MIN_CANDIDATES_PER_WORKER = 25_000
 
+# (position, (guard position, guard direction)) of a candidate obstacle
+Candidate = Tuple[int, Tuple[int, int]]
+Jumps = Sequence[Sequence[int]]
 
-def does_create_loop(original_board: Board, pos: Position) -> bool:
-    global VERIFICATION_COUNTER
-    VERIFICATION_COUNTER += 1
-    print(f"Counter: {VERIFICATION_COUNTER}")
 
-    board = deep_copy_board(original_board)
-    (i, j) = pos
+def count_loops(board: Board, jumps: Jumps, candidates: List[Candidate]) -> int:
+    return sum(
+        1
+        for obstacle, (pos, direction) in candidates
+        if does_create_loop(board, jumps, obstacle, pos, direction)
+    )
+
 
-    board[i][j] = OBSTACLE_CHAR
+def count_loops_parallel(
+    board: Board, jumps: List[array], chunks: List[List[Candidate]], workers: int
+) -> Iterator[int]:
+    # Loop counts of `chunks` in order. Workers read the board cells and the jump
+    # table from one shared memory block instead of unpickling copies of them;
+    # only candidates and counts travel between processes.
+    # Imported here, multiprocessing would double the module's import time.
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing.shared_memory import SharedMemory
+
+    cells_size = len(board.cells)
+    jumps_start, jumps_end = shared_jumps_range(cells_size)
+    shared = SharedMemory(create=True, size=jumps_end)
+    buf = shared.buf
+    assert buf is not None
+    try:
+        buf[:cells_size] = board.cells
+        buf[jumps_start:jumps_end] = b"".join(j.tobytes() for j in jumps)
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=attach_shared_board,
+            initargs=(shared.name, board.width, board.height, board.border),
+        ) as executor:
+            yield from executor.map(count_loops_in_worker, chunks)
+    finally:
+        shared.close()
+        shared.unlink()
+
+
+# Set up in each worker process by `attach_shared_board`
+_shared: Optional[Tuple["SharedMemory", Board, Jumps]] = None
+
+
+def attach_shared_board(name: str, width: int, height: int, border: int) -> None:
+    from multiprocessing.shared_memory import SharedMemory
+
+    global _shared
+    shared = SharedMemory(name)
+    buf = shared.buf
+    assert buf is not None
+    board = Grid(width, height, border=chr(border))
+    cells_size = len(board.cells)
+    board.cells = buf[:cells_size]  # type: ignore[assignment]
+
+    jumps_start, jumps_end = shared_jumps_range(cells_size)
+    table = buf[jumps_start:jumps_end].cast("l")
+    jumps = [table[i * cells_size : (i + 1) * cells_size] for i in range(4)]
+    _shared = (shared, board, jumps)
+
+
+def shared_jumps_range(cells_size: int) -> Tuple[int, int]:
+    # The jump table follows the cells in the shared block, aligned for its items
+    itemsize = array("l").itemsize
+    start = (cells_size + itemsize - 1) // itemsize * itemsize
+    return (start, start + 4 * cells_size * itemsize)
+
+
+def count_loops_in_worker(candidates: List[Candidate]) -> int:
+    assert _shared is not None
+    _, board, jumps = _shared
+    return count_loops(board, jumps, candidates)
+
+
+def does_create_loop(
+    board: Board, jumps: Jumps, obstacle: int, pos: int, direction: int
+) -> bool:
+    # Follows the jump table from `pos` with an extra obstacle: a jump that passes
+    # it stops on the cell before it instead.
+    border = board.border
+    cells = board.cells
+    steps = board.directions
+
+    seen: Set[int] = set()
+    while True:
+        step = steps[direction]
+        target = jumps[direction][pos]
+        distance = (obstacle - pos) // step
+        if pos + distance * step == obstacle and 0 < distance <= (target - pos) // step:
+            target = obstacle - step
+
+        if cells[target] == border:
+            return False
+
+        state = target * 4 + direction
+        if state in seen:
+            return True
+        seen.add(state)
+
+        pos = target
+        direction = (direction + 1) % 4
+
+
+def does_create_loop_brute_force(original_board: Board, pos: int) -> bool:
+    board = original_board.copy()
+    board.cells[pos] = OBSTACLE
 
     return run_simulation(board)
 
 
+def build_jumps(board: Board) -> List[array]:
+    # jumps[direction][pos] - where the guard walking from `pos` in `direction`
+    # stops: the cell before the next obstacle, or the border cell it walks onto
+    cells = board.cells
+    border = board.border
+
+    jumps: List[array] = []
+    for step in board.directions:
+        jump = array("l", range(len(cells)))
+        # Cells closer to the border in `direction` come first
+        order = range(len(cells)) if step < 0 else range(len(cells) - 1, -1, -1)
+        for pos in order:
+            if cells[pos] == border or cells[pos] == OBSTACLE:
+                continue
+            next_pos = pos + step
+            if cells[next_pos] == border:
+                jump[pos] = next_pos
+            elif cells[next_pos] != OBSTACLE:
+                jump[pos] = jump[next_pos]
+        jumps.append(jump)
+    return jumps
+
+
+def find_first_entries(board: Board) -> Dict[int, Tuple[int, int]]:
+    # Cells on the guard's path except the start, each with the guard's
+    # (position, direction) right before it first steps onto it. The walk stops
+    # when the guard leaves or, on maps where it already loops, repeats a state.
+    cells = board.cells
+    steps = board.directions
+    border = board.border
+
+    guard_pos = find_guard(board)
+    pos = guard_pos
+    direction = 0  # up
+    visited = bytearray(len(cells))
+
+    res: Dict[int, Tuple[int, int]] = {}
+    while True:
+        next_pos = pos + steps[direction]
+        while cells[next_pos] == OBSTACLE:
+            direction = (direction + 1) % 4
+            next_pos = pos + steps[direction]
+        if cells[next_pos] == border or visited[pos] & (1 << direction):
+            return res
+        visited[pos] |= 1 << direction
+
+        if next_pos != guard_pos and next_pos not in res:
+            res[next_pos] = (pos, direction)
+        pos = next_pos
+
+
+def find_guard(board: Board) -> int:
+    pos = board.find(GUARD_CHAR)
+    if pos is None:
+        raise AssertionError("No guard on the board")
+    return pos
+
+
 def run_simulation(board: Board) -> bool:
     # Returns whether the guard looped
     # Modifies the board
 
-    (i, j) = find_guard(board)
-    direction = Direction.UP
+    cells = board.cells
+    steps = board.directions
+    border = board.border
 
-    visited: Set[Tuple[Position, Direction]] = set()
+    pos = find_guard(board)
+    direction = 0  # up
 
-    while is_valid_position((i, j), board):
-        if ((i, j), direction) in visited:
+    # Bit mask of directions the guard had when leaving each cell
+    visited = bytearray(len(cells))
+
+    while cells[pos] != border:
+        if visited[pos] & (1 << direction):
             return True  # Loop
 
-        visited.add(((i, j), direction))
-        board[i][j] = VISITED_CHAR
+        visited[pos] |= 1 << direction
+        cells[pos] = VISITED
 
-        (next_i, next_j) = next_pos((i, j), direction)
+        next_pos = pos + steps[direction]
 
-        while (
-            is_valid_position((next_i, next_j), board)
-            and board[next_i][next_j] == OBSTACLE_CHAR
-        ):
-            direction = DIRECTION_ROTATION[direction]
-            (next_i, next_j) = next_pos((i, j), direction)
+        while cells[next_pos] == OBSTACLE:
+            direction = (direction + 1) % 4
+            next_pos = pos + steps[direction]
 
-        (i, j) = (next_i, next_j)
+        pos = next_pos
 
-        # print_board(board)
+        # print(board)
 
     return False
 
 
-def next_pos(pos: Position, direction: Direction) -> Position:
-    (i, j) = pos
-    (i_inc, j_inc) = DIRECTION_TO_POS_INC[direction]
-    return (i + i_inc, j + j_inc)
-
-
-def find_guard(board: Board) -> Position:
-    return first(
-        (i, j)
-        for i in range(len(board))
-        for j in range(len(board[0]))
-        if board[i][j] == GUARD_CHAR
-    )
-
-
-def print_board(board: Board):
-    s = "\n".join("".join(e for e in row) for row in board)
-    print(s)
-    print()
-
-
-def is_valid_position(pos: Position, board: Board) -> bool:
-    return (
-        pos[0] >= 0
-        and pos[0] < len(board)
-        and pos[1] >= 0
-        and pos[1] < len(board[pos[0]])
-    )
-
-
-def deep_copy_board(board: Board) -> Board:
-    return [row.copy() for row in board]
-
-
 def read_input(file_name: str) -> Board:
     with open(file_name) as f:
-        return [[ch for ch in line.strip()] for line in f]
+        return Grid.from_lines([line.strip() for line in f])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,57 @@
+import concurrent.futures
+import os
+from multiprocessing import shared_memory
+
+import pytest
+
+from advent_of_code_2024.day6 import day6
+from advent_of_code_2024.day6.day6 import read_input, solve_part2
+
+TEST_INPUT = os.path.join(os.path.dirname(__file__), "..", "test.txt")
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    # Sends even the test input through the process pool
+    monkeypatch.setattr(day6, "MIN_CANDIDATES_PER_WORKER", 1)
+    monkeypatch.setattr(day6, "CANDIDATES_PER_CHUNK", 7)
+
+
+def test_solve_part2_parallel(small_chunks, monkeypatch):
+    pool_calls = []
+    count_loops_parallel = day6.count_loops_parallel
+
+    def spy(*args):
+        pool_calls.append(args[-1])
+        return count_loops_parallel(*args)
+
+    monkeypatch.setattr(day6, "count_loops_parallel", spy)
+
+    board = read_input(TEST_INPUT)
+    serial = solve_part2(board.copy(), workers=1)
+    assert pool_calls == []
+    assert solve_part2(board.copy(), workers=3) == serial == 6
+    assert pool_calls == [3]
+
+
+def test_solve_part2_parallel_unlinks_shared_memory_on_error(small_chunks, monkeypatch):
+    names = []
+
+    class RecordingSharedMemory(shared_memory.SharedMemory):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            names.append(self.name)
+
+    class FailingExecutor(concurrent.futures.ProcessPoolExecutor):
+        def map(self, *args, **kwargs):
+            raise RuntimeError("worker failed")
+
+    monkeypatch.setattr(shared_memory, "SharedMemory", RecordingSharedMemory)
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", FailingExecutor)
+
+    with pytest.raises(RuntimeError):
+        solve_part2(read_input(TEST_INPUT), workers=3)
+
+    assert len(names) == 1
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(names[0])
@@ -1,7 +1,11 @@
+from collections import defaultdict
 from enum import Enum
-from functools import cache, reduce
+from functools import reduce
 from io import UnsupportedOperation
-from typing import List, TypedDict
+from typing import Callable, Dict, List, TypedDict
+
+from utils.memoize import memoize
+from utils.tracing import TRACE, Counter
 
 
 class Equation(TypedDict):
@@ -34,35 +38,159 @@ def main() -> None:
     print(f"2 -> {solve_part2(input)}")
 
 
-def solve_part1(input: List[str]) -> int:
-    ## Brute force solution: O(Lines * N * 2^N)
+def solve_part1(input: List[str], strategy: str = "backward") -> int:
+    ## Backward search from the result, worst case O(Lines * N * 2^N)
     equations = list(map(parse, input))
-    return solve(equations, "short_ops_universe")
+    return solve(equations, "short_ops_universe", strategy)
 
 
-def solve_part2(input: List[str]) -> int:
-    ## Brute force solution: O(Lines * N * 3^N)
+def solve_part2(input: List[str], strategy: str = "backward") -> int:
+    ## Backward search from the result, worst case O(Lines * N * 3^N)
     equations = list(map(parse, input))
-    return solve(equations, "long_ops_universe")
+    return solve(equations, "long_ops_universe", strategy)
+
 
+def solve(
+    equations: List[Equation], ops_universe_name: str, strategy: str = "backward"
+) -> int:
+    # `strategy` is one of STRATEGIES, "numpy" checks all equations in batches
+    if strategy == "numpy":
+        valid = find_valid_equations_numpy(equations, ops_universe_name)
+    else:
+        check = STRATEGIES[strategy]
+        EQUATION_CHECKS.reset(total=len(equations))
+        valid = [check(equation, ops_universe_name) for equation in equations]
 
-def solve(equations: List[Equation], ops_universe_name: str) -> int:
     return sum(
-        map(
-            lambda e: e["result"],
-            filter(lambda eq: is_valid_equation(eq, ops_universe_name), equations),
-        )
+        equation["result"] for equation, is_valid in zip(equations, valid) if is_valid
     )
 
 
-DEBUG_COUNTER = 0
+EQUATION_CHECKS = Counter("2024 day7 equations", every=50)
+
+INT64_LIMIT = 2**63
 
 
 def is_valid_equation(equation: Equation, ops_universe_name: str) -> bool:
-    global DEBUG_COUNTER
-    DEBUG_COUNTER += 1
-    print(f"{DEBUG_COUNTER} - len: {len(equation['args'])}")
+    # Undoes operations from the last argument: a value is only reachable through
+    # `+` if it is at least the argument, through `*` if the argument divides it
+    # and through `||` if it ends with the argument's digits. Almost every branch
+    # fails one of these checks right away, so a line takes about O(N) steps.
+    if TRACE:
+        EQUATION_CHECKS()
 
+    ops_universe = OPS_UNIVERSES[ops_universe_name]
+    args = equation["args"]
+
+    def is_reachable(value: int, idx: int) -> bool:
+        # Whether `value` can be made from args[0..idx]
+        if idx == 0:
+            return value == args[0]
+
+        arg = args[idx]
+        for op in ops_universe:
+            if op == Operation.ADD:
+                if value >= arg and is_reachable(value - arg, idx - 1):
+                    return True
+            elif op == Operation.MULT:
+                if arg == 0:
+                    # any prefix times 0 is 0
+                    if value == 0:
+                        return True
+                elif value % arg == 0 and is_reachable(value // arg, idx - 1):
+                    return True
+            elif op == Operation.CONCAT:
+                shift = concat_shift(arg)
+                if value % shift == arg and is_reachable(value // shift, idx - 1):
+                    return True
+        return False
+
+    return is_reachable(equation["result"], len(args) - 1)
+
+
+def is_valid_equation_forward(equation: Equation, ops_universe_name: str) -> bool:
+    # Values reachable after each argument, without building operator lists.
+    # No operation decreases a value when all arguments are positive,
+    # so values above the result are dropped then.
+    ops_universe = OPS_UNIVERSES[ops_universe_name]
+    result, args = equation["result"], equation["args"]
+    can_prune = all(arg > 0 for arg in args)
+
+    values = {args[0]}
+    for arg in args[1:]:
+        values = {eval_op(value, arg, op) for value in values for op in ops_universe}
+        if can_prune:
+            values = {value for value in values if value <= result}
+    return result in values
+
+
+def find_valid_equations_numpy(
+    equations: List[Equation], ops_universe_name: str
+) -> List[bool]:
+    # Forward frontier for many equations at once: equations with the same number
+    # of arguments are stacked, and their reachable values are kept in flat int64
+    # arrays next to the index of the equation they belong to. Every argument
+    # applies all operations by broadcasting, drops values above the equation's
+    # result and removes duplicates. Equations that can't be pruned (an argument
+    # below 1) or whose values could overflow int64 use `is_valid_equation`: a
+    # value is at most the first argument or the result before every operation.
+    import numpy as np  # pip install numpy
+
+    ops_universe = OPS_UNIVERSES[ops_universe_name]
+    res = [False] * len(equations)
+
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for idx, equation in enumerate(equations):
+        args = equation["args"]
+        largest = max(max(args), concat_shift(max(args)))
+        bound = max(args[0], equation["result"] + 1)
+        if min(args) > 0 and bound * largest < INT64_LIMIT:
+            groups[len(args)].append(idx)
+        else:
+            res[idx] = is_valid_equation(equation, ops_universe_name)
+
+    for idxs in groups.values():
+        results = np.array([equations[idx]["result"] for idx in idxs], dtype=np.int64)
+        arg_matrix = np.array([equations[idx]["args"] for idx in idxs], dtype=np.int64)
+
+        owners = np.arange(len(idxs))
+        values = arg_matrix[:, 0].copy()
+        for k in range(1, arg_matrix.shape[1]):
+            arg = arg_matrix[owners, k]
+            candidates = []
+            for op in ops_universe:
+                if op == Operation.ADD:
+                    candidates.append(values + arg)
+                elif op == Operation.MULT:
+                    candidates.append(values * arg)
+                elif op == Operation.CONCAT:
+                    shift = np.full_like(arg, 10)
+                    while (shift <= arg).any():
+                        shift[shift <= arg] *= 10
+                    candidates.append(values * shift + arg)
+
+            values = np.concatenate(candidates)
+            owners = np.tile(owners, len(ops_universe))
+            kept = values <= results[owners]
+            values, owners = values[kept], owners[kept]
+
+            order = np.lexsort((values, owners))
+            values, owners = values[order], owners[order]
+            distinct = np.ones(len(values), dtype=bool)
+            distinct[1:] = (values[1:] != values[:-1]) | (owners[1:] != owners[:-1])
+            values, owners = values[distinct], owners[distinct]
+
+        for owner in np.unique(owners[values == results[owners]]):
+            res[idxs[owner]] = True
+    return res
+
+
+def is_valid_equation_numpy(equation: Equation, ops_universe_name: str) -> bool:
+    # `find_valid_equations_numpy` for a single equation
+    return find_valid_equations_numpy([equation], ops_universe_name)[0]
+
+
+def is_valid_equation_brute_force(equation: Equation, ops_universe_name: str) -> bool:
     ops_list = build_ops_permutations_cached(
         len(equation["args"]) - 1, ops_universe_name
     )
@@ -74,7 +202,16 @@ def is_valid_equation(equation: Equation, ops_universe_name: str) -> bool:
     )
 
 
-@cache
+# Per equation checks, selected with `strategy`
+STRATEGIES: Dict[str, Callable[[Equation, str], bool]] = {
+    "backward": is_valid_equation,
+    "forward": is_valid_equation_forward,
+    "brute_force": is_valid_equation_brute_force,
+}
+
+
+# Operation lists grow as 3^width, keep the biggest ones from piling up
+@memoize(max_bytes=64 * 1024 * 1024)
 def build_ops_permutations_cached(
     width: int, ops_universe_name: str
 ) -> List[List[Operation]]:
@@ -121,11 +258,19 @@ def eval_op(a: int, b: int, op: Operation) -> int:
     elif op == Operation.MULT:
         return a * b
     elif op == Operation.CONCAT:
-        return int(str(a) + str(b))
+        return a * concat_shift(b) + b
     else:
         raise AssertionError(f"unsupported operation: {op}")
 
 
+def concat_shift(b: int) -> int:
+    # The power of 10 that `a || b` multiplies `a` by: 10^(digits of b)
+    shift = 10
+    while shift <= b:
+        shift *= 10
+    return shift
+
+
 def parse(line: str) -> Equation:
     tokens = line.split(":")
     return Equation(
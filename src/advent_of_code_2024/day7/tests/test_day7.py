@@ -1,20 +1,22 @@
+import pytest
+
 from advent_of_code_2024.day7.day7 import (
-    PART1_OPS_UNIVERSE,
-    PART2_OPS_UNIVERSE,
+    Equation,
     Operation,
-    build_ops_permutations,
+    build_ops_permutations_cached,
+    solve,
 )
 
 
 def test_build_ops_permutations():
-    assert build_ops_permutations(2, PART1_OPS_UNIVERSE) == [
+    assert build_ops_permutations_cached(2, "short_ops_universe") == [
         [Operation.ADD, Operation.ADD],
         [Operation.ADD, Operation.MULT],
         [Operation.MULT, Operation.ADD],
         [Operation.MULT, Operation.MULT],
     ]
 
-    assert build_ops_permutations(2, PART2_OPS_UNIVERSE) == [
+    assert build_ops_permutations_cached(2, "long_ops_universe") == [
         [Operation.ADD, Operation.ADD],
         [Operation.ADD, Operation.MULT],
         [Operation.ADD, Operation.CONCAT],
@@ -25,3 +27,28 @@ def test_build_ops_permutations():
         [Operation.CONCAT, Operation.MULT],
         [Operation.CONCAT, Operation.CONCAT],
     ]
+
+
+EQUATIONS = [
+    Equation(result=190, args=[10, 19]),
+    Equation(result=3267, args=[81, 40, 27]),
+    Equation(result=83, args=[17, 5]),
+    Equation(result=156, args=[15, 6]),
+    Equation(result=7290, args=[6, 8, 6, 15]),
+    Equation(result=161011, args=[16, 10, 13]),
+    Equation(result=192, args=[17, 8, 14]),
+    Equation(result=21037, args=[9, 7, 18, 13]),
+    Equation(result=292, args=[11, 6, 16, 20]),
+    # not prunable, checked one by one in the numpy strategy
+    Equation(result=0, args=[5, 0, 3, 0]),
+    Equation(result=10**18, args=[10**9, 10**9]),
+]
+
+
+@pytest.mark.parametrize("strategy", ["backward", "forward", "brute_force", "numpy"])
+def test_solve_strategies(strategy):
+    if strategy == "numpy":
+        pytest.importorskip("numpy")
+
+    assert solve(EQUATIONS, "short_ops_universe", strategy) == 3749 + 10**18
+    assert solve(EQUATIONS, "long_ops_universe", strategy) == 11387 + 10**18
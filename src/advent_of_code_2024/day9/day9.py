@@ -1,14 +1,41 @@
-from collections import defaultdict, deque
-from typing import Deque, Dict, List, TypedDict
+import heapq
+from array import array
+from itertools import accumulate, islice
+from typing import Iterable, Iterator, List, Tuple
 
+# Lengths in a disk map are single digits
+MAX_LEN = 9
 
-class Block(TypedDict):
-    id: int
-    len: int
-    pos: int
+# Disk map characters to their lengths
+DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
 
 
-SPACE_BLOCK_ID = -1
+class Blocks:
+    # Disk layout as columns instead of a dict per block: block i is file ids[i],
+    # lens[i] long, starting at pos[i]. 24 bytes a block, so a 10^7 digit disk map
+    # takes ~120 MB.
+
+    def __init__(
+        self, ids: Iterable[int] = (), lens: Iterable[int] = (), pos: Iterable[int] = ()
+    ) -> None:
+        self.ids = array("q", ids)
+        self.lens = array("q", lens)
+        self.pos = array("q", pos)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __repr__(self) -> str:
+        return f"Blocks({list(self)})"
+
+    def __iter__(self) -> Iterator[Tuple[int, int, int]]:
+        # (id, len, pos) of every block
+        return zip(self.ids, self.lens, self.pos)
+
+    def append(self, id: int, length: int, pos: int) -> None:
+        self.ids.append(id)
+        self.lens.append(length)
+        self.pos.append(pos)
 
 
 def main() -> None:
@@ -25,126 +52,141 @@ def solve_part1(input: str) -> int:
     return checksum(compacted_block)
 
 
-def solve_part2(input: str) -> int:
+def solve_part2_brute_force(input: str) -> int:
     # Runtime: O(len(input)^2)
     blocks = parse_blocks(input)
-    compacted_block = compact_blocks_part2(blocks)
-    return checksum(compacted_block)
-
+    return checksum(compact_blocks_part2_brute_force(blocks))
 
-def parse_blocks(input: str) -> List[Block]:
-    res: List[Block] = []
 
-    pos = 0
-    id = 0
-    is_block = True
-    for len in map(int, input):
-        if is_block:
-            res.append(Block(id=id, len=len, pos=pos))
-            id += 1
+def solve_part2(input: str) -> int:
+    # Runtime: O(len(input) * log(len(input)))
+    blocks = parse_blocks(input)
+    compacted_block = compact_blocks_part2(blocks)
+    return checksum(compacted_block)
 
-        pos += len
-        is_block = not is_block
 
-    return res
+def parse_blocks(input: str) -> Blocks:
+    # Digits alternate between files and free space, a file's id is its index
+    digits = array("B", input.encode().translate(DIGITS))
+    starts = array("q", accumulate(digits, initial=0))
+    files = (len(digits) + 1) // 2
+    return Blocks(range(files), digits[0::2], starts[0 : 2 * files : 2])
 
 
-def compact_blocks_part1(blocks: List[Block]) -> List[Block]:
-    res: List[Block] = []
+def compact_blocks_part1(blocks: Blocks) -> Blocks:
+    ids, lens, pos = blocks.ids, blocks.lens, blocks.pos
+    res = Blocks()
 
     idx_left = 0
     idx_right = len(blocks) - 1
 
-    right_block = blocks[idx_right]
+    right_len = lens[idx_right]
     while idx_left < idx_right:
-        left_block = blocks[idx_left]
-
-        res.append(left_block)
-        space = blocks[idx_left + 1]["pos"] - (left_block["pos"] + left_block["len"])
+        res.append(ids[idx_left], lens[idx_left], pos[idx_left])
+        end = pos[idx_left] + lens[idx_left]
+        space = pos[idx_left + 1] - end
+
+        # a file moved up to the left one stays where it is
+        while space != 0 and idx_left < idx_right:
+            moved = min(right_len, space)
+            res.append(ids[idx_right], moved, end)
+            end += moved
+            space -= moved
+            right_len -= moved
+
+            if right_len == 0:
+                idx_right -= 1
+                right_len = lens[idx_right]
 
-        while space != 0:
-            if right_block["len"] <= space:
-                res.append(
-                    Block(
-                        id=right_block["id"],
-                        len=right_block["len"],
-                        pos=res[-1]["pos"] + res[-1]["len"],
-                    )
-                )
+        idx_left += 1
 
-                space -= right_block["len"]
+    if idx_left == idx_right:
+        # what is left of the last file keeps its first cells
+        res.append(ids[idx_right], right_len, pos[idx_right])
 
-                idx_right -= 1
-                right_block = blocks[idx_right]
-            else:  # right_block["len"] > space
-                res.append(
-                    Block(
-                        id=right_block["id"],
-                        len=space,
-                        pos=res[-1]["pos"] + res[-1]["len"],
-                    )
-                )
-                right_block = Block(
-                    id=right_block["id"],
-                    len=right_block["len"] - space,
-                    pos=right_block["pos"],
-                )
-                space = 0
+    return res
 
-        idx_left += 1
 
-    res.append(right_block)
+def compact_blocks_part2(blocks: Blocks) -> Blocks:
+    # Free spans are indexed by length: spaces[l] is a min-heap of the positions
+    # of spans exactly l long. The leftmost span that fits a block is the
+    # smallest of at most MAX_LEN heap tops, and what is left of it goes back
+    # into the heap of its new length. Space freed by a moved block is never
+    # reused: every later block lies to the left of it.
+    spaces: List[List[int]] = [[] for _ in range(MAX_LEN + 1)]
+    for space_pos, space_len in build_spaces(blocks):
+        spaces[space_len].append(space_pos)
+    for heap in spaces:
+        heapq.heapify(heap)
+
+    res = Blocks()
+    for id, block_len, block_pos in zip(
+        reversed(blocks.ids), reversed(blocks.lens), reversed(blocks.pos)
+    ):
+        best_len = 0
+        best_pos = block_pos
+        for space_len in range(block_len, MAX_LEN + 1):
+            heap = spaces[space_len]
+            if heap and heap[0] >= block_pos:
+                # every span left in this heap is right of this and all later blocks
+                heap.clear()
+            if heap and heap[0] < best_pos:
+                best_len, best_pos = space_len, heap[0]
+
+        if best_len == 0:
+            res.append(id, block_len, block_pos)
+            continue
+
+        heapq.heappop(spaces[best_len])
+        if best_len > block_len:
+            heapq.heappush(spaces[best_len - block_len], best_pos + block_len)
+        res.append(id, block_len, best_pos)
 
     return res
 
 
-def compact_blocks_part2(blocks: List[Block]) -> List[Block]:
-    spaces: List[Block] = list(
-        filter(
-            lambda space: space["len"] > 0,
-            map(
-                lambda p: build_space_between_blocks(p[0], p[1]),
-                zip(blocks[0:-1], blocks[1:]),
-            ),
-        )
-    )
+def compact_blocks_part2_brute_force(blocks: Blocks) -> Blocks:
+    # Scans the free spans from the left for every block
+    spaces = [space for space in build_spaces(blocks) if space[1] > 0]
 
-    res: List[Block] = []
-    for block in reversed(blocks):
-        for i in range(len(spaces)):
-            space = spaces[i]
-            if space["pos"] > block["pos"]:
+    res = Blocks()
+    for id, block_len, block_pos in zip(
+        reversed(blocks.ids), reversed(blocks.lens), reversed(blocks.pos)
+    ):
+        for i, (space_pos, space_len) in enumerate(spaces):
+            if space_pos > block_pos:
+                res.append(id, block_len, block_pos)
                 break
 
-            if space["len"] >= block["len"]:
-                res.append(Block(id=block["id"], len=block["len"], pos=space["pos"]))
-                spaces[i] = Block(
-                    id=SPACE_BLOCK_ID,
-                    len=space["len"] - block["len"],
-                    pos=space["pos"] + block["len"],
-                )
+            if space_len >= block_len:
+                res.append(id, block_len, space_pos)
+                spaces[i] = (space_pos + block_len, space_len - block_len)
                 break
-
-        if res and res[-1]["id"] != block["id"]:
-            res.append(block)
+        else:
+            res.append(id, block_len, block_pos)
 
     return res
 
 
-def build_space_between_blocks(a: Block, b: Block) -> Block:
-    return Block(
-        id=SPACE_BLOCK_ID, len=b["pos"] - a["pos"] - a["len"], pos=a["pos"] + a["len"]
-    )
-
+def build_spaces(blocks: Blocks) -> Iterator[Tuple[int, int]]:
+    # (pos, len) of the free space between every two neighbouring blocks
+    ends = map(int.__add__, blocks.pos, blocks.lens)
+    for end, start in zip(ends, islice(blocks.pos, 1, None)):
+        yield (end, start - end)
 
-def checksum(blocks: List[Block]) -> int:
-    return sum(map(block_checksum, blocks))
 
-
-def block_checksum(block: Block) -> int:
-    # arithmetic progression
-    pos_sum = block["len"] * (2 * block["pos"] + block["len"] - 1) // 2
-    return block["id"] * pos_sum
+def checksum(blocks: Blocks) -> int:
+    # Sum of id * pos over every cell: an arithmetic progression per block, added
+    # up one block at a time in Python ints, as the total overflows 64 bits on
+    # large disk maps.
+    return sum(
+        map(
+            lambda id, length, pos: id * (length * (2 * pos + length - 1) // 2),
+            blocks.ids,
+            blocks.lens,
+            blocks.pos,
+        )
+    )
 
 
 def read_input(file_name: str) -> str:
@@ -0,0 +1,36 @@
+import os
+
+from advent_of_code_2024.day9.day9 import (
+    Blocks,
+    parse_blocks,
+    read_input,
+    solve_part1,
+    solve_part2,
+)
+
+TEST_INPUT = os.path.join(os.path.dirname(__file__), "..", "test.txt")
+
+
+def test_parse_blocks():
+    blocks = parse_blocks("12345")
+    assert list(blocks) == [(0, 1, 0), (1, 3, 3), (2, 5, 10)]
+    assert list(parse_blocks("1234")) == [(0, 1, 0), (1, 3, 3)]
+
+
+def test_blocks_append():
+    blocks = Blocks()
+    blocks.append(7, 2, 5)
+    assert len(blocks) == 1
+    assert list(blocks) == [(7, 2, 5)]
+
+
+def test_solve():
+    input = read_input(TEST_INPUT)
+    assert solve_part1(input) == 1928
+    assert solve_part2(input) == 2858
+
+
+def test_solve_part1_moves_file_into_its_own_gap():
+    # 0..111....22222 -> 022111222......
+    assert solve_part1("12345") == 60
+    assert solve_part1("9") == 0
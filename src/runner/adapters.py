@@ -0,0 +1,157 @@
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from runner.discovery import Solver
+
+ParseFunc = Callable[[ModuleType, Any], Any]
+PartFunc = Callable[[ModuleType, Any], Any]
+
+
+@dataclass(frozen=True)
+class Adapter:
+    # Glue between `read_input` output and `solve_part1`/`solve_part2`,
+    # mirrors what the day's `main()` does.
+    parse: ParseFunc = lambda m, input: input
+    part1: Optional[PartFunc] = lambda m, input: m.solve_part1(input)
+    part2: Optional[PartFunc] = lambda m, input: m.solve_part2(input)
+    skip_reason: Optional[str] = None
+
+    def part(self, part: int) -> Optional[PartFunc]:
+        return self.part1 if part == 1 else self.part2
+
+
+DEFAULT_ADAPTER = Adapter()
+
+
+def parse_dir_sizes(m: ModuleType, input: List[str]) -> Tuple[Any, List[int]]:
+    root_dir = m.parse_file_tree(input)
+    return (root_dir, m.find_dir_size(root_dir))
+
+
+ADAPTERS: Dict[Tuple[int, int], Adapter] = {
+    # 2022
+    (2022, 1): Adapter(
+        part1=lambda m, cals: m.most_calories(cals),
+        part2=lambda m, cals: m.total_top_calories(cals, 3),
+    ),
+    (2022, 2): Adapter(
+        parse=lambda m, input: (
+            [(m.parse_opponent_option(r[0]), m.parse_my_option(r[1])) for r in input],
+            [
+                (m.parse_opponent_option(r[0]), m.parse_round_result(r[1]))
+                for r in input
+            ],
+        ),
+        part1=lambda m, rounds: m.solve_part1(rounds[0]),
+        part2=lambda m, rounds: m.solve_part2(rounds[1]),
+    ),
+    (2022, 5): Adapter(
+        part1=lambda m, cargo: m.solve_part1(cargo["stacks"], cargo["moves"]),
+        part2=lambda m, cargo: m.solve_part2(cargo["stacks"], cargo["moves"]),
+    ),
+    (2022, 6): Adapter(
+        part1=lambda m, s: m.solve_part1(s, 4),
+        part2=lambda m, s: m.solve_part1(s, 14),
+    ),
+    (2022, 7): Adapter(
+        parse=lambda m, input: parse_dir_sizes(m, input),
+        part1=lambda m, p: m.solve_part1(p[1]),
+        part2=lambda m, p: m.solve_part2(
+            dir_sizes=p[1],
+            used_space=p[0].size,
+            total_disk_space=70000000,
+            required_free_space=30000000,
+        ),
+    ),
+    (2022, 8): Adapter(parse=lambda m, input: m.parse_intput(input)),
+    (2022, 9): Adapter(parse=lambda m, input: [m.parse_line(l) for l in input]),
+    (2022, 10): Adapter(parse=lambda m, input: [m.parse_operation(l) for l in input]),
+    (2022, 11): Adapter(
+        parse=lambda m, input: (
+            m.parse_input(input, divider=3),
+            m.parse_input(input, divider=1),
+        ),
+        part1=lambda m, monkeys: m.solve_part1(monkeys[0], 20),
+        part2=lambda m, monkeys: m.solve_part2(monkeys[1]),
+    ),
+    (2022, 12): Adapter(
+        parse=lambda m, input: m.parse(input),
+        part1=lambda m, c: m.solve_part1(c["grid"], c["start"], c["end"]),
+        part2=lambda m, c: m.solve_part2(c["grid"], c["start"], c["end"]),
+    ),
+    (2022, 13): Adapter(
+        parse=lambda m, input: (
+            m.parse_pairs(input),
+            [l for l in input if l != ""],
+        ),
+        part1=lambda m, signals: m.solve_part1(signals[0]),
+        part2=lambda m, signals: m.solve_part2(signals[1]),
+    ),
+    (2022, 14): Adapter(
+        parse=lambda m, input: m.parse(input),
+        part2=lambda m, paths: m.solve_part2(paths, 200),
+    ),
+    (2022, 17): Adapter(
+        parse=lambda m, input: m.parse(input[0]),
+        part1=lambda m, directions: m.solve_part1(directions, 1875),
+        part2=lambda m, directions: m.solve_part2(directions, 1000000000000),
+    ),
+    (2022, 18): Adapter(parse=lambda m, input: m.parse(input)),
+    (2022, 25): Adapter(part2=None),
+    # 2023
+    (2023, 1): Adapter(skip_reason="script without solve functions"),
+    (2023, 4): Adapter(parse=lambda m, lines: m.parse(lines)),
+    (2023, 7): Adapter(
+        parse=lambda m, lines: [
+            (parts[0], int(parts[1])) for parts in [l.split(" ") for l in lines]
+        ]
+    ),
+    (2023, 8): Adapter(
+        parse=lambda m, input: (
+            input[0],
+            {d[0]: (d[1], d[2]) for d in map(m.parse_direction, input[2:])},
+        ),
+        part1=lambda m, p: m.solve_part1(p[0], p[1]),
+        part2=lambda m, p: m.solve_part2(p[0], p[1]),
+    ),
+    (2023, 12): Adapter(parse=lambda m, input: m.parse(input)),
+    (2023, 13): Adapter(parse=lambda m, input: m.parse_boards(input)),
+    (2023, 14): Adapter(
+        parse=lambda m, input: m.parse(input),
+        part2=lambda m, board: m.solve_part2(board, 1000000000),
+    ),
+    (2023, 15): Adapter(parse=lambda m, input: input[0]),
+    (2023, 16): Adapter(parse=lambda m, input: m.parse_board(input)),
+    (2023, 17): Adapter(
+        parse=lambda m, input: m.parse_board(input),
+        part1=lambda m, board: m.solve(board, min_steps=1, max_steps=3),
+        part2=lambda m, board: m.solve(board, min_steps=4, max_steps=10),
+    ),
+    (2023, 23): Adapter(parse=lambda m, input: m.parse_board(input)),
+    (2023, 24): Adapter(
+        parse=lambda m, input: m.parse_vecs3d(input),
+        part1=lambda m, vecs3d: m.solve_part1(vecs3d, m.BOUNDARY),
+        part2=None,
+    ),
+    (2023, 25): Adapter(
+        parse=lambda m, input: m.parse_graph(input),
+        part1=lambda m, graph: m.solve_part1(graph, m.DISCONNECTED_EDGES),
+        part2=None,
+    ),
+    # 2024
+    (2024, 14): Adapter(
+        part1=lambda m, input: m.solve_part1(input, m.BOARD_SIZE),
+        part2=lambda m, input: m.solve_part2(input, m.BOARD_SIZE),
+    ),
+    (2024, 16): Adapter(parse=lambda m, input: m.parse_board(input)),
+    (2024, 18): Adapter(
+        part1=lambda m, input: m.solve_part1(input, m.BOARD_SIZE, m.BLOCKS_COUNT),
+        part2=lambda m, input: m.solve_part2(input, m.BOARD_SIZE),
+    ),
+    (2024, 25): Adapter(part2=None),
+}
+
+
+def get_adapter(solver: Solver) -> Adapter:
+    return ADAPTERS.get((solver.year, solver.day), DEFAULT_ADAPTER)
@@ -0,0 +1,349 @@
+import argparse
+import copy
+import json
+import math
+import os
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from runner.adapters import get_adapter
+from runner.cli import add_input_arguments, format_seconds, select_inputs
+from runner.discovery import Solver, discover_solvers
+from runner.memory import format_bytes
+from runner.runner import (
+    PARSE_PHASE,
+    format_error,
+    load_module,
+    parse_input,
+    run_phase,
+    silenced,
+)
+
+DEFAULT_HISTORY_FILE = "bench_history.json"
+MAX_RUNS_IN_HISTORY = 100
+MEMORY_METRICS = ["peak_rss", "traced_peak", "top_allocations"]
+
+# (metric, value, max ratio to the baseline, smallest baseline compared, format)
+Check = Tuple[str, Optional[float], float, float, Callable[[float], str]]
+
+
+@dataclass
+class PhaseStats:
+    median: float
+    p95: float
+    samples: int
+    # Measured in a separate traced run with `--memory` (bytes)
+    peak_rss: Optional[int] = None
+    traced_peak: Optional[int] = None
+    top_allocations: List[str] = field(default_factory=list)
+
+
+@dataclass
+class BenchmarkResult:
+    solver: Solver
+    stats: Dict[str, PhaseStats]
+    error: Optional[str] = None
+    input_name: str = "input.txt"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m runner.benchmark",
+        description="Benchmark solvers and detect regressions against a stored baseline.",
+    )
+    parser.add_argument("year", type=int, nargs="?", help="only run this year")
+    parser.add_argument("day", type=int, nargs="?", help="only run this day")
+    add_input_arguments(parser)
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per phase")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs per phase")
+    parser.add_argument(
+        "--timeout", type=float, help="abort a single run after this many seconds"
+    )
+    parser.add_argument(
+        "--history", default=DEFAULT_HISTORY_FILE, help="JSON history file"
+    )
+    parser.add_argument(
+        "--max-ratio",
+        type=float,
+        default=1.5,
+        help="fail when median time exceeds baseline median by this ratio",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.001,
+        help="ignore phases whose baseline median is below this (seconds)",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="add a traced run per phase recording peak RSS and traced peak memory",
+    )
+    parser.add_argument(
+        "--max-memory-ratio",
+        type=float,
+        default=1.5,
+        help="fail when peak memory exceeds baseline peak by this ratio",
+    )
+    parser.add_argument(
+        "--min-memory",
+        type=float,
+        default=1.0,
+        help="ignore traced peaks whose baseline is below this (MiB)",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="store this run as the new baseline",
+    )
+    args = parser.parse_args()
+
+    solvers = discover_solvers(
+        years=[args.year] if args.year else None,
+        days=[args.day] if args.day else None,
+    )
+
+    history = load_history(args.history)
+    results: List[BenchmarkResult] = []
+    for solver, input_name in select_inputs(solvers, args):
+        result = benchmark_solver(
+            solver,
+            input_name,
+            args.repeat,
+            args.warmup,
+            args.timeout,
+            args.cache_dir,
+            args.memory,
+        )
+        print_benchmark_result(result)
+        results.append(result)
+
+    regressions = find_regressions(
+        history,
+        results,
+        args.max_ratio,
+        args.min_time,
+        args.max_memory_ratio,
+        int(args.min_memory * 1024 * 1024),
+    )
+    record_run(history, results, args.update_baseline)
+    save_history(args.history, history)
+
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+
+
+def benchmark_solver(
+    solver: Solver,
+    input_name: str = "input.txt",
+    repeat: int = 5,
+    warmup: int = 1,
+    timeout: Optional[float] = None,
+    cache_dir: Optional[str] = None,
+    memory: bool = False,
+    memory_top: int = 5,
+) -> BenchmarkResult:
+    # With `memory`, every phase gets one more run under tracemalloc after the
+    # timed ones, so tracing overhead does not skew the timings
+    adapter = get_adapter(solver)
+    if adapter.skip_reason:
+        return BenchmarkResult(solver, {}, adapter.skip_reason)
+
+    try:
+        module = load_module(solver)
+    except Exception as e:
+        return BenchmarkResult(solver, {}, f"import failed: {format_error(e)}")
+
+    phases: List[Tuple[str, Callable[[Any], Any]]] = [
+        (
+            PARSE_PHASE,
+            lambda input: parse_input(solver, module, adapter, input_name, cache_dir),
+        )
+    ]
+    for part in [1, 2]:
+        part_func = adapter.part(part)
+        if part_func is not None:
+            phases.append((f"part{part}", partial(part_func, module)))
+
+    res = BenchmarkResult(solver, {}, input_name=input_name)
+    with silenced(False):
+        input: Any = None
+        for phase, func in phases:
+            samples: List[float] = []
+            for i in range(warmup + repeat):
+                phase_input = copy.deepcopy(input)
+                phase_result, answer = run_phase(
+                    phase, lambda: func(phase_input), timeout
+                )
+                if phase_result.error:
+                    res.error = f"{phase}: {phase_result.error}"
+                    return res
+                if i >= warmup:
+                    samples.append(phase_result.seconds)
+
+            res.stats[phase] = build_stats(samples)
+            if memory:
+                phase_input = copy.deepcopy(input)
+                phase_result, _ = run_phase(
+                    phase, lambda: func(phase_input), timeout, memory_top
+                )
+                if phase_result.memory is not None and not phase_result.error:
+                    res.stats[phase].peak_rss = phase_result.memory.peak_rss
+                    res.stats[phase].traced_peak = phase_result.memory.traced_peak
+                    res.stats[phase].top_allocations = (
+                        phase_result.memory.top_allocations
+                    )
+
+            if phase == PARSE_PHASE:
+                input = answer
+
+    return res
+
+
+def build_stats(samples: List[float]) -> PhaseStats:
+    return PhaseStats(
+        median=statistics.median(samples),
+        p95=percentile(samples, 95),
+        samples=len(samples),
+    )
+
+
+def percentile(samples: List[float], p: float) -> float:
+    # nearest-rank method
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+def load_history(file_name: str) -> Dict[str, Any]:
+    if not os.path.exists(file_name):
+        return {"baseline": {}, "runs": []}
+    with open(file_name) as f:
+        return json.load(f)
+
+
+def save_history(file_name: str, history: Dict[str, Any]) -> None:
+    with open(file_name, "w") as f:
+        json.dump(history, f, indent=2)
+
+
+def find_regressions(
+    history: Dict[str, Any],
+    results: List[BenchmarkResult],
+    max_ratio: float,
+    min_time: float = 0.0,
+    max_memory_ratio: Optional[float] = None,
+    min_memory: int = 0,
+) -> List[str]:
+    # Phases faster than `min_time` are too noisy to compare, as are traced peaks
+    # below `min_memory`. Memory is compared only when both runs measured it.
+    res: List[str] = []
+    for result in results:
+        for phase, stats in result.stats.items():
+            key = history_key(result, phase)
+            baseline = history["baseline"].get(key)
+            if not baseline:
+                continue
+
+            checks: List[Check] = [
+                ("median", stats.median, max_ratio, min_time, format_seconds)
+            ]
+            if max_memory_ratio is not None:
+                checks += [
+                    (
+                        "traced_peak",
+                        stats.traced_peak,
+                        max_memory_ratio,
+                        min_memory,
+                        format_bytes,
+                    ),
+                    ("peak_rss", stats.peak_rss, max_memory_ratio, 0, format_bytes),
+                ]
+            for check in checks:
+                regression = compare_to_baseline(baseline, *check)
+                if regression is not None:
+                    res.append(f"{key}: {regression}")
+    return res
+
+
+def compare_to_baseline(
+    baseline: Dict[str, Any],
+    metric: str,
+    value: Optional[float],
+    max_ratio: float,
+    minimum: float,
+    format_value: Callable[[float], str],
+) -> Optional[str]:
+    baseline_value = baseline.get(metric)
+    if (
+        value is None
+        or not baseline_value
+        or baseline_value < minimum
+        or value <= baseline_value * max_ratio
+    ):
+        return None
+
+    name = "" if metric == "median" else f"{metric} "
+    return (
+        f"{name}{format_value(value)} vs baseline {format_value(baseline_value)} "
+        f"(x{value / baseline_value:.2f})"
+    )
+
+
+def record_run(
+    history: Dict[str, Any], results: List[BenchmarkResult], update_baseline: bool
+) -> None:
+    run_stats = {
+        history_key(result, phase): asdict(stats)
+        for result in results
+        for phase, stats in result.stats.items()
+    }
+
+    for key, stats in run_stats.items():
+        baseline = history["baseline"].get(key)
+        if update_baseline or baseline is None:
+            history["baseline"][key] = stats
+        elif baseline.get("traced_peak") is None and stats["traced_peak"] is not None:
+            # First `--memory` run of a phase whose timing baseline already exists
+            for metric in MEMORY_METRICS:
+                baseline[metric] = stats[metric]
+
+    history["runs"].append({"timestamp": time.time(), "results": run_stats})
+    history["runs"] = history["runs"][-MAX_RUNS_IN_HISTORY:]
+
+
+def history_key(result: BenchmarkResult, phase: str) -> str:
+    key = f"{result.solver.name} {phase}"
+    if result.input_name != "input.txt":
+        key += f" [{os.path.basename(result.input_name)}]"
+    return key
+
+
+def print_benchmark_result(result: BenchmarkResult) -> None:
+    name = result.solver.name.ljust(11)
+    for phase, stats in result.stats.items():
+        print(
+            f"{name} {phase.ljust(5)} "
+            f"median {format_seconds(stats.median).rjust(10)}  "
+            f"p95 {format_seconds(stats.p95).rjust(10)}",
+            flush=True,
+        )
+        if stats.peak_rss is not None and stats.traced_peak is not None:
+            print(
+                f"{''.ljust(17)} peak RSS {format_bytes(stats.peak_rss)}, "
+                f"traced peak {format_bytes(stats.traced_peak)}",
+                flush=True,
+            )
+            for site in stats.top_allocations:
+                print(f"{''.ljust(17)}   {site}", flush=True)
+    if result.error:
+        print(f"{name} error: {result.error}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import glob
+import os
+import pickle
+from types import ModuleType
+from typing import Any, Callable
+
+from runner.adapters import Adapter
+from runner.discovery import Solver
+from runner.hashing import (
+    combined_hash,
+    file_hash,
+    function_source,
+    module_hash,
+    utils_hash,
+)
+
+DEFAULT_CACHE_DIR = ".runner_cache"
+
+
+def parser_hash(module: ModuleType, adapter: Adapter) -> str:
+    return combined_hash(
+        [module_hash(module), function_source(adapter.parse), utils_hash()]
+    )
+
+
+def cached_parse(
+    cache_dir: str,
+    solver: Solver,
+    module: ModuleType,
+    adapter: Adapter,
+    input_path: str,
+    parse: Callable[[], Any],
+) -> Any:
+    # Parsed input is pickled under a name built from the input and parser
+    # hashes, so editing either of them makes the old entry unreachable
+    input_hash = file_hash(input_path)
+    prefix = os.path.join(
+        cache_dir, "parsed", f"{solver.year}_day{solver.day}_{input_hash[:16]}"
+    )
+    file_name = f"{prefix}_{parser_hash(module, adapter)[:16]}.pickle"
+
+    if os.path.exists(file_name):
+        with open(file_name, "rb") as f:
+            return pickle.load(f)
+
+    res = parse()
+    try:
+        data = pickle.dumps(res, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return res  # e.g. parsed input holding lambdas
+
+    for stale_file_name in glob.glob(f"{glob.escape(prefix)}_*.pickle"):
+        if stale_file_name != file_name:
+            os.remove(stale_file_name)
+
+    os.makedirs(os.path.dirname(file_name), exist_ok=True)
+    tmp_file_name = f"{file_name}.{os.getpid()}.tmp"
+    with open(tmp_file_name, "wb") as f:
+        f.write(data)
+    os.replace(tmp_file_name, file_name)
+    return res
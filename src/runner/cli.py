@@ -0,0 +1,264 @@
+import argparse
+import os
+import sys
+import time
+from typing import Any, Iterator, List, Optional, Tuple
+
+from runner.cache import DEFAULT_CACHE_DIR
+from runner.discovery import Solver, discover_solvers
+from runner.memo import MEMO_FORCE, MEMO_USE, MEMO_VERIFY
+from runner.memory import MemoryStats, format_bytes
+from runner.generators.registry import generated_input_path, get_generator
+from runner.parallel import run_solvers_parallel
+from runner.profiling import DEFAULT_PROFILE_DIR, profile_solver
+from runner.runner import PARSE_PHASE, SolverResult, run_solver
+from utils.memoize import MemoStats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m runner",
+        description="Run Advent of Code solvers in-process with per-phase timing.",
+    )
+    parser.add_argument("year", type=int, nargs="?", help="only run this year")
+    parser.add_argument("day", type=int, nargs="?", help="only run this day")
+    add_input_arguments(parser)
+    parser.add_argument(
+        "--budget", type=float, help="flag phases slower than this (seconds)"
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="show the solvers' own output"
+    )
+    parser.add_argument(
+        "--timeout", type=float, help="abort a single phase after this many seconds"
+    )
+    parser.add_argument(
+        "--trace",
+        choices=["counters", "progress"],
+        help="print the solvers' sampled counters or progress bars to stderr",
+    )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="run days and parts concurrently in a process pool",
+    )
+    parser.add_argument(
+        "--jobs", type=int, help="process pool size (default: number of CPUs)"
+    )
+    parser.add_argument(
+        "--memo",
+        dest="memo_dir",
+        nargs="?",
+        const=DEFAULT_CACHE_DIR,
+        help="return stored answers for unchanged solver and input pairs, "
+        f"kept in this directory (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="run each phase under cProfile, write .pstats and collapsed stack files "
+        "and print the hottest functions",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default=DEFAULT_PROFILE_DIR,
+        help=f"where to write profiles (default: {DEFAULT_PROFILE_DIR})",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="report peak RSS, traced peak and the biggest allocation sites per phase",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=15,
+        help="hottest functions (--profile) or allocation sites (--memory) per phase",
+    )
+    memo_mode = parser.add_mutually_exclusive_group()
+    memo_mode.add_argument(
+        "--force",
+        dest="memo_mode",
+        action="store_const",
+        const=MEMO_FORCE,
+        default=MEMO_USE,
+        help="recompute memoized answers and store the new ones",
+    )
+    memo_mode.add_argument(
+        "--verify",
+        dest="memo_mode",
+        action="store_const",
+        const=MEMO_VERIFY,
+        help="recompute memoized answers and report the ones that differ",
+    )
+    args = parser.parse_args()
+    if args.trace:
+        # Read by utils.tracing when the solvers are imported
+        os.environ["AOC_TRACE"] = args.trace
+    if args.memo_mode != MEMO_USE and args.memo_dir is None:
+        args.memo_dir = DEFAULT_CACHE_DIR
+    memory_top = args.top if args.memory else None
+
+    solvers = discover_solvers(
+        years=[args.year] if args.year else None,
+        days=[args.day] if args.day else None,
+    )
+
+    inputs = select_inputs(solvers, args)
+
+    results: Iterator[SolverResult]
+    if args.profile:
+        results = (
+            profile_solver(
+                solver,
+                input_name,
+                args.profile_dir,
+                args.top,
+                timeout=args.timeout,
+                cache_dir=args.cache_dir,
+            )
+            for solver, input_name in inputs
+        )
+    elif args.parallel:
+        results = run_solvers_parallel(
+            inputs,
+            args.verbose,
+            args.timeout,
+            args.jobs,
+            args.cache_dir,
+            args.memo_dir,
+            args.memo_mode,
+            memory_top,
+        )
+    else:
+        results = (
+            run_solver(
+                solver,
+                input_name,
+                args.verbose,
+                timeout=args.timeout,
+                cache_dir=args.cache_dir,
+                memo_dir=args.memo_dir,
+                memo_mode=args.memo_mode,
+                memory_top=memory_top,
+            )
+            for solver, input_name in inputs
+        )
+
+    start = time.perf_counter()
+    total_seconds = 0.0
+    cached_parts = 0
+    mismatches = 0
+    for result in results:
+        print_result(result, args.budget)
+        total_seconds += result.seconds
+        cached_parts += sum(1 for p in result.phases if p.cached)
+        mismatches += sum(1 for p in result.phases if p.mismatch is not None)
+    wall_seconds = time.perf_counter() - start
+
+    summary = (
+        f"Total: {format_seconds(total_seconds)} solver time, "
+        f"{format_seconds(wall_seconds)} wall time ({len(inputs)} solvers"
+    )
+    if args.memo_dir:
+        summary += f", {cached_parts} cached parts"
+    print(summary + ")")
+
+    if mismatches:
+        print(f"{mismatches} answers differ from the memoized ones")
+        sys.exit(1)
+
+
+def add_input_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--input", default="input.txt", help="input file name")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        help="run on generated inputs this many times the size of the real ones "
+        "(only days with an input generator)",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="random seed for generated inputs"
+    )
+    parser.add_argument(
+        "--cache",
+        dest="cache_dir",
+        nargs="?",
+        const=DEFAULT_CACHE_DIR,
+        help="reuse parsed inputs stored in this directory "
+        f"(default: {DEFAULT_CACHE_DIR})",
+    )
+
+
+def select_inputs(
+    solvers: List[Solver], args: argparse.Namespace
+) -> List[Tuple[Solver, str]]:
+    if args.scale is None:
+        return [(solver, args.input) for solver in solvers]
+
+    return [
+        (solver, generated_input_path(solver, args.scale, args.seed))
+        for solver in solvers
+        if get_generator(solver) is not None
+    ]
+
+
+def print_result(result: SolverResult, budget: Optional[float] = None) -> None:
+    name = result.solver.name.ljust(11)
+    if result.skip_reason:
+        print(f"{name} skipped: {result.skip_reason}", flush=True)
+        return
+
+    for phase in result.phases:
+        line = (
+            f"{name} {phase.phase.ljust(5)} {format_seconds(phase.seconds).rjust(10)}"
+        )
+        if phase.error:
+            line += f"  error: {phase.error}"
+        elif phase.phase != PARSE_PHASE:
+            line += f"  {format_answer(phase.answer)}"
+        if phase.cached:
+            line += "  (cached)"
+        if phase.mismatch is not None:
+            line += f"  [MISMATCH, memoized: {phase.mismatch}]"
+        if budget is not None and phase.seconds > budget:
+            line += "  [over budget]"
+        print(line, flush=True)
+        if phase.memory is not None:
+            print_memory(phase.memory)
+        for memo in phase.memos:
+            print_memo(memo)
+
+
+def print_memory(memory: MemoryStats) -> None:
+    indent = "".ljust(18)
+    print(
+        f"{indent}peak RSS {format_bytes(memory.peak_rss)}, "
+        f"traced peak {format_bytes(memory.traced_peak)}",
+        flush=True,
+    )
+    for site in memory.top_allocations:
+        print(f"{indent}  {site}", flush=True)
+
+
+def print_memo(memo: MemoStats) -> None:
+    line = (
+        f"{''.ljust(18)}memo {memo.name}: {memo.hits} hits, {memo.misses} misses, "
+        f"{memo.evictions} evictions, {memo.entries} entries"
+    )
+    if memo.bytes is not None:
+        line += f" ({format_bytes(memo.bytes)})"
+    print(line, flush=True)
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f} ms"
+    return f"{seconds:.2f} s"
+
+
+def format_answer(answer: Any) -> str:
+    s = str(answer)
+    return "\n" + s if "\n" in s else s
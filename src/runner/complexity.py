@@ -0,0 +1,314 @@
+import argparse
+import copy
+import inspect
+import math
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from runner.adapters import get_adapter
+from runner.cli import format_seconds
+from runner.discovery import Solver, discover_solvers
+from runner.generators.registry import generated_input_path, get_generator
+from runner.runner import format_error, load_module, parse_input, run_phase, silenced
+
+DEFAULT_SCALES = [0.25, 0.5, 1, 2, 4]
+
+CLAIM_PATTERN = re.compile(r"#.*\bO\((.+)\)")
+
+# How the variables used in `# O(...)` comments grow with the generated input size.
+# A variable with exponent 0 is a per-item constant (e.g. arguments per equation).
+# Upper bounds are fine: claims are only checked for being exceeded.
+CLAIM_VARIABLES: Dict[Tuple[int, int], Dict[str, float]] = {
+    (2023, 5): {"M": 1, "S": 1},
+    # the grid's area grows with the scale, a candidate check turns ~side times
+    (2024, 6): {"H": 0.5, "W": 0.5, "C": 1, "T": 0.5},
+    (2024, 7): {"Lines": 1, "N": 0},
+    (2024, 9): {"len(input)": 1},
+}
+
+# Exponent counted for a `log(...)` factor: log(n) grows like n^0.1 over the
+# default scales of inputs with thousands of items
+LOG_EXPONENT = 0.1
+
+CLAIM_TOKEN_PATTERN = re.compile(r"log(?=\()|\w+\(\w*\)|\d+(?:\.\d+)?|\w+|[-+*^()]")
+
+
+@dataclass
+class ComplexityResult:
+    solver: Solver
+    part: int
+    points: List[Tuple[float, float]] = field(default_factory=list)
+    exponent: Optional[float] = None
+    claim: Optional[str] = None
+    claimed_exponent: Optional[float] = None
+    error: Optional[str] = None
+
+    def is_claim_unchecked(self) -> bool:
+        # A claim was found but couldn't be turned into an exponent
+        return self.claim is not None and self.claimed_exponent is None
+
+    def is_worse_than_claimed(self, tolerance: float) -> bool:
+        return (
+            self.exponent is not None
+            and self.claimed_exponent is not None
+            and self.exponent > self.claimed_exponent + tolerance
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m runner.complexity",
+        description="Fit runtime scaling exponents of solvers on generated inputs.",
+    )
+    parser.add_argument("year", type=int, nargs="?", help="only run this year")
+    parser.add_argument("day", type=int, nargs="?", help="only run this day")
+    parser.add_argument(
+        "--scales",
+        type=float,
+        nargs="+",
+        default=DEFAULT_SCALES,
+        help="input scale factors to measure",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="generated inputs seed")
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="runs per scale, the fastest is used"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=30,
+        help="stop growing the input once a run exceeds this many seconds",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.3,
+        help="allowed excess of the measured exponent over the claimed one",
+    )
+    args = parser.parse_args()
+
+    solvers = [
+        solver
+        for solver in discover_solvers(
+            years=[args.year] if args.year else None,
+            days=[args.day] if args.day else None,
+        )
+        if get_generator(solver) is not None
+    ]
+
+    flagged = False
+    for solver in solvers:
+        for result in measure_solver(
+            solver, sorted(args.scales), args.seed, args.repeat, args.timeout
+        ):
+            print_complexity_result(result, args.tolerance)
+            flagged = (
+                flagged
+                or result.is_worse_than_claimed(args.tolerance)
+                or result.is_claim_unchecked()
+            )
+
+    if flagged:
+        sys.exit(1)
+
+
+def measure_solver(
+    solver: Solver,
+    scales: List[float],
+    seed: int = 0,
+    repeat: int = 3,
+    timeout: Optional[float] = None,
+) -> List[ComplexityResult]:
+    adapter = get_adapter(solver)
+    try:
+        module = load_module(solver)
+    except Exception as e:
+        return [ComplexityResult(solver, 0, error=f"import failed: {format_error(e)}")]
+
+    res: List[ComplexityResult] = []
+    for part in [1, 2]:
+        part_func = adapter.part(part)
+        if part_func is None:
+            continue
+
+        result = ComplexityResult(solver, part)
+        result.claim = find_claim(getattr(module, f"solve_part{part}", None))
+        if result.claim is not None:
+            result.claimed_exponent = claimed_exponent(
+                result.claim, CLAIM_VARIABLES.get((solver.year, solver.day), {})
+            )
+
+        with silenced(False):
+            for scale in scales:
+                input_name = generated_input_path(solver, scale, seed)
+                parse_result, input = run_phase(
+                    "parse", lambda: parse_input(solver, module, adapter, input_name)
+                )
+                if parse_result.error:
+                    result.error = parse_result.error
+                    break
+
+                seconds: List[float] = []
+                for _ in range(repeat):
+                    part_input = copy.deepcopy(input)
+                    part_result, _ = run_phase(
+                        f"part{part}", lambda: part_func(module, part_input), timeout
+                    )
+                    if part_result.error:
+                        result.error = part_result.error
+                        break
+                    seconds.append(part_result.seconds)
+
+                if seconds:
+                    result.points.append((scale, min(seconds)))
+                if result.error or (timeout and min(seconds) > timeout / 2):
+                    break
+
+        if len(result.points) >= 2:
+            result.exponent = fit_exponent(result.points)
+        res.append(result)
+
+    return res
+
+
+def fit_exponent(points: List[Tuple[float, float]]) -> float:
+    # least squares slope of log(time) over log(size)
+    xs = [math.log(scale) for scale, _ in points]
+    ys = [math.log(max(seconds, 1e-9)) for _, seconds in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sum(
+        (x - mean_x) ** 2 for x in xs
+    )
+
+
+def find_claim(func) -> Optional[str]:
+    if func is None:
+        return None
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        return None
+    match = CLAIM_PATTERN.search(source)
+    return match.group(1).strip() if match else None
+
+
+def claimed_exponent(claim: str, variables: Dict[str, float]) -> Optional[float]:
+    # Polynomial exponent of a claim such as `Lines * N * 3^N`, `H * W + C * T` or
+    # `(M + S) log(M + S)`: sums take the largest exponent of their terms, products
+    # (`*` or juxtaposition) add them, powers need a number or a constant variable
+    # in the exponent. Returns None when a term is not understood or grows
+    # exponentially.
+    tokens = CLAIM_TOKEN_PATTERN.findall(claim)
+    if "".join(tokens) != "".join(claim.split()):
+        return None
+    parser = ClaimParser(tokens, variables)
+    res = parser.sum()
+    return res if parser.pos == len(tokens) else None
+
+
+class ClaimParser:
+    # Recursive descent over claim tokens, every rule returns an exponent or None
+
+    def __init__(self, tokens: List[str], variables: Dict[str, float]) -> None:
+        self.tokens = tokens
+        self.variables = variables
+        self.pos = 0
+
+    def peek(self) -> Optional[str]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self, token: str) -> bool:
+        if self.peek() != token:
+            return False
+        self.pos += 1
+        return True
+
+    def sum(self) -> Optional[float]:
+        res = self.product()
+        while res is not None and self.take("+"):
+            term = self.product()
+            res = None if term is None else max(res, term)
+        return res
+
+    def product(self) -> Optional[float]:
+        res = self.power()
+        while res is not None and self.peek() not in (None, "+", ")"):
+            self.take("*")
+            factor = self.power()
+            res = None if factor is None else res + factor
+        return res
+
+    def power(self) -> Optional[float]:
+        base = self.atom()
+        if base is None or not self.take("^"):
+            return base
+
+        power = self.peek()
+        self.pos += 1
+        if power is None:
+            return None
+        if term_exponent(power, {}) is not None:
+            return base * float(power)
+        if base == 0 and self.variables.get(power) == 0:
+            return 0.0
+        return None
+
+    def atom(self) -> Optional[float]:
+        if self.take("log"):
+            if not self.take("("):
+                return None
+            inner = self.sum()
+            if inner is None or not self.take(")"):
+                return None
+            return LOG_EXPONENT if inner > 0 else 0.0
+
+        if self.take("("):
+            inner = self.sum()
+            return inner if self.take(")") else None
+
+        term = self.peek()
+        if term is None:
+            return None
+        self.pos += 1
+        return term_exponent(term, self.variables)
+
+
+def term_exponent(term: str, variables: Dict[str, float]) -> Optional[float]:
+    if term in variables:
+        return variables[term]
+    try:
+        float(term)
+        return 0.0
+    except ValueError:
+        return None
+
+
+def print_complexity_result(result: ComplexityResult, tolerance: float) -> None:
+    name = f"{result.solver.name} part{result.part}".ljust(17)
+    points = ", ".join(
+        f"x{scale:g}: {format_seconds(seconds)}" for scale, seconds in result.points
+    )
+    line = name
+    if result.exponent is not None:
+        line += f" ~ n^{result.exponent:.1f}"
+    if result.claim is not None:
+        line += f"  (claimed O({result.claim})"
+        if result.claimed_exponent is not None:
+            line += f" ~ n^{result.claimed_exponent:g}"
+        line += ")"
+    if result.is_worse_than_claimed(tolerance):
+        line += "  [WORSE THAN CLAIMED]"
+    if result.is_claim_unchecked():
+        line += "  [CLAIM NOT UNDERSTOOD]"
+    if result.error:
+        line += f"  error: {result.error}"
+    print(line, flush=True)
+    if points:
+        print(f"{''.ljust(17)} {points}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,420 @@
+import argparse
+import copy
+import importlib
+import importlib.util
+import sys
+from dataclasses import dataclass
+from random import Random
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from runner.discovery import Solver
+
+Args = Tuple[Any, ...]
+
+# A minimized input is no longer shrunk after this many successful steps
+MAX_SHRINK_STEPS = 1000
+
+
+@dataclass
+class Case:
+    # `reference` keeps the original brute force, `fast` is what the solver runs.
+    # Both are names of functions in the day module called with the same `Args`.
+    solver: Solver
+    reference: str
+    fast: str
+    generate: Callable[[Random], Args]
+    shrink: Callable[[Args], Iterator[Args]]
+    # Inputs outside the puzzle's guarantees, e.g. produced by shrinking
+    is_valid: Callable[[Args], bool] = lambda args: True
+    # Optional package the fast path imports, cases without it are skipped
+    requires: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.solver.name} {self.fast}"
+
+
+@dataclass
+class Mismatch:
+    case: Case
+    runs: int
+    args: Args
+    reference_outcome: str
+    fast_outcome: str
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m runner.differential",
+        description="Compare fast solver paths with their brute force references "
+        "on random small inputs.",
+    )
+    parser.add_argument("year", type=int, nargs="?", help="only run this year")
+    parser.add_argument("day", type=int, nargs="?", help="only run this day")
+    parser.add_argument("--runs", type=int, default=1000, help="random inputs per case")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+
+    mismatches = 0
+    for case in CASES:
+        if (args.year and case.solver.year != args.year) or (
+            args.day and case.solver.day != args.day
+        ):
+            continue
+        if not is_available(case):
+            print(f"{case.name}: skipped, {case.requires} is not installed")
+            continue
+        mismatch = check_case(case, args.runs, args.seed)
+        print_case_result(case, args.runs, mismatch)
+        mismatches += mismatch is not None
+
+    if mismatches:
+        sys.exit(1)
+
+
+def is_available(case: Case) -> bool:
+    return case.requires is None or importlib.util.find_spec(case.requires) is not None
+
+
+def check_case(case: Case, runs: int = 1000, seed: int = 0) -> Optional[Mismatch]:
+    # Returns the first mismatch, shrunk to a minimal input that still differs
+    module = importlib.import_module(case.solver.module_name)
+    reference = getattr(module, case.reference)
+    fast = getattr(module, case.fast)
+
+    def differs(args: Args) -> bool:
+        return outcome(reference, args) != outcome(fast, args)
+
+    rng = Random(f"{case.name}-{seed}")
+    for run in range(1, runs + 1):
+        args = case.generate(rng)
+        if not case.is_valid(args) or not differs(args):
+            continue
+
+        args = minimize(args, lambda a: case.is_valid(a) and differs(a), case.shrink)
+        return Mismatch(case, run, args, outcome(reference, args), outcome(fast, args))
+    return None
+
+
+def outcome(func: Callable[..., Any], args: Args) -> str:
+    # Exceptions are part of the behaviour, only their types are compared
+    try:
+        return repr(func(*copy.deepcopy(args)))
+    except Exception as e:
+        return f"raised {type(e).__name__}"
+
+
+def minimize(
+    args: Args, fails: Callable[[Args], bool], shrink: Callable[[Args], Iterator[Args]]
+) -> Args:
+    # Greedy: take the first smaller candidate that still fails until none does
+    for _ in range(MAX_SHRINK_STEPS):
+        smaller = next(
+            (candidate for candidate in shrink(args) if fails(candidate)), None
+        )
+        if smaller is None:
+            break
+        args = smaller
+    return args
+
+
+def shrink_int(n: int) -> Iterator[int]:
+    for candidate in dict.fromkeys([0, n // 2, n - 1 if n > 0 else n + 1]):
+        if abs(candidate) < abs(n):
+            yield candidate
+
+
+def shrink_list(
+    items: List[Any], shrink_item: Optional[Callable[[Any], Iterator[Any]]] = None
+) -> Iterator[List[Any]]:
+    for i in range(len(items)):
+        yield items[:i] + items[i + 1 :]
+    if shrink_item is not None:
+        for i, item in enumerate(items):
+            for smaller in shrink_item(item):
+                yield items[:i] + [smaller] + items[i + 1 :]
+
+
+def print_case_result(case: Case, runs: int, mismatch: Optional[Mismatch]) -> None:
+    if mismatch is None:
+        print(f"{case.name}: {runs} inputs match", flush=True)
+        return
+
+    print(f"{case.name}: MISMATCH on input {mismatch.runs}, minimized to", flush=True)
+    for arg in mismatch.args:
+        print(f"    {arg!r}")
+    print(f"  {case.reference}: {mismatch.reference_outcome}")
+    print(f"  {case.fast}: {mismatch.fast_outcome}", flush=True)
+
+
+# 2024 day2
+
+
+def random_report(rng: Random) -> Args:
+    report = [rng.randint(1, 20)]
+    for _ in range(rng.randint(2, 7)):
+        report.append(report[-1] + rng.randint(-4, 4))
+    return (report,)
+
+
+def shrink_report(args: Args) -> Iterator[Args]:
+    for report in shrink_list(args[0], shrink_int):
+        yield (report,)
+
+
+# 2023 day12
+
+
+def random_springs(rng: Random) -> Args:
+    from advent_of_code_2023.day12.day12 import SpringType
+
+    # Mostly unknown springs, so that many inputs have several arrangements
+    field = rng.choices(list(SpringType), weights=[1, 1, 2], k=rng.randint(1, 12))
+    damaged_counts = [rng.randint(1, 3) for _ in range(rng.randint(1, 4))]
+    return (field, damaged_counts)
+
+
+def shrink_springs(args: Args) -> Iterator[Args]:
+    field, damaged_counts = args
+    for smaller_field in shrink_list(field):
+        yield (smaller_field, damaged_counts)
+    for smaller_counts in shrink_list(damaged_counts, shrink_int):
+        yield (field, smaller_counts)
+
+
+def is_valid_springs(args: Args) -> bool:
+    field, damaged_counts = args
+    return len(field) > 0 and all(count > 0 for count in damaged_counts)
+
+
+# 2023 day13
+
+
+def random_mirror_board(rng: Random) -> Args:
+    # A board with a reflection and one cell flipped in the mirrored part,
+    # so that fixing the smudge moves the reflection as in the puzzle
+    height, width = rng.randint(2, 7), rng.randint(2, 7)
+    board = [[rng.choice(".#") for _ in range(width)] for _ in range(height)]
+    idx = rng.randint(1, height - 1)
+    for di in range(min(idx, height - idx)):
+        board[idx + di] = list(board[idx - 1 - di])
+
+    i, j = rng.randrange(height), rng.randrange(width)
+    board[i][j] = "#" if board[i][j] == "." else "."
+    lines = ["".join(row) for row in board]
+    if rng.random() < 0.5:
+        lines = transpose(lines)
+    return (lines,)
+
+
+def shrink_board(args: Args) -> Iterator[Args]:
+    (board,) = args
+    for smaller in shrink_list(board):
+        yield (smaller,)
+    for smaller in shrink_list(transpose(board)):
+        yield (transpose(smaller),)
+
+
+def is_valid_mirror_board(args: Args) -> bool:
+    from advent_of_code_2023.day13.day13 import find_all_reflections
+
+    (board,) = args
+    return (
+        len(board) > 0 and len(board[0]) > 0 and len(find_all_reflections(board)) == 1
+    )
+
+
+def transpose(board: List[str]) -> List[str]:
+    return ["".join(column) for column in zip(*board)]
+
+
+# 2024 day7
+
+
+def random_equation(rng: Random) -> Args:
+    args = [rng.randint(0, 12) for _ in range(rng.randint(1, 6))]
+    ops_universe_name = rng.choice(["short_ops_universe", "long_ops_universe"])
+
+    result = random_result(rng, args, ops_universe_name)
+    if rng.random() < 0.5:
+        result += rng.randint(-3, 3)
+
+    return ({"result": max(result, 0), "args": args}, ops_universe_name)
+
+
+def random_large_equation(rng: Random) -> Args:
+    # Operands around 2^32, so products leave int64 and may wrap around to the
+    # result or a small number
+    args = [
+        rng.choice(
+            [rng.randint(1, 12), rng.randint(2**20, 2**34), 2 ** rng.randint(16, 40)]
+        )
+        for _ in range(rng.randint(2, 5))
+    ]
+    ops_universe_name = rng.choice(["short_ops_universe", "long_ops_universe"])
+
+    result = random_result(rng, args, ops_universe_name)
+    choice = rng.random()
+    if choice < 0.3:
+        result %= 2**64
+    elif choice < 0.6:
+        result = rng.randint(0, 100)
+
+    return ({"result": result, "args": args}, ops_universe_name)
+
+
+def random_result(rng: Random, args: List[int], ops_universe_name: str) -> int:
+    result = args[0]
+    for arg in args[1:]:
+        op = rng.choice("+*|" if ops_universe_name == "long_ops_universe" else "+*")
+        if op == "+":
+            result += arg
+        elif op == "*":
+            result *= arg
+        else:
+            result = int(f"{result}{arg}")
+    return result
+
+
+def shrink_equation(args: Args) -> Iterator[Args]:
+    equation, ops_universe_name = args
+    for smaller_args in shrink_list(equation["args"], shrink_int):
+        if smaller_args:
+            yield (
+                {"result": equation["result"], "args": smaller_args},
+                ops_universe_name,
+            )
+    for result in shrink_int(equation["result"]):
+        yield ({"result": result, "args": equation["args"]}, ops_universe_name)
+    if ops_universe_name == "long_ops_universe":
+        yield (equation, "short_ops_universe")
+
+
+# 2024 day6
+
+
+def random_lab(rng: Random) -> Args:
+    from utils.grid import Grid
+
+    height, width = rng.randint(4, 12), rng.randint(4, 12)
+    density = rng.random() * 0.25
+    lines = [
+        "".join("#" if rng.random() < density else "." for _ in range(width))
+        for _ in range(height)
+    ]
+    board = Grid.from_lines(lines)
+
+    # A guard boxed in by obstacles turns forever in both versions
+    guard_pos = rng.choice(list(board.offsets()))
+    board.cells[guard_pos] = ord("^")
+    for neighbour in board.neighbours(guard_pos):
+        board.cells[neighbour] = ord(".")
+    return (board,)
+
+
+def shrink_lab(args: Args) -> Iterator[Args]:
+    # Obstacles removed one at a time
+    (board,) = args
+    for pos in board.find_all("#"):
+        smaller = board.copy()
+        smaller.cells[pos] = ord(".")
+        yield (smaller,)
+
+
+def is_valid_lab(args: Args) -> bool:
+    # The guard has to leave the lab without the added obstacle
+    from advent_of_code_2024.day6.day6 import run_simulation
+
+    (board,) = args
+    return not run_simulation(board.copy())
+
+
+# 2024 day9
+
+
+def random_disk_map(rng: Random) -> Args:
+    files = rng.randint(1, 12)
+    digits = [str(rng.randint(1, 9)) for _ in range(2 * files - 1)]
+    for i in range(1, len(digits), 2):
+        if rng.random() < 0.3:
+            digits[i] = "0"
+    return ("".join(digits),)
+
+
+def shrink_disk_map(args: Args) -> Iterator[Args]:
+    # Drops the last file with its space, then lowers digits one at a time
+    (disk_map,) = args
+    if len(disk_map) > 1:
+        yield (disk_map[:-2],)
+    for i, digit in enumerate(disk_map):
+        for smaller in shrink_int(int(digit)):
+            if smaller > 0 or i % 2 == 1:
+                yield (disk_map[:i] + str(smaller) + disk_map[i + 1 :],)
+
+
+CASES: List[Case] = [
+    Case(
+        Solver(2024, 2),
+        "is_valid_report_part2_brute_force",
+        "is_valid_report_part2",
+        random_report,
+        shrink_report,
+    ),
+    Case(
+        Solver(2023, 12),
+        "calc_arrangements",
+        "count_arrangements",
+        random_springs,
+        shrink_springs,
+        is_valid_springs,
+    ),
+    Case(
+        Solver(2023, 13),
+        "find_reflection_with_smudge_brute_force",
+        "find_reflection_with_smudge",
+        random_mirror_board,
+        shrink_board,
+        is_valid_mirror_board,
+    ),
+    Case(
+        Solver(2024, 7),
+        "is_valid_equation_brute_force",
+        "is_valid_equation",
+        random_equation,
+        shrink_equation,
+    ),
+    Case(
+        Solver(2024, 7),
+        "is_valid_equation_brute_force",
+        "is_valid_equation_forward",
+        random_equation,
+        shrink_equation,
+    ),
+    Case(
+        Solver(2024, 7),
+        "is_valid_equation_brute_force",
+        "is_valid_equation_numpy",
+        random_large_equation,
+        shrink_equation,
+        requires="numpy",
+    ),
+    Case(
+        Solver(2024, 6),
+        "solve_part2_brute_force",
+        "solve_part2",
+        random_lab,
+        shrink_lab,
+        is_valid_lab,
+    ),
+    Case(
+        Solver(2024, 9),
+        "solve_part2_brute_force",
+        "solve_part2",
+        random_disk_map,
+        shrink_disk_map,
+    ),
+]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import os
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+YEAR_DIR_PATTERN = re.compile(r"advent_of_code_(\d{4})")
+DAY_DIR_PATTERN = re.compile(r"day(\d+)")
+
+
+@dataclass(frozen=True)
+class Solver:
+    year: int
+    day: int
+
+    @property
+    def name(self) -> str:
+        return f"{self.year} day{self.day}"
+
+    @property
+    def module_name(self) -> str:
+        return f"advent_of_code_{self.year}.day{self.day}.day{self.day}"
+
+    @property
+    def dir(self) -> str:
+        return os.path.join(SRC_DIR, f"advent_of_code_{self.year}", f"day{self.day}")
+
+    def input_path(self, input_name: str = "input.txt") -> str:
+        return os.path.join(self.dir, input_name)
+
+
+def discover_solvers(
+    years: Optional[Sequence[int]] = None, days: Optional[Sequence[int]] = None
+) -> List[Solver]:
+    res: List[Solver] = []
+
+    for year_dir in os.listdir(SRC_DIR):
+        year_match = YEAR_DIR_PATTERN.fullmatch(year_dir)
+        if not year_match:
+            continue
+        year = int(year_match.group(1))
+        if years and year not in years:
+            continue
+
+        for day_dir in os.listdir(os.path.join(SRC_DIR, year_dir)):
+            day_match = DAY_DIR_PATTERN.fullmatch(day_dir)
+            if not day_match:
+                continue
+            day = int(day_match.group(1))
+            if days and day not in days:
+                continue
+
+            solver = Solver(year, day)
+            if os.path.isfile(os.path.join(solver.dir, f"day{day}.py")):
+                res.append(solver)
+
+    return sorted(res, key=lambda s: (s.year, s.day))
@@ -0,0 +1,13 @@
+from random import Random
+from typing import List
+
+
+def disk_map(scale: float, rng: Random) -> List[str]:
+    # 2024 day9: alternating file and free space lengths, files are never empty
+    files = max(1, round(10000 * scale))
+    digits: List[str] = []
+    for i in range(files):
+        if i > 0:
+            digits.append(str(rng.randint(0, 9)))
+        digits.append(str(rng.randint(1, 9)))
+    return ["".join(digits)]
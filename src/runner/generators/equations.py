@@ -0,0 +1,29 @@
+from random import Random
+from typing import List
+
+
+def calibration_equations(scale: float, rng: Random) -> List[str]:
+    # 2024 day7: about half of the equations can be made true
+    return [
+        calibration_equation(rng, rng.randint(3, 12))
+        for _ in range(max(1, round(850 * scale)))
+    ]
+
+
+def calibration_equation(rng: Random, args_count: int) -> str:
+    args = [rng.randint(1, 999) for _ in range(args_count)]
+
+    result = args[0]
+    for arg in args[1:]:
+        op = rng.choice("+*|")
+        if op == "+":
+            result += arg
+        elif op == "*":
+            result *= arg
+        else:
+            result = int(f"{result}{arg}")
+
+    if rng.random() < 0.5:
+        result += rng.randint(1, 9)
+
+    return f"{result}: {' '.join(map(str, args))}"
@@ -0,0 +1,35 @@
+import string
+from random import Random
+from typing import List, Set, Tuple
+
+
+def node_name(idx: int, width: int) -> str:
+    letters = string.ascii_lowercase
+    name = ""
+    for _ in range(width):
+        name = letters[idx % len(letters)] + name
+        idx //= len(letters)
+    return name
+
+
+def lan_party(scale: float, rng: Random) -> List[str]:
+    # 2024 day23: random network with one planted clique
+    nodes_count = max(14, round(520 * scale))
+    width = 2
+    while len(string.ascii_lowercase) ** width < nodes_count:
+        width += 1
+    nodes = [node_name(idx, width) for idx in rng.sample(range(26**width), nodes_count)]
+
+    edges: Set[Tuple[str, str]] = set()
+    for a in nodes:
+        for b in rng.sample(nodes, 6):
+            if a != b:
+                edges.add((min(a, b), max(a, b)))
+
+    clique = rng.sample(nodes, 13)
+    for a in clique:
+        for b in clique:
+            if a < b:
+                edges.add((a, b))
+
+    return [f"{a}-{b}" if rng.random() < 0.5 else f"{b}-{a}" for a, b in edges]
@@ -0,0 +1,127 @@
+import math
+from collections import deque
+from random import Random
+from typing import Dict, List, Tuple
+
+EMPTY_CHAR = "."
+
+
+def scaled_side(base_side: int, scale: float) -> int:
+    # `scale` multiplies the area, not the side
+    return max(1, round(base_side * math.sqrt(scale)))
+
+
+def random_grid(
+    width: int, height: int, char_weights: Dict[str, float], rng: Random
+) -> List[List[str]]:
+    chars = list(char_weights.keys())
+    weights = list(char_weights.values())
+    return [rng.choices(chars, weights, k=width) for _ in range(height)]
+
+
+def place_randomly(grid: List[List[str]], ch: str, rng: Random) -> Tuple[int, int]:
+    while True:
+        i = rng.randrange(len(grid))
+        j = rng.randrange(len(grid[0]))
+        if grid[i][j] == EMPTY_CHAR:
+            grid[i][j] = ch
+            return (i, j)
+
+
+def to_lines(grid: List[List[str]]) -> List[str]:
+    return ["".join(row) for row in grid]
+
+
+def guard_map(scale: float, rng: Random) -> List[str]:
+    # 2024 day6: obstacles and a single guard facing up
+    side = scaled_side(130, scale)
+    grid = random_grid(side, side, {EMPTY_CHAR: 0.95, "#": 0.05}, rng)
+    place_randomly(grid, "^", rng)
+    return to_lines(grid)
+
+
+def galaxy_image(scale: float, rng: Random) -> List[str]:
+    # 2023 day11: sparse galaxies, some rows and columns left empty for expansion
+    side = scaled_side(140, scale)
+    empty_rows = set(rng.sample(range(side), side // 15))
+    empty_cols = set(rng.sample(range(side), side // 15))
+    return [
+        "".join(
+            (
+                "#"
+                if i not in empty_rows and j not in empty_cols and rng.random() < 0.022
+                else EMPTY_CHAR
+            )
+            for j in range(side)
+        )
+        for i in range(side)
+    ]
+
+
+def rock_platform(scale: float, rng: Random) -> List[str]:
+    # 2023 day14: round rocks, cube rocks and empty space
+    side = scaled_side(100, scale)
+    return to_lines(
+        random_grid(side, side, {EMPTY_CHAR: 0.62, "O": 0.2, "#": 0.18}, rng)
+    )
+
+
+def topographic_map(scale: float, rng: Random) -> List[str]:
+    # 2024 day10: hills sloping down from random peaks so that hiking trails exist
+    side = scaled_side(55, scale)
+    peaks = [
+        (rng.randrange(side), rng.randrange(side)) for _ in range(side * side // 60)
+    ]
+    dists = multi_source_distances(side, peaks)
+    return [
+        "".join(
+            str(rng.randint(0, 9) if rng.random() < 0.1 else max(0, 9 - dists[i][j]))
+            for j in range(side)
+        )
+        for i in range(side)
+    ]
+
+
+def multi_source_distances(
+    side: int, sources: List[Tuple[int, int]]
+) -> List[List[int]]:
+    dists = [[-1] * side for _ in range(side)]
+    queue = deque(sources)
+    for i, j in sources:
+        dists[i][j] = 0
+    while queue:
+        i, j = queue.popleft()
+        for next_i, next_j in [(i + 1, j), (i - 1, j), (i, j + 1), (i, j - 1)]:
+            if 0 <= next_i < side and 0 <= next_j < side and dists[next_i][next_j] < 0:
+                dists[next_i][next_j] = dists[i][j] + 1
+                queue.append((next_i, next_j))
+    return dists
+
+
+def antenna_map(scale: float, rng: Random) -> List[str]:
+    # 2024 day8: a few antennas per frequency
+    side = scaled_side(50, scale)
+    grid = random_grid(side, side, {EMPTY_CHAR: 1}, rng)
+    frequencies = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    for _ in range(max(1, side * side // 12)):
+        place_randomly(grid, rng.choice(frequencies), rng)
+    return to_lines(grid)
+
+
+def garden_plots(scale: float, rng: Random) -> List[str]:
+    # 2024 day12: blocky regions of plant types with noisy borders
+    side = scaled_side(140, scale)
+    block = 7
+    blocks = [
+        [rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(side // block + 1)]
+        for _ in range(side // block + 1)
+    ]
+    return [
+        "".join(
+            blocks[(i + rng.randrange(-2, 3)) // block][
+                (j + rng.randrange(-2, 3)) // block
+            ]
+            for j in range(side)
+        )
+        for i in range(side)
+    ]
@@ -0,0 +1,64 @@
+from random import Random
+from typing import List
+
+ALMANAC_MAP_NAMES = [
+    "seed-to-soil",
+    "soil-to-fertilizer",
+    "fertilizer-to-water",
+    "water-to-light",
+    "light-to-temperature",
+    "temperature-to-humidity",
+    "humidity-to-location",
+]
+
+ALMANAC_UNIVERSE = 2**32
+
+
+def almanac(scale: float, rng: Random) -> List[str]:
+    # 2023 day5: seed ranges and maps that permute consecutive segments
+    seed_pairs = max(1, round(10 * scale))
+    seeds: List[int] = []
+    for _ in range(seed_pairs):
+        start = rng.randrange(ALMANAC_UNIVERSE // 2)
+        seeds.extend([start, rng.randrange(1, ALMANAC_UNIVERSE // (4 * seed_pairs))])
+
+    res = ["seeds: " + " ".join(map(str, seeds))]
+    for name in ALMANAC_MAP_NAMES:
+        res.append("")
+        res.append(f"{name} map:")
+        res.extend(almanac_map(max(1, round(35 * scale)), rng))
+    return res
+
+
+def almanac_map(ranges_count: int, rng: Random) -> List[str]:
+    cuts = sorted(rng.sample(range(1, ALMANAC_UNIVERSE), ranges_count))
+    bounds = [0] + cuts + [ALMANAC_UNIVERSE]
+    segments = [(bounds[i], bounds[i + 1] - bounds[i]) for i in range(len(bounds) - 1)]
+
+    dests = segments.copy()
+    rng.shuffle(dests)
+    dest_starts: List[int] = []
+    pos = 0
+    for _, length in dests:
+        dest_starts.append(pos)
+        pos += length
+
+    # leave one segment unmapped so identity mapping is exercised as well
+    mapped = list(zip(dest_starts, dests))[1:]
+    return [
+        f"{dest_start} {source_start} {length}"
+        for dest_start, (source_start, length) in mapped
+    ]
+
+
+def section_pairs(scale: float, rng: Random) -> List[str]:
+    # 2022 day4: pairs of section ranges
+    return [
+        f"{section_range(rng)},{section_range(rng)}"
+        for _ in range(max(1, round(1000 * scale)))
+    ]
+
+
+def section_range(rng: Random) -> str:
+    start = rng.randint(1, 99)
+    return f"{start}-{rng.randint(start, 99)}"
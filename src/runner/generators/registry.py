@@ -0,0 +1,66 @@
+import inspect
+import os
+import tempfile
+from random import Random
+from typing import Callable, Dict, List, Optional, Tuple
+
+from runner.discovery import Solver
+from runner.hashing import file_hash
+from runner.generators import disk_maps, equations, graphs, grids, interval_maps
+
+Generator = Callable[[float, Random], List[str]]
+
+GENERATORS: Dict[Tuple[int, int], Generator] = {
+    (2022, 4): interval_maps.section_pairs,
+    (2023, 5): interval_maps.almanac,
+    (2023, 11): grids.galaxy_image,
+    (2023, 14): grids.rock_platform,
+    (2024, 6): grids.guard_map,
+    (2024, 7): equations.calibration_equations,
+    (2024, 8): grids.antenna_map,
+    (2024, 9): disk_maps.disk_map,
+    (2024, 10): grids.topographic_map,
+    (2024, 12): grids.garden_plots,
+    (2024, 23): graphs.lan_party,
+}
+
+GENERATED_INPUTS_DIR = os.path.join(tempfile.gettempdir(), "aoc-generated-inputs")
+
+
+def get_generator(solver: Solver) -> Optional[Generator]:
+    return GENERATORS.get((solver.year, solver.day))
+
+
+def generator_hash(solver: Solver) -> str:
+    # Generators and their helpers live in one module per input kind
+    generator = get_generator(solver)
+    if generator is None:
+        raise ValueError(f"No input generator for {solver.name}")
+    return file_hash(inspect.getfile(generator))
+
+
+def generate_input(solver: Solver, scale: float, seed: int = 0) -> List[str]:
+    generator = get_generator(solver)
+    if generator is None:
+        raise ValueError(f"No input generator for {solver.name}")
+    return generator(scale, Random(f"{solver.year}-{solver.day}-{seed}"))
+
+
+def generated_input_path(solver: Solver, scale: float, seed: int = 0) -> str:
+    # Generated once per (solver, scale, seed) and reused, the output is deterministic.
+    # The name includes a hash of the generator's module, so editing a generator or
+    # its helpers makes a new file instead of reusing a stale one, and benchmark
+    # history keyed by the name starts over.
+    # The returned path is absolute so it can be passed wherever an input name is expected.
+    path = os.path.join(
+        GENERATED_INPUTS_DIR,
+        f"{solver.year}-day{solver.day}-x{scale:g}-seed{seed}"
+        f"-{generator_hash(solver)[:12]}.txt",
+    )
+    if not os.path.exists(path):
+        os.makedirs(GENERATED_INPUTS_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write("\n".join(generate_input(solver, scale, seed)) + "\n")
+        os.replace(tmp_path, path)
+    return path
@@ -0,0 +1,51 @@
+import hashlib
+import inspect
+import os
+from functools import lru_cache
+from types import ModuleType
+from typing import Any, Iterable
+
+from runner.discovery import SRC_DIR
+
+UTILS_DIR = os.path.join(SRC_DIR, "utils")
+
+
+def file_hash(file_name: str) -> str:
+    with open(file_name, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def combined_hash(parts: Iterable[str]) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def module_hash(module: ModuleType) -> str:
+    return file_hash(inspect.getfile(module))
+
+
+def function_source(func: Any) -> str:
+    try:
+        return inspect.getsource(func)
+    except (OSError, TypeError):
+        return repr(func)
+
+
+@lru_cache(maxsize=None)
+def utils_hash() -> str:
+    # Solvers import shared code from `utils` only, so hashing the whole
+    # package covers their transitive dependencies
+    file_names = sorted(
+        os.path.join(dir_path, file_name)
+        for dir_path, dir_names, file_names in os.walk(UTILS_DIR)
+        if "tests" not in os.path.relpath(dir_path, UTILS_DIR).split(os.sep)
+        for file_name in file_names
+        if file_name.endswith(".py")
+    )
+    return combined_hash(
+        f"{os.path.relpath(file_name, UTILS_DIR)}:{file_hash(file_name)}"
+        for file_name in file_names
+    )
@@ -0,0 +1,77 @@
+import json
+import os
+from types import ModuleType
+from typing import Any, Dict, Optional
+
+from runner.adapters import Adapter
+from runner.discovery import Solver
+from runner.hashing import (
+    combined_hash,
+    file_hash,
+    function_source,
+    module_hash,
+    utils_hash,
+)
+
+MEMO_USE = "use"
+MEMO_FORCE = "force"
+MEMO_VERIFY = "verify"
+
+
+class ResultMemo:
+    # Answers stored per (solver source, utils source, input, part), one JSON
+    # file per key so that process pool workers never write the same file
+
+    def __init__(
+        self,
+        memo_dir: str,
+        solver: Solver,
+        module: ModuleType,
+        adapter: Adapter,
+        input_name: str,
+    ) -> None:
+        self.dir = os.path.join(memo_dir, "results")
+        self.adapter = adapter
+        self.base_hash = combined_hash(
+            [
+                module_hash(module),
+                function_source(adapter.parse),
+                utils_hash(),
+                file_hash(solver.input_path(input_name)),
+            ]
+        )
+
+    def key(self, part: int) -> str:
+        return combined_hash(
+            [self.base_hash, function_source(self.adapter.part(part)), f"part{part}"]
+        )
+
+    def load(self, part: int) -> Optional[Dict[str, Any]]:
+        file_name = self.file_name(part)
+        if not os.path.exists(file_name):
+            return None
+        with open(file_name) as f:
+            return json.load(f)
+
+    def save(self, part: int, answer: Any, seconds: float) -> None:
+        os.makedirs(self.dir, exist_ok=True)
+        file_name = self.file_name(part)
+        tmp_file_name = f"{file_name}.{os.getpid()}.tmp"
+        with open(tmp_file_name, "w") as f:
+            json.dump({"answer": to_json(answer), "seconds": seconds}, f)
+        os.replace(tmp_file_name, file_name)
+
+    def file_name(self, part: int) -> str:
+        return os.path.join(self.dir, f"{self.key(part)}.json")
+
+
+def to_json(answer: Any) -> Any:
+    return (
+        answer
+        if isinstance(answer, (int, float, str, bool, type(None)))
+        else str(answer)
+    )
+
+
+def same_answer(stored: Any, answer: Any) -> bool:
+    return str(stored) == str(to_json(answer))
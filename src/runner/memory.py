@@ -0,0 +1,128 @@
+import os
+import sys
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional
+
+from runner.discovery import SRC_DIR
+
+# A new snapshot is taken once traced memory grows this much past the last one
+SNAPSHOT_GROWTH = 1.1
+SNAPSHOT_POLL_SECONDS = 0.05
+
+
+@dataclass
+class MemoryStats:
+    # Process high-water mark while the phase ran (bytes), includes the
+    # interpreter, the parsed input and tracemalloc's own bookkeeping
+    peak_rss: int = 0
+    # Peak of memory allocated by Python code during the phase (bytes)
+    traced_peak: int = 0
+    # "file:line size (blocks)" of the biggest allocation sites near the peak
+    top_allocations: List[str] = field(default_factory=list)
+
+
+@contextmanager
+def tracking_memory(top: int = 5) -> Iterator[MemoryStats]:
+    stats = MemoryStats()
+    sampler = PeakSnapshots()
+    sampler.start()
+    reset_peak_rss()
+    tracemalloc.start()
+    try:
+        yield stats
+    finally:
+        sampler.stop()
+        snapshot = sampler.snapshot
+        current, stats.traced_peak = tracemalloc.get_traced_memory()
+        if snapshot is None or current >= sampler.snapshot_size:
+            snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        stats.peak_rss = read_peak_rss()
+        stats.top_allocations = top_allocations(snapshot, top)
+
+
+class PeakSnapshots(threading.Thread):
+    # tracemalloc can only snapshot blocks that are still alive, so memory freed
+    # before the phase ends would never show up in a final snapshot. This thread
+    # keeps the snapshot taken closest to the peak instead.
+
+    def __init__(self) -> None:
+        super().__init__(daemon=True)
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.snapshot_size = 0
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self.stopped.wait(SNAPSHOT_POLL_SECONDS):
+            current, _ = tracemalloc.get_traced_memory()
+            if (
+                tracemalloc.is_tracing()
+                and current > self.snapshot_size * SNAPSHOT_GROWTH
+            ):
+                self.snapshot = tracemalloc.take_snapshot()
+                self.snapshot_size = current
+
+    def stop(self) -> None:
+        self.stopped.set()
+        self.join()
+
+
+def top_allocations(snapshot: tracemalloc.Snapshot, top: int) -> List[str]:
+    snapshot = snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, threading.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(
+                False, os.path.join(os.path.dirname(__file__), "runner.py")
+            ),
+        ]
+    )
+    res: List[str] = []
+    for stat in snapshot.statistics("lineno")[:top]:
+        frame = stat.traceback[0]
+        file_name = frame.filename
+        if file_name.startswith(SRC_DIR):
+            file_name = os.path.relpath(file_name, SRC_DIR)
+        res.append(
+            f"{file_name}:{frame.lineno} {format_bytes(stat.size)} "
+            f"({stat.count} blocks)"
+        )
+    return res
+
+
+def reset_peak_rss() -> None:
+    # Linux resets the VmHWM high-water mark on this write, elsewhere the
+    # peak covers the whole process lifetime
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def read_peak_rss() -> int:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, KiB elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def format_bytes(size: float) -> str:
+    for unit in ["B", "KiB", "MiB"]:
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
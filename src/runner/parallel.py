@@ -0,0 +1,69 @@
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from runner.discovery import Solver
+from runner.memo import MEMO_USE
+from runner.runner import PARSE_PHASE, SolverResult, run_solver
+
+PARTS = [1, 2]
+
+
+def run_solvers_parallel(
+    inputs: Sequence[Tuple[Solver, str]],
+    verbose: bool = False,
+    timeout: Optional[float] = None,
+    jobs: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+    memo_dir: Optional[str] = None,
+    memo_mode: str = MEMO_USE,
+    memory_top: Optional[int] = None,
+) -> Iterator[SolverResult]:
+    # Each (day, part) is a separate task, every task parses its own input.
+    # Results are yielded in the order of `inputs` regardless of completion order.
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as executor:
+        futures: List[Tuple[Solver, List[Future[SolverResult]]]] = [
+            (
+                solver,
+                [
+                    executor.submit(
+                        run_solver,
+                        solver,
+                        input_name,
+                        verbose,
+                        [part],
+                        timeout,
+                        cache_dir,
+                        memo_dir,
+                        memo_mode,
+                        memory_top,
+                    )
+                    for part in PARTS
+                ],
+            )
+            for solver, input_name in inputs
+        ]
+
+        for solver, part_futures in futures:
+            yield merge_part_results(solver, [f.result() for f in part_futures])
+
+
+def merge_part_results(
+    solver: Solver, part_results: List[SolverResult]
+) -> SolverResult:
+    for part_result in part_results:
+        if part_result.skip_reason:
+            return part_result
+
+    # Tasks whose parts were all memoized have no parse phase
+    parse_phases = [
+        p
+        for part_result in part_results
+        for p in part_result.phases
+        if p.phase == PARSE_PHASE
+    ]
+    res = SolverResult(solver, parse_phases[:1])
+    for part_result in part_results:
+        res.phases.extend(p for p in part_result.phases if p.phase != PARSE_PHASE)
+
+    return res
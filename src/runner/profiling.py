@@ -0,0 +1,149 @@
+import copy
+import cProfile
+import os
+import pstats
+from collections import defaultdict
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from runner.adapters import get_adapter
+from runner.discovery import Solver
+from runner.runner import (
+    PARSE_PHASE,
+    PhaseResult,
+    SolverResult,
+    format_error,
+    load_module,
+    parse_input,
+    run_phase,
+    silenced,
+)
+
+DEFAULT_PROFILE_DIR = "profiles"
+
+# Call paths carrying less than this share of a phase are folded into their parent
+MIN_STACK_SHARE = 1e-4
+
+Func = Tuple[str, int, str]
+
+
+def profile_solver(
+    solver: Solver,
+    input_name: str = "input.txt",
+    profile_dir: str = DEFAULT_PROFILE_DIR,
+    top: int = 15,
+    parts: Sequence[int] = (1, 2),
+    timeout: Optional[float] = None,
+    cache_dir: Optional[str] = None,
+) -> SolverResult:
+    # Same phases as `run_solver`, each one under cProfile. Writes
+    # `<year>_day<day>_<phase>.pstats` and a `.collapsed` stack file for
+    # flamegraph tools, and prints the top functions by own time.
+    adapter = get_adapter(solver)
+    if adapter.skip_reason:
+        return SolverResult(solver, skip_reason=adapter.skip_reason)
+
+    try:
+        module = load_module(solver)
+    except Exception as e:
+        return SolverResult(solver, skip_reason=f"import failed: {format_error(e)}")
+
+    os.makedirs(profile_dir, exist_ok=True)
+    phases: List[Tuple[str, Callable[[Any], Any]]] = [
+        (
+            PARSE_PHASE,
+            lambda _: parse_input(solver, module, adapter, input_name, cache_dir),
+        )
+    ]
+    for part in parts:
+        part_func = adapter.part(part)
+        if part_func is not None:
+            phases.append((f"part{part}", partial(part_func, module)))
+
+    result = SolverResult(solver)
+    input: Any = None
+    for phase, func in phases:
+        phase_input = copy.deepcopy(input)
+        profiler = cProfile.Profile()
+        with silenced(False):
+            phase_result, answer = run_phase(
+                phase, lambda: profiler.runcall(func, phase_input), timeout
+            )
+        result.phases.append(phase_result)
+
+        file_name = os.path.join(profile_dir, f"{solver.year}_day{solver.day}_{phase}")
+        write_profile(profiler, file_name)
+        print_top_functions(phase_result, profiler, top)
+
+        if phase_result.error:
+            break
+        if phase == PARSE_PHASE:
+            input = answer
+
+    return result
+
+
+def write_profile(profiler: cProfile.Profile, file_name: str) -> None:
+    stats = pstats.Stats(profiler)
+    stats.dump_stats(f"{file_name}.pstats")
+    with open(f"{file_name}.collapsed", "w") as f:
+        for stack, seconds in sorted(collapsed_stacks(stats).items()):
+            microseconds = round(seconds * 1e6)
+            if microseconds > 0:
+                f.write(f"{stack} {microseconds}\n")
+
+
+def collapsed_stacks(stats: pstats.Stats) -> Dict[str, float]:
+    # cProfile only records caller -> callee edges, so call paths are rebuilt
+    # from the roots by splitting each function's time among its callees in
+    # proportion to the time spent through every edge
+    entries = stats.stats  # type: ignore[attr-defined]
+    callees: Dict[Func, Dict[Func, float]] = defaultdict(dict)
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, (_, _, _, edge_cumtime) in callers.items():
+            callees[caller][func] = edge_cumtime
+
+    roots = [func for func, entry in entries.items() if not entry[4]]
+    total = sum(entries[func][3] for func in roots)
+    min_seconds = total * MIN_STACK_SHARE
+    res: Dict[str, float] = defaultdict(float)
+
+    def expand(func: Func, seconds: float, stack: List[Func]) -> None:
+        path = ";".join(map(func_label, stack + [func]))
+        _, _, tottime, cumtime, _ = entries[func]
+        if cumtime <= 0:
+            res[path] += seconds
+            return
+
+        scale = seconds / cumtime
+        self_seconds = tottime * scale
+        for callee, edge_cumtime in callees[func].items():
+            callee_seconds = edge_cumtime * scale
+            if callee in stack or callee == func or callee_seconds < min_seconds:
+                self_seconds += callee_seconds
+            else:
+                expand(callee, callee_seconds, stack + [func])
+        res[path] += self_seconds
+
+    for root in roots:
+        expand(root, entries[root][3], [])
+    return res
+
+
+def func_label(func: Func) -> str:
+    file_name, line, name = func
+    if file_name == "~":
+        return name  # built-in
+    return f"{name} ({os.path.basename(file_name)}:{line})"
+
+
+def print_top_functions(
+    phase_result: PhaseResult, profiler: cProfile.Profile, top: int
+) -> None:
+    entries = pstats.Stats(profiler).stats  # type: ignore[attr-defined]
+    hottest = sorted(entries.items(), key=lambda item: item[1][2], reverse=True)
+    print(f"{phase_result.phase}: top {top} functions by own time", flush=True)
+    print(f"{'ncalls':>10} {'tottime':>9} {'cumtime':>9}  function")
+    for func, (_, ncalls, tottime, cumtime, _) in hottest[:top]:
+        print(f"{ncalls:>10} {tottime:>9.3f} {cumtime:>9.3f}  {func_label(func)}")
+    print(flush=True)
@@ -0,0 +1,223 @@
+import copy
+import importlib
+import os
+import signal
+import time
+from contextlib import contextmanager, redirect_stdout
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from runner.adapters import Adapter, PartFunc, get_adapter
+from runner.cache import cached_parse
+from runner.discovery import Solver
+from runner.memo import MEMO_USE, MEMO_VERIFY, ResultMemo, same_answer
+from runner.memory import MemoryStats, tracking_memory
+from utils.memoize import MemoStats, memo_stats, reset_memos
+
+PARSE_PHASE = "parse"
+
+
+@dataclass
+class PhaseResult:
+    phase: str
+    seconds: float = 0.0
+    answer: Any = None
+    error: Optional[str] = None
+    # Answer taken from the result memo instead of running the part
+    cached: bool = False
+    # Memoized answer that differs from the recomputed one (`--verify`)
+    mismatch: Optional[str] = None
+    # Peak memory of the phase, measured when run with `memory_top`
+    memory: Optional[MemoryStats] = None
+    # Counters of `utils.memoize` caches used by the phase
+    memos: List[MemoStats] = field(default_factory=list)
+
+
+@dataclass
+class SolverResult:
+    solver: Solver
+    phases: List[PhaseResult] = field(default_factory=list)
+    skip_reason: Optional[str] = None
+
+    @property
+    def seconds(self) -> float:
+        return sum(p.seconds for p in self.phases)
+
+
+def run_solver(
+    solver: Solver,
+    input_name: str = "input.txt",
+    verbose: bool = False,
+    parts: Sequence[int] = (1, 2),
+    timeout: Optional[float] = None,
+    cache_dir: Optional[str] = None,
+    memo_dir: Optional[str] = None,
+    memo_mode: str = MEMO_USE,
+    memory_top: Optional[int] = None,
+) -> SolverResult:
+    adapter = get_adapter(solver)
+    if adapter.skip_reason:
+        return SolverResult(solver, skip_reason=adapter.skip_reason)
+
+    try:
+        module = load_module(solver)
+    except Exception as e:
+        return SolverResult(solver, skip_reason=f"import failed: {format_error(e)}")
+
+    # Parts a day doesn't solve (e.g. the last day has no part 2) are skipped
+    part_funcs: Dict[int, PartFunc] = {}
+    for part in parts:
+        part_func = adapter.part(part)
+        if part_func is not None:
+            part_funcs[part] = part_func
+    parts = list(part_funcs)
+    memo = (
+        ResultMemo(memo_dir, solver, module, adapter, input_name) if memo_dir else None
+    )
+
+    cached_phases: Dict[int, PhaseResult] = {}
+    if memo is not None and memo_mode == MEMO_USE:
+        for part in parts:
+            stored = memo.load(part)
+            if stored is not None:
+                cached_phases[part] = PhaseResult(
+                    f"part{part}", answer=stored["answer"], cached=True
+                )
+    if len(cached_phases) == len(parts):
+        return SolverResult(solver, [cached_phases[part] for part in parts])
+
+    with silenced(verbose):
+        parse_result, input = run_phase(
+            PARSE_PHASE,
+            lambda: parse_input(solver, module, adapter, input_name, cache_dir),
+            timeout,
+            memory_top,
+        )
+        result = SolverResult(solver, [parse_result])
+        if parse_result.error:
+            return result
+
+        for part in parts:
+            if part in cached_phases:
+                result.phases.append(cached_phases[part])
+                continue
+
+            part_func = part_funcs[part]
+            part_input = copy.deepcopy(input)
+            part_result, answer = run_phase(
+                f"part{part}",
+                lambda: part_func(module, part_input),
+                timeout,
+                memory_top,
+            )
+            result.phases.append(part_result)
+            if memo is not None and not part_result.error:
+                update_memo(memo, memo_mode, part, part_result)
+
+    return result
+
+
+def update_memo(
+    memo: ResultMemo, memo_mode: str, part: int, part_result: PhaseResult
+) -> None:
+    stored = memo.load(part) if memo_mode == MEMO_VERIFY else None
+    if stored is None:
+        memo.save(part, part_result.answer, part_result.seconds)
+    elif not same_answer(stored["answer"], part_result.answer):
+        part_result.mismatch = str(stored["answer"])
+
+
+def load_module(solver: Solver) -> ModuleType:
+    return importlib.import_module(solver.module_name)
+
+
+def parse_input(
+    solver: Solver,
+    module: ModuleType,
+    adapter: Adapter,
+    input_name: str,
+    cache_dir: Optional[str] = None,
+) -> Any:
+    input_path = solver.input_path(input_name)
+
+    def parse() -> Any:
+        return adapter.parse(module, module.read_input(input_path))
+
+    if cache_dir is None:
+        return parse()
+    return cached_parse(cache_dir, solver, module, adapter, input_path, parse)
+
+
+def run_phase(
+    phase: str,
+    func: Callable[[], Any],
+    timeout: Optional[float] = None,
+    memory_top: Optional[int] = None,
+) -> Tuple[PhaseResult, Any]:
+    # `memory_top` traces allocations (which slows the phase down) and keeps
+    # that many of the biggest allocation sites
+    if memory_top is not None:
+        with tracking_memory(memory_top) as memory:
+            traced = run_phase(phase, func, timeout)
+        traced[0].memory = memory
+        return traced
+
+    # Memoized functions start empty, so a phase doesn't depend on what ran before
+    # it, and are emptied again after it so a long session doesn't keep them alive
+    reset_memos()
+    start = time.perf_counter()
+    try:
+        with time_limit(timeout):
+            answer = func()
+    except Exception as e:
+        seconds = time.perf_counter() - start
+        res: Tuple[PhaseResult, Any] = (
+            PhaseResult(phase, seconds, error=format_error(e)),
+            None,
+        )
+    else:
+        seconds = time.perf_counter() - start
+        res = (PhaseResult(phase, seconds, answer=answer), answer)
+
+    res[0].memos = memo_stats()
+    reset_memos()
+    return res
+
+
+class PhaseTimeout(Exception):
+    pass
+
+
+@contextmanager
+def time_limit(seconds: Optional[float]) -> Iterator[None]:
+    # SIGALRM interrupts the solver in the thread that runs it, which is the
+    # main thread both here and in process pool workers
+    if not seconds:
+        yield
+        return
+
+    def on_alarm(signum, frame):
+        raise PhaseTimeout(f"timed out after {seconds}s")
+
+    previous_handler = signal.signal(signal.SIGALRM, on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+@contextmanager
+def silenced(verbose: bool) -> Iterator[None]:
+    # Solvers print progress and debug output, keep it out of the report
+    if verbose:
+        yield
+        return
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        yield
+
+
+def format_error(e: Exception) -> str:
+    return f"{type(e).__name__}: {e}"
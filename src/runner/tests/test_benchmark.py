@@ -0,0 +1,84 @@
+from runner.benchmark import (
+    BenchmarkResult,
+    PhaseStats,
+    benchmark_solver,
+    find_regressions,
+    percentile,
+    record_run,
+)
+from runner.discovery import Solver
+
+
+def test_percentile():
+    assert percentile([1.0], 95) == 1.0
+    assert percentile([5.0, 1.0, 3.0, 2.0, 4.0], 50) == 3.0
+    assert percentile([float(i) for i in range(1, 101)], 95) == 95.0
+
+
+def test_benchmark_solver():
+    result = benchmark_solver(Solver(2022, 25), "test.txt", repeat=3, warmup=1)
+
+    assert result.error is None
+    assert list(result.stats.keys()) == ["parse", "part1"]
+    assert result.stats["part1"].samples == 3
+
+
+def test_find_regressions():
+    history = {"baseline": {}, "runs": []}
+    solver = Solver(2024, 7)
+
+    record_run(
+        history, [BenchmarkResult(solver, {"part1": PhaseStats(1.0, 1.2, 5)})], False
+    )
+    assert history["baseline"]["2024 day7 part1"]["median"] == 1.0
+
+    slow = [BenchmarkResult(solver, {"part1": PhaseStats(2.0, 2.1, 5)})]
+    assert find_regressions(history, slow, 1.5) != []
+    assert find_regressions(history, slow, 2.5) == []
+
+    record_run(history, slow, False)
+    assert history["baseline"]["2024 day7 part1"]["median"] == 1.0
+    record_run(history, slow, True)
+    assert history["baseline"]["2024 day7 part1"]["median"] == 2.0
+    assert len(history["runs"]) == 3
+    assert (
+        find_regressions(
+            history,
+            [BenchmarkResult(solver, {"part1": PhaseStats(5.0, 5.0, 5)})],
+            1.5,
+            min_time=3.0,
+        )
+        == []
+    )
+
+
+def test_find_memory_regressions():
+    history = {"baseline": {}, "runs": []}
+    solver = Solver(2024, 7)
+    mib = 1024 * 1024
+
+    record_run(
+        history, [BenchmarkResult(solver, {"part1": PhaseStats(1.0, 1.0, 5)})], False
+    )
+    measured = [
+        BenchmarkResult(
+            solver, {"part1": PhaseStats(1.0, 1.0, 5, 50 * mib, 10 * mib, ["a:1"])}
+        )
+    ]
+    assert find_regressions(history, measured, 1.5, max_memory_ratio=1.5) == []
+    record_run(history, measured, False)
+    assert history["baseline"]["2024 day7 part1"]["traced_peak"] == 10 * mib
+    assert history["baseline"]["2024 day7 part1"]["median"] == 1.0
+
+    bigger = [
+        BenchmarkResult(solver, {"part1": PhaseStats(1.0, 1.0, 5, 50 * mib, 20 * mib)})
+    ]
+    regressions = find_regressions(history, bigger, 1.5, max_memory_ratio=1.5)
+    assert len(regressions) == 1 and "traced_peak" in regressions[0]
+    assert find_regressions(history, bigger, 1.5) == []
+    assert (
+        find_regressions(
+            history, bigger, 1.5, max_memory_ratio=1.5, min_memory=mib * 11
+        )
+        == []
+    )
@@ -0,0 +1,32 @@
+import os
+
+from runner.adapters import get_adapter
+from runner.cache import cached_parse
+from runner.discovery import Solver
+from runner.runner import load_module
+
+
+def test_cached_parse(tmp_path):
+    solver = Solver(2022, 25)
+    module = load_module(solver)
+    adapter = get_adapter(solver)
+    input_path = tmp_path / "input.txt"
+    cache_dir = str(tmp_path / "cache")
+    calls = []
+
+    def parse():
+        calls.append(1)
+        return module.read_input(str(input_path))
+
+    def cached():
+        return cached_parse(cache_dir, solver, module, adapter, str(input_path), parse)
+
+    input_path.write_text("1=\n2-\n")
+    assert cached() == ["1=", "2-"]
+    assert cached() == ["1=", "2-"]
+    assert len(calls) == 1
+
+    input_path.write_text("10\n")
+    assert cached() == ["10"]
+    assert len(calls) == 2
+    assert len(os.listdir(os.path.join(cache_dir, "parsed"))) == 2
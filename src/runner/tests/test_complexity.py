@@ -0,0 +1,58 @@
+import importlib
+
+from runner.complexity import (
+    CLAIM_VARIABLES,
+    ComplexityResult,
+    claimed_exponent,
+    find_claim,
+    fit_exponent,
+    print_complexity_result,
+)
+from runner.discovery import Solver
+from runner.generators.registry import GENERATORS
+
+
+def test_fit_exponent():
+    assert round(fit_exponent([(1, 2.0), (2, 8.0), (4, 32.0)]), 6) == 2.0
+    assert round(fit_exponent([(0.5, 1.0), (1, 2.0), (8, 16.0)]), 6) == 1.0
+
+
+def test_claimed_exponent():
+    variables = {"Lines": 1, "N": 0, "len(input)": 1}
+
+    assert claimed_exponent("len(input)", variables) == 1
+    assert claimed_exponent("len(input)^2", variables) == 2
+    assert claimed_exponent("Lines * N * 3^N", variables) == 1
+    assert claimed_exponent("2^Lines", variables) is None
+    assert claimed_exponent("N^2", {}) is None
+
+
+def test_claimed_exponent_sums_and_logs():
+    variables = {"len(input)": 1, "M": 1, "S": 0.5, "H": 0.5, "W": 0.5}
+
+    assert claimed_exponent("len(input) * log(len(input))", variables) == 1.1
+    assert claimed_exponent("(M + S) log(M + S)", variables) == 1.1
+    assert claimed_exponent("H * W + S", variables) == 1
+    assert claimed_exponent("M * log(2)", variables) == 1
+    assert claimed_exponent("M * * S", variables) is None
+    assert claimed_exponent("log M", variables) is None
+    assert claimed_exponent("(M + S", variables) is None
+
+
+def test_generated_solver_claims_are_understood():
+    # A claim the checker can't parse would otherwise never be checked
+    for year, day in GENERATORS:
+        module = importlib.import_module(f"advent_of_code_{year}.day{day}.day{day}")
+        for part in [1, 2]:
+            claim = find_claim(getattr(module, f"solve_part{part}", None))
+            if claim is not None:
+                variables = CLAIM_VARIABLES.get((year, day), {})
+                assert claimed_exponent(claim, variables) is not None, (year, day)
+
+
+def test_unchecked_claim_is_reported(capsys):
+    result = ComplexityResult(Solver(2024, 9), 2, claim="n log n")
+
+    assert result.is_claim_unchecked()
+    print_complexity_result(result, tolerance=0.3)
+    assert "[CLAIM NOT UNDERSTOOD]" in capsys.readouterr().out
@@ -0,0 +1,44 @@
+from runner.differential import (
+    CASES,
+    Case,
+    check_case,
+    is_available,
+    minimize,
+    random_report,
+    shrink_int,
+    shrink_list,
+    shrink_report,
+)
+from runner.discovery import Solver
+
+
+def test_cases_match():
+    for case in filter(is_available, CASES):
+        assert check_case(case, runs=200) is None, case.name
+
+
+def test_minimize():
+    def fails(args):
+        return any(item >= 5 for item in args[0])
+
+    def shrink(args):
+        for items in shrink_list(args[0], shrink_int):
+            yield (items,)
+
+    assert minimize(([7, 1, 9, 4],), fails, shrink) == ([5],)
+
+
+def test_check_case_reports_minimized_mismatch():
+    case = Case(
+        Solver(2024, 2),
+        "is_valid_report_part2_brute_force",
+        "is_valid_report_part1",
+        random_report,
+        shrink_report,
+    )
+    mismatch = check_case(case, runs=100)
+
+    assert mismatch is not None
+    assert len(mismatch.args[0]) == 2
+    assert mismatch.reference_outcome == "True"
+    assert mismatch.fast_outcome == "False"
@@ -0,0 +1,35 @@
+from runner.discovery import Solver
+from runner.generators import grids, registry
+from runner.generators.registry import GENERATORS, generate_input, generated_input_path
+
+
+def test_generators_are_deterministic():
+    for year, day in GENERATORS.keys():
+        solver = Solver(year, day)
+        assert generate_input(solver, 0.05, seed=1) == generate_input(
+            solver, 0.05, seed=1
+        )
+        assert generate_input(solver, 0.05, seed=1) != generate_input(
+            solver, 0.05, seed=2
+        )
+
+
+def test_disk_map_scale():
+    (disk_map,) = generate_input(Solver(2024, 9), 2)
+
+    assert len(disk_map) == 2 * 20000 - 1
+    assert all(ch != "0" for ch in disk_map[::2])
+
+
+def test_generated_input_path_changes_with_generator(monkeypatch, tmp_path):
+    monkeypatch.setattr(registry, "GENERATED_INPUTS_DIR", str(tmp_path))
+    solver = Solver(2024, 9)
+    path = generated_input_path(solver, 0.05, seed=1)
+    assert generated_input_path(solver, 0.05, seed=1) == path
+
+    # another generator module stands in for an edited one
+    monkeypatch.setitem(GENERATORS, (2024, 9), grids.guard_map)
+    edited_path = generated_input_path(solver, 0.05, seed=1)
+    assert edited_path != path
+    with open(edited_path) as f:
+        assert "^" in f.read()
@@ -0,0 +1,69 @@
+import subprocess
+import sys
+import time
+
+import pytest
+
+from runner.adapters import get_adapter
+from runner.discovery import SRC_DIR, discover_solvers
+
+# Seconds per module on a machine where `python -c pass` takes REFERENCE_STARTUP.
+# Slower machines get a proportionally bigger budget, heavy dependencies such as
+# numpy or matplotlib still take several times more.
+IMPORT_TIME_BUDGET = 0.1
+REFERENCE_STARTUP = 0.02
+
+# A module over budget is measured again before failing, the fastest run counts
+MEASUREMENTS = 3
+
+MEASURE_IMPORT = """
+import importlib, sys, time
+start = time.perf_counter()
+try:
+    importlib.import_module(sys.argv[1])
+except ModuleNotFoundError as e:
+    print(f"missing {e.name}")
+else:
+    print(time.perf_counter() - start)
+"""
+
+
+@pytest.fixture(scope="module")
+def budget():
+    startup = min(measure_startup() for _ in range(MEASUREMENTS))
+    return IMPORT_TIME_BUDGET * max(1.0, startup / REFERENCE_STARTUP)
+
+
+def measure_startup() -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    return time.perf_counter() - start
+
+
+def measure_import(module_name: str) -> str:
+    # A fresh interpreter per module, so shared dependencies are counted every time
+    return subprocess.run(
+        [sys.executable, "-c", MEASURE_IMPORT, module_name],
+        cwd=SRC_DIR,
+        env={"PYTHONPATH": SRC_DIR},
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+
+@pytest.mark.parametrize(
+    "solver",
+    [s for s in discover_solvers() if not get_adapter(s).skip_reason],
+    ids=lambda s: s.name,
+)
+def test_import_time(solver, budget):
+    seconds = float("inf")
+    for _ in range(MEASUREMENTS):
+        output = measure_import(solver.module_name)
+        if output.startswith("missing"):
+            pytest.skip(f"optional dependency not installed: {output}")
+        seconds = min(seconds, float(output))
+        if seconds < budget:
+            break
+    assert seconds < budget
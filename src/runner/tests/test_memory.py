@@ -0,0 +1,32 @@
+from runner.memory import format_bytes, tracking_memory
+from runner.runner import run_phase
+
+
+def allocate():
+    return [bytearray(1024) for _ in range(1000)]
+
+
+def test_tracking_memory():
+    with tracking_memory(top=3) as memory:
+        blocks = allocate()
+
+    assert memory.traced_peak >= 1000 * 1024
+    assert memory.peak_rss > 0
+    assert 0 < len(memory.top_allocations) <= 3
+    assert "test_memory.py:6" in memory.top_allocations[0]
+    assert len(blocks) == 1000
+
+
+def test_run_phase_memory():
+    phase_result, answer = run_phase("part1", allocate, memory_top=2)
+
+    assert len(answer) == 1000
+    assert phase_result.memory is not None
+    assert phase_result.memory.traced_peak >= 1000 * 1024
+    assert run_phase("part1", allocate)[0].memory is None
+
+
+def test_format_bytes():
+    assert format_bytes(512) == "512.0 B"
+    assert format_bytes(1536) == "1.5 KiB"
+    assert format_bytes(3 * 1024**3) == "3.0 GiB"
@@ -0,0 +1,47 @@
+import cProfile
+import os
+import pstats
+
+from runner.discovery import Solver
+from runner.profiling import collapsed_stacks, profile_solver
+
+
+def leaf(n):
+    return sum(range(n))
+
+
+def middle(n):
+    return leaf(n) + leaf(n)
+
+
+def root():
+    return middle(100000) + leaf(100000)
+
+
+def test_collapsed_stacks():
+    profiler = cProfile.Profile()
+    profiler.runcall(root)
+    stats = pstats.Stats(profiler)
+    stacks = collapsed_stacks(stats)
+
+    total = sum(entry[3] for entry in stats.stats.values() if not entry[4])
+    assert abs(sum(stacks.values()) - total) < 1e-6
+    assert any(
+        stack.startswith("root") and "middle" in stack and "leaf" in stack
+        for stack in stacks
+    )
+    assert all(stack.count("middle") <= 1 for stack in stacks)
+
+
+def test_profile_solver(tmp_path, capsys):
+    result = profile_solver(Solver(2022, 25), "test.txt", str(tmp_path), top=3)
+
+    assert [p.phase for p in result.phases] == ["parse", "part1"]
+    assert result.phases[1].answer == "2=-1=0"
+    assert sorted(os.listdir(tmp_path)) == [
+        f"2022_day25_{phase}.{ext}"
+        for phase in ["parse", "part1"]
+        for ext in ["collapsed", "pstats"]
+    ]
+    pstats.Stats(str(tmp_path / "2022_day25_part1.pstats"))
+    assert "top 3 functions" in capsys.readouterr().out
@@ -0,0 +1,72 @@
+from runner.discovery import Solver, discover_solvers
+from runner.parallel import run_solvers_parallel
+from runner.runner import run_phase, run_solver
+
+
+def test_discover_solvers():
+    solvers = discover_solvers(years=[2022])
+
+    assert Solver(2022, 25) in solvers
+    assert all(s.year == 2022 for s in solvers)
+    assert solvers == sorted(solvers, key=lambda s: s.day)
+
+
+def test_run_solver():
+    result = run_solver(Solver(2022, 25), "test.txt")
+
+    assert [p.phase for p in result.phases] == ["parse", "part1"]
+    assert result.phases[1].answer == "2=-1=0"
+
+
+def test_run_solver_skipped():
+    assert run_solver(Solver(2023, 1)).skip_reason is not None
+
+
+def test_run_phase_timeout():
+    def spin():
+        while True:
+            pass
+
+    result, answer = run_phase("part1", spin, timeout=0.05)
+
+    assert answer is None
+    assert result.error is not None and "timed out" in result.error
+
+
+def test_run_solvers_parallel():
+    solvers = [Solver(2022, 25), Solver(2023, 1)]
+
+    results = list(run_solvers_parallel([(s, "test.txt") for s in solvers], jobs=2))
+
+    assert [r.solver for r in results] == solvers
+    assert [p.phase for p in results[0].phases] == ["parse", "part1"]
+    assert results[0].phases[1].answer == "2=-1=0"
+    assert results[1].skip_reason is not None
+
+
+def test_run_solver_memo(tmp_path):
+    solver = Solver(2022, 25)
+    memo_dir = str(tmp_path)
+
+    first = run_solver(solver, "test.txt", memo_dir=memo_dir)
+    second = run_solver(solver, "test.txt", memo_dir=memo_dir)
+
+    assert not first.phases[1].cached
+    assert [p.phase for p in second.phases] == ["part1"]
+    assert second.phases[0].cached and second.phases[0].answer == "2=-1=0"
+
+    (memo_file,) = (tmp_path / "results").iterdir()
+    memo_file.write_text('{"answer": "1", "seconds": 0}')
+    verified = run_solver(solver, "test.txt", memo_dir=memo_dir, memo_mode="verify")
+
+    assert verified.phases[1].answer == "2=-1=0"
+    assert verified.phases[1].mismatch == "1"
+
+
+def test_run_phase_memos():
+    result = run_solver(Solver(2024, 21), "test.txt", parts=[2])
+    (memo,) = result.phases[1].memos
+
+    assert memo.name == "day21.multi_encode_directional_len"
+    assert memo.misses == memo.entries > 0 and memo.hits > 0
+    assert run_phase("part1", lambda: 1)[0].memos == []
@@ -0,0 +1,134 @@
+from math import gcd
+from typing import Callable, Hashable, Iterable, NamedTuple, Optional, Tuple, TypeVar
+
+State = TypeVar("State")
+
+StepFunc = Callable[[State], State]
+KeyFunc = Callable[[State], Hashable]
+
+
+class Cycle(NamedTuple):
+    # Steps before the first state that repeats, and steps between repeats
+    offset: int
+    period: int
+
+
+def identity(state: State) -> Hashable:
+    return state  # type: ignore[return-value]
+
+
+def find_cycle(start: State, step: StepFunc, key: KeyFunc = identity) -> Cycle:
+    # Brent's algorithm: O(offset + period) steps, O(1) states kept.
+    # `step` must return a new state without changing its argument, states with
+    # equal `key`s are treated as equal and must evolve the same way.
+    period, _, _ = _find_period(start, step, key)
+
+    tortoise = hare = start
+    for _ in range(period):
+        hare = step(hare)
+
+    offset = 0
+    while key(tortoise) != key(hare):
+        tortoise, hare = step(tortoise), step(hare)
+        offset += 1
+
+    return Cycle(offset, period)
+
+
+def find_cycle_floyd(start: State, step: StepFunc, key: KeyFunc = identity) -> Cycle:
+    # Floyd's tortoise and hare, same contract as `find_cycle` with ~3x more steps
+    tortoise, hare = step(start), step(step(start))
+    while key(tortoise) != key(hare):
+        tortoise, hare = step(tortoise), step(step(hare))
+
+    offset = 0
+    tortoise = start
+    while key(tortoise) != key(hare):
+        tortoise, hare = step(tortoise), step(hare)
+        offset += 1
+
+    period = 1
+    hare = step(tortoise)
+    tortoise_key = key(tortoise)
+    while key(hare) != tortoise_key:
+        hare = step(hare)
+        period += 1
+
+    return Cycle(offset, period)
+
+
+def state_at(start: State, step: StepFunc, n: int, key: KeyFunc = identity) -> State:
+    # The state after `n` steps in O(offset + period) steps
+    period, index, state = _find_period(start, step, key)
+    if n < index:
+        state, remaining = start, n
+    else:
+        remaining = (n - index) % period
+
+    for _ in range(remaining):
+        state = step(state)
+    return state
+
+
+def metric_at(
+    start: State,
+    step: StepFunc,
+    metric: Callable[[State], int],
+    n: int,
+    key: KeyFunc = identity,
+) -> int:
+    # `metric` after `n` steps for a metric that grows by the same amount on every
+    # pass through the cycle, e.g. the height of a tower of falling rocks.
+    # Runtime: O(offset + period) steps
+    period, index, state = _find_period(start, step, key)
+    if n < index:
+        for _ in range(n):
+            start = step(start)
+        return metric(start)
+
+    cycles, remaining = divmod(n - index, period)
+    index_metric = metric(state)
+    remaining_metric = index_metric
+    for i in range(period):
+        if i == remaining:
+            remaining_metric = metric(state)
+        state = step(state)
+    return remaining_metric + cycles * (metric(state) - index_metric)
+
+
+def combine_cycles(cycles: Iterable[Tuple[int, int]]) -> Optional[Tuple[int, int]]:
+    # Chinese remainder theorem for (residue, period) pairs with any periods:
+    # the smallest time >= 0 with time % period == residue for every pair, and the
+    # period of such times. None when the pairs never line up.
+    time, period = 0, 1
+    for residue, other_period in cycles:
+        g = gcd(period, other_period)
+        if (residue - time) % g:
+            return None
+
+        m = other_period // g
+        k = (residue - time) // g * pow(period // g, -1, m) % m
+        time += period * k
+        period *= m
+        time %= period
+    return (time, period)
+
+
+def _find_period(start: State, step: StepFunc, key: KeyFunc) -> Tuple[int, int, State]:
+    # First phase of Brent's algorithm. Returns the period and a state already
+    # inside the cycle together with its index, which is enough to reach any
+    # later state without locating the exact offset.
+    power = period = 1
+    tortoise, tortoise_index, tortoise_key = start, 0, key(start)
+    hare, hare_index = step(start), 1
+    hare_key = key(hare)
+    while hare_key != tortoise_key:
+        if power == period:
+            tortoise, tortoise_index, tortoise_key = hare, hare_index, hare_key
+            power *= 2
+            period = 0
+        hare, hare_index = step(hare), hare_index + 1
+        hare_key = key(hare)
+        period += 1
+
+    return (period, tortoise_index, tortoise)
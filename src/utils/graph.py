@@ -0,0 +1,182 @@
+from array import array
+from collections import deque
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+Edge = Tuple[str, str]
+
+
+class Graph:
+    # Nodes are interned to ids 0..n-1 in order of first appearance. Adjacency is
+    # stored as CSR arrays: neighbours of node i are targets[offsets[i]:offsets[i + 1]]
+    # in insertion order, so a node's k-th edge can be addressed directly.
+
+    def __init__(self, names: List[str], offsets: array, targets: array) -> None:
+        self.names = names
+        self.ids: Dict[str, int] = {name: i for i, name in enumerate(names)}
+        self.offsets = offsets
+        self.targets = targets
+        self._rows: Optional[List[int]] = None
+
+    @classmethod
+    def from_edges(
+        cls, edges: Iterable[Edge], directed: bool = False, nodes: Iterable[str] = ()
+    ) -> "Graph":
+        # Duplicate edges are kept once, `nodes` adds nodes that may have no edges
+        ids: Dict[str, int] = {}
+        for name in nodes:
+            ids.setdefault(name, len(ids))
+
+        pairs: List[Tuple[int, int]] = []
+        for source, target in edges:
+            i = ids.setdefault(source, len(ids))
+            pairs.append((i, ids.setdefault(target, len(ids))))
+
+        adj: List[Dict[int, None]] = [{} for _ in range(len(ids))]
+        for i, j in pairs:
+            adj[i][j] = None
+            if not directed:
+                adj[j][i] = None
+        return cls._from_adj(list(ids), adj)
+
+    @classmethod
+    def from_adj_dict(
+        cls, adj_dict: Mapping[str, Iterable[str]], directed: bool = True
+    ) -> "Graph":
+        edges = [(node, adj) for node, adjs in adj_dict.items() for adj in adjs]
+        return cls.from_edges(edges, directed, nodes=adj_dict.keys())
+
+    @classmethod
+    def _from_adj(cls, names: List[str], adj: Sequence[Iterable[int]]) -> "Graph":
+        offsets = array("l", [0])
+        targets = array("l")
+        for adj_ids in adj:
+            targets.extend(adj_ids)
+            offsets.append(len(targets))
+        return cls(names, offsets, targets)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __repr__(self) -> str:
+        return f"Graph({len(self)} nodes, {len(self.targets)} edges)"
+
+    def id(self, name: str) -> int:
+        return self.ids[name]
+
+    def neighbours(self, node: int) -> array:
+        return self.targets[self.offsets[node] : self.offsets[node + 1]]
+
+    def degree(self, node: int) -> int:
+        return self.offsets[node + 1] - self.offsets[node]
+
+    def edges(self) -> Iterator[Tuple[int, int]]:
+        # Directed edges, an undirected graph yields both directions
+        for node in range(len(self)):
+            for adj in self.neighbours(node):
+                yield (node, adj)
+
+    @property
+    def rows(self) -> List[int]:
+        # Bitset rows: bit j of rows[i] is set for an edge i -> j. Built on first
+        # use, so neighbour set intersections become an `&` of two ints.
+        if self._rows is None:
+            self._rows = [
+                sum(1 << adj for adj in self.neighbours(node))
+                for node in range(len(self))
+            ]
+        return self._rows
+
+    def without_edges(self, edges: Iterable[Edge], directed: bool = False) -> "Graph":
+        removed: Set[Tuple[int, int]] = set()
+        for source, target in edges:
+            removed.add((self.ids[source], self.ids[target]))
+            if not directed:
+                removed.add((self.ids[target], self.ids[source]))
+
+        adj = [
+            [j for j in self.neighbours(i) if (i, j) not in removed]
+            for i in range(len(self))
+        ]
+        return Graph._from_adj(self.names, adj)
+
+    def to_adj_dict(self) -> Dict[str, Set[str]]:
+        return {
+            name: {self.names[adj] for adj in self.neighbours(node)}
+            for node, name in enumerate(self.names)
+        }
+
+
+def bfs(graph: Graph, start: int) -> Dict[int, int]:
+    # Distances in edges to every node reachable from `start`, in visiting order.
+    # Runtime: O(V + E)
+    dist = {start: 0}
+    queue = deque([start])
+    offsets, targets = graph.offsets, graph.targets
+    while queue:
+        node = queue.popleft()
+        for adj in targets[offsets[node] : offsets[node + 1]]:
+            if adj not in dist:
+                dist[adj] = dist[node] + 1
+                queue.append(adj)
+    return dist
+
+
+def connected_components(graph: Graph) -> List[List[int]]:
+    # Follows edges as stored, so components are meaningful for undirected graphs
+    # Runtime: O(V + E)
+    seen = bytearray(len(graph))
+    res: List[List[int]] = []
+    for start in range(len(graph)):
+        if seen[start]:
+            continue
+        component = list(bfs(graph, start))
+        for node in component:
+            seen[node] = 1
+        res.append(component)
+    return res
+
+
+def degree_order(graph: Graph) -> List[int]:
+    # Degeneracy order of an undirected graph: repeatedly takes a node of the
+    # smallest remaining degree, so each node has few neighbours later in the
+    # order, which bounds clique searches that only look forward.
+    # Runtime: O(V + E) with degree buckets
+    degrees = [graph.degree(node) for node in range(len(graph))]
+    buckets: List[Set[int]] = [set() for _ in range(max(degrees, default=0) + 1)]
+    for node, degree in enumerate(degrees):
+        buckets[degree].add(node)
+
+    removed = bytearray(len(graph))
+    res: List[int] = []
+    lowest = 0
+    while len(res) < len(graph):
+        lowest = max(lowest - 1, 0)
+        while not buckets[lowest]:
+            lowest += 1
+        node = buckets[lowest].pop()
+        removed[node] = 1
+        res.append(node)
+        for adj in graph.neighbours(node):
+            if not removed[adj]:
+                buckets[degrees[adj]].remove(adj)
+                degrees[adj] -= 1
+                buckets[degrees[adj]].add(adj)
+    return res
+
+
+def bits(mask: int) -> Iterator[int]:
+    # Indexes of set bits, lowest first
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
@@ -1,14 +1,23 @@
-from typing import Dict, Set
-from pyvis.network import Network  # pip install pyvis
+from typing import Dict, Set, Union
 
+from utils.graph import Graph
+
+
+def visualise_graph(
+    graph: Union[Graph, Dict[str, Set[str]]],
+    file_name: str = "mygraph.html",
+    layout: bool = True,
+):
+    from pyvis.network import Network  # pip install pyvis
+
+    adj_dict = graph.to_adj_dict() if isinstance(graph, Graph) else graph
 
-def visualise_graph(adj_dict: Dict[str, Set[str]], file_name: str = "mygraph.html"):
     net = Network(
         height="750px",
         width="100%",
         bgcolor="#222222",
         font_color="white",
-        layout=True,
+        layout=layout,
     )
 
     for node in adj_dict.keys():
@@ -0,0 +1,124 @@
+from typing import Iterator, List, Optional, Tuple
+
+Position = Tuple[int, int]
+
+BORDER_CELL = " "
+
+
+class Grid:
+    # Cells are stored row by row in a flat bytearray surrounded by a one cell
+    # border, so a neighbour is `offset + step` and walking off the board is
+    # detected by reading the border cell instead of checking bounds.
+
+    def __init__(
+        self, width: int, height: int, filler: str = ".", border: str = BORDER_CELL
+    ) -> None:
+        self.width = width
+        self.height = height
+        self.stride = width + 2
+        self.border = ord(border)
+
+        self.cells = bytearray([self.border]) * (self.stride * (height + 2))
+        row = bytes([ord(filler)]) * width
+        for i in range(height):
+            start = self.offset((i, 0))
+            self.cells[start : start + width] = row
+
+        # Clockwise, starting from up
+        self.up = -self.stride
+        self.right = 1
+        self.down = self.stride
+        self.left = -1
+        self.directions = (self.up, self.right, self.down, self.left)
+
+    @classmethod
+    def from_lines(cls, lines: List[str], border: str = BORDER_CELL) -> "Grid":
+        # Every row must be as wide as the first one: a shorter or longer slice
+        # assignment would resize `cells` and shift all later rows
+        grid = cls(len(lines[0]) if lines else 0, len(lines), border=border)
+        for i, line in enumerate(lines):
+            row = line.encode()
+            if len(row) != grid.width:
+                raise ValueError(
+                    f"Row {i} is {len(row)} cells wide, expected {grid.width}"
+                )
+            start = grid.offset((i, 0))
+            grid.cells[start : start + grid.width] = row
+        return grid
+
+    def to_lines(self) -> List[str]:
+        return [self.row(i).decode() for i in range(self.height)]
+
+    def row(self, i: int) -> bytes:
+        start = self.offset((i, 0))
+        return bytes(self.cells[start : start + self.width])
+
+    def offset(self, pos: Position) -> int:
+        return (pos[0] + 1) * self.stride + pos[1] + 1
+
+    def position(self, offset: int) -> Position:
+        i, j = divmod(offset, self.stride)
+        return (i - 1, j - 1)
+
+    def get(self, pos: Position) -> str:
+        return chr(self.cells[self.offset(pos)])
+
+    def set(self, pos: Position, cell: str) -> None:
+        self.cells[self.offset(pos)] = ord(cell)
+
+    def is_inside(self, offset: int) -> bool:
+        return self.cells[offset] != self.border
+
+    def neighbours(self, offset: int) -> Iterator[int]:
+        cells = self.cells
+        for step in self.directions:
+            if cells[offset + step] != self.border:
+                yield offset + step
+
+    def offsets(self) -> Iterator[int]:
+        for i in range(self.height):
+            start = self.offset((i, 0))
+            yield from range(start, start + self.width)
+
+    def edge(self, direction: int) -> List[int]:
+        # Cells next to the border on the `direction` side, e.g. the top row for `up`
+        if direction == self.up:
+            return [self.offset((0, j)) for j in range(self.width)]
+        if direction == self.down:
+            return [self.offset((self.height - 1, j)) for j in range(self.width)]
+        if direction == self.left:
+            return [self.offset((i, 0)) for i in range(self.height)]
+        if direction == self.right:
+            return [self.offset((i, self.width - 1)) for i in range(self.height)]
+        raise ValueError(f"Unknown direction: {direction}")
+
+    def find(self, cell: str) -> Optional[int]:
+        offset = self.cells.find(ord(cell))
+        return offset if offset >= 0 else None
+
+    def find_all(self, cell: str) -> List[int]:
+        code = ord(cell)
+        cells = self.cells
+        return [offset for offset in self.offsets() if cells[offset] == code]
+
+    def count(self, cell: str) -> int:
+        return self.cells.count(ord(cell))
+
+    def copy(self) -> "Grid":
+        grid = type(self).__new__(type(self))
+        grid.__dict__.update(self.__dict__)
+        grid.cells = self.cells.copy()
+        return grid
+
+    def key(self) -> bytes:
+        return bytes(self.cells)
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, Grid)
+            and self.width == other.width
+            and self.cells == other.cells
+        )
+
+    def __repr__(self) -> str:
+        return "\n".join(self.to_lines())
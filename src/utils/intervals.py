@@ -0,0 +1,206 @@
+import math
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, List, Tuple
+
+# Half-open: (start, end) holds start, start + 1, ..., end - 1
+Interval = Tuple[int, int]
+
+
+def contains(outer: Interval, inner: Interval) -> bool:
+    return outer[0] <= inner[0] and inner[1] <= outer[1]
+
+
+def overlaps(a: Interval, b: Interval) -> bool:
+    return a[0] < b[1] and b[0] < a[1]
+
+
+class IntervalSet:
+    # Sorted, disjoint and non-adjacent intervals. Set operations merge the two
+    # sorted lists, building from arbitrary intervals sorts them: O(k log k).
+
+    def __init__(self, intervals: Iterable[Interval] = ()) -> None:
+        self.intervals: List[Interval] = []
+        for start, end in sorted(intervals):
+            if start >= end:
+                continue
+            if self.intervals and start <= self.intervals[-1][1]:
+                last_start, last_end = self.intervals[-1]
+                self.intervals[-1] = (last_start, max(last_end, end))
+            else:
+                self.intervals.append((start, end))
+        self.starts = [start for start, _ in self.intervals]
+
+    @classmethod
+    def _from_sorted(cls, intervals: List[Interval]) -> "IntervalSet":
+        # `intervals` are already sorted and disjoint, only adjacent ones are merged
+        res = cls()
+        for start, end in intervals:
+            if res.intervals and start == res.intervals[-1][1]:
+                res.intervals[-1] = (res.intervals[-1][0], end)
+            elif start < end:
+                res.intervals.append((start, end))
+        res.starts = [start for start, _ in res.intervals]
+        return res
+
+    def __iter__(self) -> Iterator[Interval]:
+        return iter(self.intervals)
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+
+    def __bool__(self) -> bool:
+        return bool(self.intervals)
+
+    def __contains__(self, value: int) -> bool:
+        i = bisect_right(self.starts, value) - 1
+        return i >= 0 and value < self.intervals[i][1]
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, IntervalSet) and self.intervals == other.intervals
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({self.intervals})"
+
+    def size(self) -> int:
+        return sum(end - start for start, end in self.intervals)
+
+    def min(self) -> int:
+        return self.intervals[0][0]
+
+    def covers(self, interval: Interval) -> bool:
+        i = bisect_right(self.starts, interval[0]) - 1
+        return i >= 0 and contains(self.intervals[i], interval)
+
+    def overlapping(self, interval: Interval) -> Iterator[Interval]:
+        # Parts of the set inside `interval`, O(log k + output)
+        start, end = interval
+        i = max(0, bisect_right(self.starts, start) - 1)
+        j = bisect_left(self.starts, end)
+        for a, b in self.intervals[i:j]:
+            if b > start:
+                yield (max(a, start), min(b, end))
+
+    def union(self, other: "IntervalSet") -> "IntervalSet":
+        return IntervalSet(self.intervals + other.intervals)
+
+    def intersection(self, other: "IntervalSet") -> "IntervalSet":
+        res: List[Interval] = []
+        i = j = 0
+        while i < len(self.intervals) and j < len(other.intervals):
+            (a, b), (c, d) = self.intervals[i], other.intervals[j]
+            if max(a, c) < min(b, d):
+                res.append((max(a, c), min(b, d)))
+            if b < d:
+                i += 1
+            else:
+                j += 1
+        return IntervalSet._from_sorted(res)
+
+    def difference(self, other: "IntervalSet") -> "IntervalSet":
+        res: List[Interval] = []
+        j = 0
+        for start, end in self.intervals:
+            while j < len(other.intervals) and other.intervals[j][1] <= start:
+                j += 1
+            k = j
+            while k < len(other.intervals) and other.intervals[k][0] < end:
+                cut_start, cut_end = other.intervals[k]
+                if cut_start > start:
+                    res.append((start, cut_start))
+                start = max(start, cut_end)
+                k += 1
+            if start < end:
+                res.append((start, end))
+        return IntervalSet._from_sorted(res)
+
+    def shift(self, delta: int) -> "IntervalSet":
+        return IntervalSet._from_sorted(
+            [(start + delta, end + delta) for start, end in self.intervals]
+        )
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+
+class IntervalMap:
+    # Piecewise-linear map: adds a piece's offset to values inside its interval
+    # and keeps every other value as is, e.g. an almanac map of 2023 day5.
+
+    def __init__(self, pieces: Iterable[Tuple[Interval, int]] = ()) -> None:
+        self.pieces: List[Tuple[Interval, int]] = []
+        for (start, end), offset in sorted(pieces):
+            if start >= end or offset == 0:
+                continue
+            if self.pieces:
+                (last_start, last_end), last_offset = self.pieces[-1]
+                if start < last_end:
+                    raise ValueError(f"Overlapping pieces at {start}")
+                if start == last_end and offset == last_offset:
+                    self.pieces[-1] = ((last_start, end), offset)
+                    continue
+            self.pieces.append(((start, end), offset))
+        self.starts = [start for (start, _), _ in self.pieces]
+
+    def __call__(self, value: int) -> int:
+        i = bisect_right(self.starts, value) - 1
+        if i >= 0 and value < self.pieces[i][0][1]:
+            return value + self.pieces[i][1]
+        return value
+
+    def __repr__(self) -> str:
+        return f"IntervalMap({self.pieces})"
+
+    def segments(self) -> Iterator[Tuple[float, float, int]]:
+        # The whole number line split into pieces and the identity gaps between them
+        position: float = -math.inf
+        for (start, end), offset in self.pieces:
+            if position < start:
+                yield (position, start, 0)
+            yield (start, end, offset)
+            position = end
+        yield (position, math.inf, 0)
+
+    def image(self, intervals: IntervalSet) -> IntervalSet:
+        # Runtime: O((k + m) log(k + m)), k pieces, m intervals
+        res: List[Interval] = []
+        for start, end, offset in self.segments():
+            for a, b in intervals.overlapping((start, end)):  # type: ignore[arg-type]
+                res.append((a + offset, b + offset))
+        return IntervalSet(res)
+
+    def then(self, other: "IntervalMap") -> "IntervalMap":
+        # Composition: the map of x -> other(self(x))
+        pieces: List[Tuple[Interval, int]] = []
+        for start, end, offset in self.segments():
+            image = (start + offset, end + offset)
+            for other_start, other_end, other_offset in other.segments_in(image):
+                pieces.append(
+                    (
+                        (other_start - offset, other_end - offset),  # type: ignore
+                        offset + other_offset,
+                    )
+                )
+        return IntervalMap(pieces)
+
+    def segments_in(
+        self, interval: Tuple[float, float]
+    ) -> Iterator[Tuple[float, float, int]]:
+        # `segments` clipped to `interval`, O(log k + output)
+        start, end = interval
+        i = max(0, bisect_right(self.starts, start) - 1)
+        position = start
+        while position < end:
+            if i < len(self.pieces) and self.pieces[i][0][1] <= position:
+                i += 1
+                continue
+            if i < len(self.pieces) and self.pieces[i][0][0] <= position:
+                (_, piece_end), offset = self.pieces[i]
+                segment_end = min(piece_end, end)
+                yield (position, segment_end, offset)
+                i += 1
+            else:
+                gap_end = self.pieces[i][0][0] if i < len(self.pieces) else math.inf
+                segment_end = min(gap_end, end)
+                yield (position, segment_end, 0)
+            position = segment_end
@@ -0,0 +1,143 @@
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import update_wrapper
+from typing import Any, Callable, Generic, Hashable, List, Optional, Set, Tuple, TypeVar
+
+R = TypeVar("R")
+
+SizeFunc = Callable[[Any], int]
+
+# Separates positional from keyword arguments in cache keys
+_KWARGS_MARK = object()
+
+
+@dataclass
+class MemoStats:
+    name: str
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    # Estimated, only tracked for memos bounded by `max_bytes`
+    bytes: Optional[int] = None
+
+
+class Memo(Generic[R]):
+    # LRU cache around `func`, bounded by entries and/or estimated bytes of keys
+    # and values. Without bounds it behaves like `functools.cache`.
+
+    def __init__(
+        self,
+        func: Callable[..., R],
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        size_of: Optional[SizeFunc] = None,
+    ) -> None:
+        self.func = func
+        self.name = f"{func.__module__.split('.')[-1]}.{func.__qualname__}"
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size_of = size_of or deep_sizeof
+        self.entries: "OrderedDict[Hashable, Tuple[R, int]]" = OrderedDict()
+        self.bytes = 0
+        self.hits = self.misses = self.evictions = 0
+        update_wrapper(self, func)
+        MEMOS.append(self)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> R:
+        key: Hashable = (
+            args + (_KWARGS_MARK,) + tuple(kwargs.items()) if kwargs else args
+        )
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return entry[0]
+
+        self.misses += 1
+        value = self.func(*args, **kwargs)
+        size = (
+            self.size_of(key) + self.size_of(value) if self.max_bytes is not None else 0
+        )
+        self.entries[key] = (value, size)
+        self.bytes += size
+        self._evict()
+        return value
+
+    def _evict(self) -> None:
+        # The newest entry is always kept, even when it alone exceeds `max_bytes`
+        while len(self.entries) > 1 and (
+            (self.max_entries is not None and len(self.entries) > self.max_entries)
+            or (self.max_bytes is not None and self.bytes > self.max_bytes)
+        ):
+            _, (_, size) = self.entries.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.bytes = 0
+
+    def reset(self) -> None:
+        # Clears the cache and its counters, e.g. between two timed runs
+        self.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> MemoStats:
+        return MemoStats(
+            self.name,
+            self.hits,
+            self.misses,
+            self.evictions,
+            len(self.entries),
+            self.bytes if self.max_bytes is not None else None,
+        )
+
+
+# Every memo ever created, so the runner can reset them and report their counters
+MEMOS: List[Memo] = []
+
+
+def memoize(
+    max_entries: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    size_of: Optional[SizeFunc] = None,
+) -> Callable[[Callable[..., R]], Memo[R]]:
+    # @memoize(max_entries=10_000) def f(...): ...
+    # Arguments must be hashable. `size_of` estimates a key or value in bytes,
+    # `deep_sizeof` by default.
+    def decorator(func: Callable[..., R]) -> Memo[R]:
+        return Memo(func, max_entries, max_bytes, size_of)
+
+    return decorator
+
+
+def memo_stats() -> List[MemoStats]:
+    # Memos used since their last reset
+    return [memo.stats() for memo in MEMOS if memo.hits or memo.misses]
+
+
+def reset_memos() -> None:
+    for memo in MEMOS:
+        memo.reset()
+
+
+def deep_sizeof(obj: Any) -> int:
+    # `sys.getsizeof` summed over nested lists, tuples, sets and dicts, counting
+    # shared objects once
+    seen: Set[int] = set()
+    res = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        res += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+    return res
@@ -0,0 +1,58 @@
+import mmap
+import re
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, List, TypeVar, Union
+
+T = TypeVar("T")
+
+Buffer = Union[bytes, mmap.mmap]
+
+
+def iter_lines(file_name: str) -> Iterator[str]:
+    # Same lines as the `read_input` of a day module, read one at a time
+    with open(file_name) as f:
+        for line in f:
+            yield line.strip()
+
+
+def read_lines(file_name: str) -> List[str]:
+    return list(iter_lines(file_name))
+
+
+@contextmanager
+def mapped_bytes(file_name: str) -> Iterator[Buffer]:
+    # Read-only view of the whole file paged in by the OS on access, so regexes
+    # can scan files larger than memory. Slices and matches are copied bytes;
+    # views into the map must not outlive the `with` block.
+    with open(file_name, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files can't be mapped
+            yield b""
+            return
+        with data:
+            yield data
+
+
+def scan(regex: str, data: Union[str, Buffer]) -> Iterator[str]:
+    # `re.finditer` over text or bytes with the same str pattern, yielding str.
+    # Matches are decoded one by one, the input never is.
+    if isinstance(data, str):
+        for text_match in re.finditer(regex, data):
+            yield text_match.group()
+    else:
+        for bytes_match in re.finditer(regex.encode(), data):
+            yield bytes_match.group().decode()
+
+
+def iter_blocks(items: Iterable[T], separator: Any = "") -> Iterator[List[T]]:
+    # Lazy `split_list`: only the current block is kept in memory
+    block: List[T] = []
+    for item in items:
+        if item == separator:
+            yield block
+            block = []
+        else:
+            block.append(item)
+    yield block
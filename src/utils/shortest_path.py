@@ -0,0 +1,182 @@
+import heapq
+from dataclasses import dataclass, field
+from itertools import count
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+State = TypeVar("State", bound=Hashable)
+
+NeighboursFunc = Callable[[State], Iterable[Tuple[State, int]]]
+
+
+@dataclass
+class ShortestPaths(Generic[State]):
+    dist: Dict[State, int] = field(default_factory=dict)
+    parents: Dict[State, List[State]] = field(default_factory=dict)
+    # First settled state matching `is_target`
+    target: Optional[State] = None
+
+    @property
+    def cost(self) -> Optional[int]:
+        return self.dist[self.target] if self.target is not None else None
+
+    def path(self, state: State) -> List[State]:
+        res = [state]
+        while self.parents.get(state):
+            state = self.parents[state][0]
+            res.append(state)
+        return list(reversed(res))
+
+    def states_on_paths(self, targets: Iterable[State]) -> Set[State]:
+        # All states lying on any shortest path to `targets`,
+        # complete only when searched with `all_parents=True`
+        res: Set[State] = set()
+        stack = list(targets)
+        while stack:
+            state = stack.pop()
+            if state in res:
+                continue
+            res.add(state)
+            stack.extend(self.parents.get(state, []))
+        return res
+
+
+def find_shortest_paths(
+    starts: Iterable[Tuple[State, int]],
+    neighbours: NeighboursFunc,
+    is_target: Optional[Callable[[State], bool]] = None,
+    heuristic: Optional[Callable[[State], int]] = None,
+    max_weight: Optional[int] = None,
+    all_parents: bool = False,
+) -> ShortestPaths[State]:
+    # Dijkstra over non-negative integer weights, A* when `heuristic` is given
+    # (it must be consistent). Stops at the first settled target, explores the
+    # whole reachable graph without `is_target`.
+    # `max_weight` switches to a bucket queue (Dial), which avoids heap
+    # operations when weights are small integers.
+    # `all_parents` keeps every parent with an equal cost, not just the first one.
+    if max_weight is not None:
+        if heuristic is not None:
+            raise ValueError("Bucket queue does not support a heuristic")
+        return _find_with_buckets(
+            starts, neighbours, is_target, max_weight, all_parents
+        )
+    return _find_with_heap(starts, neighbours, is_target, heuristic, all_parents)
+
+
+def _find_with_heap(
+    starts: Iterable[Tuple[State, int]],
+    neighbours: NeighboursFunc,
+    is_target: Optional[Callable[[State], bool]],
+    heuristic: Optional[Callable[[State], int]],
+    all_parents: bool,
+) -> ShortestPaths[State]:
+    res: ShortestPaths[State] = ShortestPaths()
+    dist, parents = res.dist, res.parents
+    settled: Set[State] = set()
+
+    # Stale entries are skipped when popped instead of decreasing keys in place,
+    # the counter breaks ties without comparing states
+    tie_breaker = count()
+    heap: List[Tuple[int, int, int, State]] = []
+
+    for state, cost in starts:
+        if cost < dist.get(state, cost + 1):
+            dist[state] = cost
+            priority = cost + heuristic(state) if heuristic else cost
+            heapq.heappush(heap, (priority, next(tie_breaker), cost, state))
+
+    while heap:
+        _, _, cost, state = heapq.heappop(heap)
+        if state in settled or cost > dist[state]:
+            continue
+        settled.add(state)
+
+        if is_target is not None and is_target(state):
+            res.target = state
+            return res
+
+        for next_state, weight in neighbours(state):
+            next_cost = cost + weight
+            next_dist = dist.get(next_state)
+            if next_dist is None or next_cost < next_dist:
+                dist[next_state] = next_cost
+                parents[next_state] = [state]
+                priority = next_cost + heuristic(next_state) if heuristic else next_cost
+                heapq.heappush(
+                    heap, (priority, next(tie_breaker), next_cost, next_state)
+                )
+            elif all_parents and next_cost == next_dist and next_state not in settled:
+                parents[next_state].append(state)
+
+    return res
+
+
+def _find_with_buckets(
+    starts: Iterable[Tuple[State, int]],
+    neighbours: NeighboursFunc,
+    is_target: Optional[Callable[[State], bool]],
+    max_weight: int,
+    all_parents: bool,
+) -> ShortestPaths[State]:
+    res: ShortestPaths[State] = ShortestPaths()
+    dist, parents = res.dist, res.parents
+    settled: Set[State] = set()
+
+    # Pending costs always lie within [cost, cost + max_weight],
+    # so a ring of max_weight + 1 buckets is enough
+    size = max_weight + 1
+    buckets: List[List[State]] = [[] for _ in range(size)]
+    pending = 0
+
+    for state, cost in starts:
+        if cost < dist.get(state, cost + 1):
+            dist[state] = cost
+    if not dist:
+        return res
+
+    cost = min(dist.values())
+    for state, start_cost in dist.items():
+        if start_cost - cost > max_weight:
+            raise ValueError("Start costs differ by more than max_weight")
+        buckets[start_cost % size].append(state)
+        pending += 1
+
+    while pending:
+        bucket = buckets[cost % size]
+        while bucket:
+            state = bucket.pop()
+            pending -= 1
+            if state in settled or dist[state] != cost:
+                continue
+            settled.add(state)
+
+            if is_target is not None and is_target(state):
+                res.target = state
+                return res
+
+            for next_state, weight in neighbours(state):
+                next_cost = cost + weight
+                next_dist = dist.get(next_state)
+                if next_dist is None or next_cost < next_dist:
+                    dist[next_state] = next_cost
+                    parents[next_state] = [state]
+                    buckets[next_cost % size].append(next_state)
+                    pending += 1
+                elif (
+                    all_parents and next_cost == next_dist and next_state not in settled
+                ):
+                    parents[next_state].append(state)
+        cost += 1
+
+    return res
@@ -0,0 +1,87 @@
+from typing import Dict, List, Tuple
+
+import pytest
+
+from utils.cycles import (
+    Cycle,
+    combine_cycles,
+    find_cycle,
+    find_cycle_floyd,
+    metric_at,
+    state_at,
+)
+
+
+def brute_force_cycle(start: int, step) -> Cycle:
+    seen: Dict[int, int] = {}
+    state = start
+    while state not in seen:
+        seen[state] = len(seen)
+        state = step(state)
+    return Cycle(seen[state], len(seen) - seen[state])
+
+
+@pytest.mark.parametrize("find", [find_cycle, find_cycle_floyd])
+@pytest.mark.parametrize("modulus", [7, 255, 1000, 4096])
+def test_find_cycle(find, modulus):
+    def step(x: int) -> int:
+        return (x * x + 1) % modulus
+
+    for start in range(0, modulus, max(1, modulus // 50)):
+        assert find(start, step) == brute_force_cycle(start, step)
+
+
+def test_find_cycle_with_key():
+    # The counter part of the state grows forever, the key drops it
+    def step(state: Tuple[int, int]) -> Tuple[int, int]:
+        x, count = state
+        return (4 + (x - 3) % 6 if x >= 4 else x + 1, count + 1)
+
+    assert find_cycle((0, 0), step, key=lambda state: state[0]) == Cycle(4, 6)
+    assert find_cycle((9, 0), step, key=lambda state: state[0]) == Cycle(0, 6)
+
+
+def test_state_at():
+    def step(x: int) -> int:
+        return (x * x + 1) % 255
+
+    states: List[int] = [3]
+    for _ in range(300):
+        states.append(step(states[-1]))
+
+    for n in [0, 1, 5, 17, 299]:
+        assert state_at(3, step, n) == states[n]
+    assert (
+        state_at(3, step, 10**18)
+        == states[
+            brute_force_cycle(3, step).offset
+            + (10**18 - brute_force_cycle(3, step).offset)
+            % brute_force_cycle(3, step).period
+        ]
+    )
+
+
+def test_metric_at():
+    # Total of all values visited, grows by the same sum on every cycle
+    def step(state: Tuple[int, int]) -> Tuple[int, int]:
+        x, total = state
+        x = (x * x + 1) % 255
+        return (x, total + x)
+
+    states = [(3, 0)]
+    for _ in range(500):
+        states.append(step(states[-1]))
+
+    for n in [0, 1, 4, 123, 500]:
+        assert (
+            metric_at((3, 0), step, lambda s: s[1], n, key=lambda s: s[0])
+            == states[n][1]
+        )
+
+
+def test_combine_cycles():
+    assert combine_cycles([]) == (0, 1)
+    assert combine_cycles([(2, 3), (3, 5), (2, 7)]) == (23, 105)
+    assert combine_cycles([(1, 4), (3, 6)]) == (9, 12)
+    assert combine_cycles([(1, 4), (2, 6)]) is None
+    assert combine_cycles([(5, 10), (5, 10)]) == (5, 10)
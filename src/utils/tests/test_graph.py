@@ -0,0 +1,71 @@
+from utils.graph import Graph, bfs, bits, connected_components, degree_order
+
+EDGES = [("a", "b"), ("b", "c"), ("c", "a"), ("c", "d"), ("x", "y")]
+
+
+def test_from_edges():
+    graph = Graph.from_edges(EDGES + [("b", "a")])
+
+    assert graph.names == ["a", "b", "c", "d", "x", "y"]
+    assert list(graph.neighbours(graph.id("c"))) == [1, 0, 3]
+    assert graph.degree(graph.id("d")) == 1
+    assert len(list(graph.edges())) == 2 * len(EDGES)
+    assert graph.to_adj_dict()["a"] == {"b", "c"}
+
+
+def test_directed():
+    graph = Graph.from_adj_dict({"a": ["b", "c"], "b": [], "z": []})
+
+    assert graph.names == ["a", "b", "z", "c"]
+    assert graph.to_adj_dict() == {"a": {"b", "c"}, "b": set(), "z": set(), "c": set()}
+
+
+def test_rows():
+    graph = Graph.from_edges(EDGES)
+    rows = graph.rows
+
+    assert list(bits(rows[graph.id("c")])) == [0, 1, 3]
+    assert list(bits(rows[graph.id("a")] & rows[graph.id("b")])) == [graph.id("c")]
+
+
+def test_bfs():
+    graph = Graph.from_edges(EDGES)
+    dist = bfs(graph, graph.id("a"))
+
+    assert {graph.names[node]: d for node, d in dist.items()} == {
+        "a": 0,
+        "b": 1,
+        "c": 1,
+        "d": 2,
+    }
+
+
+def test_connected_components():
+    graph = Graph.from_edges(EDGES, nodes=["z"])
+    components = [
+        sorted(graph.names[n] for n in c) for c in connected_components(graph)
+    ]
+    assert components == [["z"], ["a", "b", "c", "d"], ["x", "y"]]
+
+    cut = graph.without_edges([("c", "d")])
+    assert len(connected_components(cut)) == 4
+    assert len(connected_components(graph)) == 3
+
+
+def test_degree_order():
+    # a 4-clique with a tail, the tail is peeled off before the clique
+    graph = Graph.from_edges(
+        [("a", "b"), ("a", "c"), ("a", "d"), ("b", "c"), ("b", "d"), ("c", "d")]
+        + [("d", "e"), ("e", "f")]
+    )
+    order = [graph.names[node] for node in degree_order(graph)]
+
+    assert sorted(order) == graph.names
+    assert order[:2] == ["f", "e"]
+
+    position = {node: i for i, node in enumerate(degree_order(graph))}
+    for node in range(len(graph)):
+        later = [
+            adj for adj in graph.neighbours(node) if position[adj] > position[node]
+        ]
+        assert len(later) <= 3
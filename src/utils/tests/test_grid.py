@@ -0,0 +1,51 @@
+import pytest
+
+from utils.grid import Grid
+
+
+def test_from_lines_round_trip():
+    lines = ["#..", ".^#"]
+    grid = Grid.from_lines(lines)
+    assert (grid.width, grid.height) == (3, 2)
+    assert grid.to_lines() == lines
+
+
+def test_offsets_and_neighbours():
+    grid = Grid.from_lines(["ab", "cd"])
+    a = grid.offset((0, 0))
+    assert grid.position(a) == (0, 0)
+    assert grid.get(grid.position(a + grid.right)) == "b"
+    assert grid.get(grid.position(a + grid.down)) == "c"
+    assert not grid.is_inside(a + grid.up)
+    assert not grid.is_inside(a + grid.left)
+    assert sorted(grid.neighbours(a)) == [a + grid.right, a + grid.down]
+
+
+def test_find_and_count():
+    grid = Grid.from_lines(["#.#", ".^."])
+    assert grid.find("^") == grid.offset((1, 1))
+    assert grid.find("X") is None
+    assert grid.find_all("#") == [grid.offset((0, 0)), grid.offset((0, 2))]
+    assert grid.count(".") == 3
+
+
+def test_edge():
+    grid = Grid.from_lines(["abc", "def"])
+    assert [grid.position(o) for o in grid.edge(grid.up)] == [(0, 0), (0, 1), (0, 2)]
+    assert [grid.position(o) for o in grid.edge(grid.right)] == [(0, 2), (1, 2)]
+
+
+def test_copy_is_independent():
+    grid = Grid.from_lines(["..", ".."])
+    copy = grid.copy()
+    copy.set((0, 1), "#")
+    assert grid.get((0, 1)) == "."
+    assert copy != grid
+    assert copy.key() != grid.key()
+
+
+def test_from_lines_rejects_ragged_rows():
+    with pytest.raises(ValueError):
+        Grid.from_lines(["abc", "de"])
+    with pytest.raises(ValueError):
+        Grid.from_lines(["abc", "def\r"])
@@ -0,0 +1,75 @@
+from random import Random
+from typing import List, Set, Tuple
+
+import pytest
+
+from utils.intervals import IntervalMap, IntervalSet, contains, overlaps
+
+
+def values(intervals: IntervalSet) -> Set[int]:
+    return {x for start, end in intervals for x in range(start, end)}
+
+
+def random_set(rng: Random) -> IntervalSet:
+    res: List[Tuple[int, int]] = []
+    for _ in range(rng.randint(0, 6)):
+        start = rng.randint(-20, 20)
+        res.append((start, start + rng.randint(0, 8)))
+    return IntervalSet(res)
+
+
+def random_map(rng: Random) -> IntervalMap:
+    pieces = []
+    position = rng.randint(-30, -10)
+    for _ in range(rng.randint(0, 5)):
+        start = position + rng.randint(0, 5)
+        position = start + rng.randint(1, 8)
+        pieces.append(((start, position), rng.randint(-15, 15)))
+    return IntervalMap(pieces)
+
+
+def test_interval_helpers():
+    assert contains((2, 9), (3, 9))
+    assert not contains((2, 9), (1, 3))
+    assert overlaps((2, 5), (4, 9))
+    assert not overlaps((2, 5), (5, 9))
+
+
+def test_interval_set_normalizes():
+    intervals = IntervalSet([(5, 8), (1, 3), (2, 4), (4, 5), (10, 10)])
+
+    assert list(intervals) == [(1, 8)]
+    assert intervals.size() == 7
+    assert 7 in intervals and 8 not in intervals
+    assert intervals.covers((2, 8)) and not intervals.covers((0, 2))
+    assert list(IntervalSet([(1, 3), (5, 7)]).overlapping((2, 6))) == [(2, 3), (5, 6)]
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_interval_set_operations(seed):
+    rng = Random(seed)
+    a, b = random_set(rng), random_set(rng)
+
+    assert values(a | b) == values(a) | values(b)
+    assert values(a & b) == values(a) & values(b)
+    assert values(a - b) == values(a) - values(b)
+    assert values(a.shift(7)) == {x + 7 for x in values(a)}
+    for result in [a | b, a & b, a - b]:
+        assert result == IntervalSet(result.intervals)
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_interval_map(seed):
+    rng = Random(seed)
+    f, g, domain = random_map(rng), random_map(rng), random_set(rng)
+    composed = f.then(g)
+
+    for x in range(-60, 60):
+        assert composed(x) == g(f(x))
+    assert values(f.image(domain)) == {f(x) for x in values(domain)}
+
+
+def test_interval_map_rejects_overlaps():
+    with pytest.raises(ValueError):
+        IntervalMap([((0, 5), 1), ((4, 6), 2)])
+    assert IntervalMap([((0, 5), 1), ((5, 6), 1)]).pieces == [((0, 6), 1)]
@@ -0,0 +1,71 @@
+import pytest
+
+from utils.memoize import MEMOS, deep_sizeof, memo_stats, memoize, reset_memos
+
+
+@pytest.fixture
+def calls():
+    calls = []
+    yield calls
+    reset_memos()
+
+
+def test_memoize(calls):
+    @memoize()
+    def square(n: int, scale: int = 1) -> int:
+        calls.append(n)
+        return n * n * scale
+
+    assert [square(2), square(3), square(2), square(2, scale=2)] == [4, 9, 4, 8]
+    assert calls == [2, 3, 2]
+    assert square.__name__ == "square"
+
+    stats = square.stats()
+    assert (stats.hits, stats.misses, stats.entries, stats.bytes) == (1, 3, 3, None)
+    assert square in MEMOS and stats in memo_stats()
+
+    square.clear()
+    square(2)
+    assert calls == [2, 3, 2, 2]
+
+
+def test_max_entries(calls):
+    @memoize(max_entries=2)
+    def identity(n: int) -> int:
+        calls.append(n)
+        return n
+
+    for n in [1, 2, 1, 3, 1, 2]:
+        identity(n)
+
+    # 2 is the least recently used when 3 comes in
+    assert calls == [1, 2, 3, 2]
+    stats = identity.stats()
+    assert (stats.evictions, stats.entries) == (2, 2)
+
+
+def test_max_bytes(calls):
+    @memoize(max_bytes=10_000)
+    def zeros(n: int) -> list:
+        calls.append(n)
+        return [0] * n
+
+    zeros(100)
+    zeros(500)
+    assert zeros.stats().evictions == 0
+    zeros(1000)
+    assert zeros.stats().entries == 1
+    assert 8000 < zeros.stats().bytes <= 10_000
+
+    # a single entry over the bound is still kept
+    zeros(5000)
+    assert zeros.stats().entries == 1
+
+    reset_memos()
+    assert zeros.stats().bytes == 0 and zeros.stats().hits == 0
+
+
+def test_deep_sizeof():
+    shared = list(range(100))
+    assert deep_sizeof([shared, shared]) < deep_sizeof([shared, list(range(100))])
+    assert deep_sizeof({"a": [1, 2]}) > deep_sizeof({"a": []})
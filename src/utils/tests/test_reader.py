@@ -0,0 +1,38 @@
+import pytest
+
+from utils.reader import iter_blocks, iter_lines, mapped_bytes, read_lines, scan
+from utils.utils import split_list
+
+
+def test_iter_lines(tmp_path):
+    file_name = tmp_path / "input.txt"
+    file_name.write_text("a b \n\n c\n")
+
+    lines = iter_lines(str(file_name))
+    assert next(lines) == "a b"
+    assert list(lines) == ["", "c"]
+    assert read_lines(str(file_name)) == ["a b", "", "c"]
+
+
+@pytest.mark.parametrize("text", ["mul(2,3) do don't mul(10,1)", ""])
+def test_mapped_bytes(tmp_path, text):
+    file_name = tmp_path / "input.txt"
+    file_name.write_text(text)
+    regex = r"mul\(\d+,\d+\)|don't|do"
+
+    with mapped_bytes(str(file_name)) as data:
+        assert len(data) == len(text)
+        assert list(scan(regex, data)) == list(scan(regex, text))
+
+
+@pytest.mark.parametrize(
+    "lines, blocks",
+    [
+        (["a", "b", "", "c"], [["a", "b"], ["c"]]),
+        (["a", "", "", "b", ""], [["a"], [], ["b"], []]),
+        ([], [[]]),
+    ],
+)
+def test_iter_blocks(lines, blocks):
+    assert list(iter_blocks(iter(lines))) == blocks
+    assert split_list(lines, "") == blocks
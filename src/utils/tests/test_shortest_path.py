@@ -0,0 +1,66 @@
+from typing import Dict, List, Tuple
+
+import pytest
+
+from utils.shortest_path import find_shortest_paths
+
+GRAPH: Dict[str, List[Tuple[str, int]]] = {
+    "a": [("b", 1), ("c", 4)],
+    "b": [("c", 1), ("d", 5)],
+    "c": [("d", 1)],
+    "d": [("e", 3)],
+    "e": [],
+    "x": [("a", 1)],
+}
+
+
+def neighbours(state: str) -> List[Tuple[str, int]]:
+    return GRAPH[state]
+
+
+@pytest.mark.parametrize("max_weight", [None, 5])
+def test_find_shortest_paths(max_weight):
+    paths = find_shortest_paths([("a", 0)], neighbours, max_weight=max_weight)
+    assert paths.dist == {"a": 0, "b": 1, "c": 2, "d": 3, "e": 6}
+    assert paths.path("e") == ["a", "b", "c", "d", "e"]
+    assert paths.target is None
+
+
+@pytest.mark.parametrize("max_weight", [None, 5])
+def test_stops_at_target(max_weight):
+    paths = find_shortest_paths(
+        [("a", 0)], neighbours, is_target=lambda s: s == "d", max_weight=max_weight
+    )
+    assert paths.cost == 3
+    assert "e" not in paths.dist
+
+
+def test_heuristic():
+    remaining = {"a": 6, "b": 5, "c": 4, "d": 3, "e": 0}
+    paths = find_shortest_paths(
+        [("a", 0)],
+        neighbours,
+        is_target=lambda s: s == "e",
+        heuristic=remaining.get,
+    )
+    assert paths.cost == 6
+
+
+def test_unreachable_target():
+    paths = find_shortest_paths([("e", 0)], neighbours, is_target=lambda s: s == "a")
+    assert paths.cost is None
+
+
+@pytest.mark.parametrize("max_weight", [None, 2])
+def test_all_parents(max_weight):
+    graph = {"s": [("l", 1), ("r", 1)], "l": [("t", 1)], "r": [("t", 1)], "t": []}
+    paths = find_shortest_paths(
+        [("s", 0)], graph.__getitem__, max_weight=max_weight, all_parents=True
+    )
+    assert sorted(paths.parents["t"]) == ["l", "r"]
+    assert paths.states_on_paths(["t"]) == {"s", "l", "r", "t"}
+
+
+def test_buckets_reject_heuristic():
+    with pytest.raises(ValueError):
+        find_shortest_paths([("a", 0)], neighbours, heuristic=lambda s: 0, max_weight=5)
@@ -0,0 +1,21 @@
+from utils.tracing import Counter
+
+
+def test_counter_reports_every_n(capsys):
+    counter = Counter("checks", every=2, total=5)
+    for _ in range(5):
+        counter()
+
+    lines = capsys.readouterr().err.splitlines()
+    assert [line.split(" (")[0] for line in lines] == [
+        "checks: 2/5",
+        "checks: 4/5",
+        "checks: 5/5",
+    ]
+
+
+def test_counter_reset():
+    counter = Counter("checks", every=10)
+    counter(3)
+    counter.reset(total=7)
+    assert (counter.count, counter.total) == (0, 7)
@@ -0,0 +1,56 @@
+import os
+import sys
+import time
+from typing import Optional
+
+# AOC_TRACE=counters prints sampled counters to stderr, AOC_TRACE=progress draws
+# progress bars for counters with a known total. Hot loops guard their calls with
+# `if TRACE:`, so a disabled tracer costs a single global lookup.
+TRACE_MODE = os.environ.get("AOC_TRACE", "")
+TRACE = TRACE_MODE not in ("", "0")
+PROGRESS = TRACE_MODE == "progress"
+
+PROGRESS_BAR_WIDTH = 30
+
+
+def trace(message: str) -> None:
+    print(message, file=sys.stderr)
+
+
+class Counter:
+    def __init__(self, name: str, every: int = 1000, total: Optional[int] = None):
+        self.name = name
+        self.every = every
+        self.reset(total)
+
+    def reset(self, total: Optional[int] = None) -> None:
+        self.count = 0
+        self.total = total
+        self.start = time.perf_counter()
+        self.next_report = self.report_step()
+
+    def __call__(self, n: int = 1) -> None:
+        self.count += n
+        if self.count >= self.next_report or self.count == self.total:
+            self.report()
+            self.next_report = self.count + self.report_step()
+
+    def report_step(self) -> int:
+        if PROGRESS and self.total:
+            return max(1, self.total // PROGRESS_BAR_WIDTH)
+        return self.every
+
+    def report(self) -> None:
+        seconds = time.perf_counter() - self.start
+        if PROGRESS and self.total:
+            done = min(self.count, self.total)
+            filled = PROGRESS_BAR_WIDTH * done // self.total
+            bar = "#" * filled + "." * (PROGRESS_BAR_WIDTH - filled)
+            end = "\n" if done == self.total else ""
+            sys.stderr.write(
+                f"\r{self.name} [{bar}] {done}/{self.total} ({seconds:.1f}s){end}"
+            )
+            sys.stderr.flush()
+        else:
+            total = f"/{self.total}" if self.total else ""
+            trace(f"{self.name}: {self.count}{total} ({seconds:.1f}s)")
@@ -1,5 +1,7 @@
 from typing import Callable, List, TypeVar
 
+from utils.reader import iter_blocks
+
 T = TypeVar("T")
 
 
@@ -32,13 +34,8 @@ def deep_copy_matrix(matrix: List[List[T]]) -> List[List[T]]:
 
 
 def split_list(list: List[T], separator: T) -> List[List[T]]:
-    sep_idxs: List[int] = (
-        [-1] + [idx for idx, s in enumerate(list) if s == separator] + [len(list)]
-    )
-    res: List[List[T]] = []
-    for i in range(len(sep_idxs) - 1):
-        res.append(list[sep_idxs[i] + 1 : sep_idxs[i + 1]])
-    return res
+    # the argument shadows `list`
+    return [*iter_blocks(list, separator)]
 
 
 def bin_search(a: List[T], verify_func: Callable[[T], bool]) -> T:
@@ -52,6 +49,7 @@ def bin_search(a: List[T], verify_func: Callable[[T], bool]) -> T:
             lo = mid + 1
     return a[lo]
 
+
 # similar to bisect_left from bisect module
 def bisect_left_lambda(a: List[T], lo=0, hi=None, verifier=None) -> int:
     if lo < 0: